@@ -0,0 +1,403 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" A search benchmark over a synthetic campus.
+
+    generate_catalog() fills the database with a catalog of spots laid
+    out around a campus, with hours, extended info following the UW
+    spot form's validated values, image metadata and items.
+    run_scenarios() then runs a fixed mix of searches through the test
+    client and reports the latency percentiles and query counts of each.
+
+    Both are run by the benchmark_search management command, which
+    builds the catalog in a throwaway test database.
+"""
+
+from datetime import time as clock
+from decimal import Decimal
+import hashlib
+from math import ceil
+import random
+import time
+
+from django.db import connection
+from django.db.models import Max
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext
+import simplejson as json
+
+from spotseeker_server import catalog
+from spotseeker_server.models import (
+    Item,
+    ItemExtendedInfo,
+    Spot,
+    SpotAvailableHours,
+    SpotExtendedInfo,
+    SpotImage,
+    SpotType,
+)
+from spotseeker_server.org_forms.uw_spot import validated_ei
+
+CENTER_LATITUDE = 47.655
+CENTER_LONGITUDE = -122.308
+
+SPOT_TYPES = [
+    "study_room",
+    "study_area",
+    "computer_lab",
+    "cafe",
+    "outdoor",
+    "lounge",
+    "classroom",
+    "conference_classroom",
+    "alcove",
+    "production_studio",
+]
+
+ITEM_CATEGORIES = {
+    "Laptop Computer": ["Mac Laptop", "PC Laptop", "Chromebook"],
+    "Camera": ["DSLR", "Video Camera", "Point and Shoot"],
+    "Audio": ["Microphone", "Headphones", "Recorder"],
+    "Accessories": ["Tripod", "Charger", "Adapter"],
+}
+
+# The searches to time, as (name, parameters) pairs
+SCENARIOS = [
+    (
+        "geo_open_now",
+        {
+            "center_latitude": CENTER_LATITUDE,
+            "center_longitude": CENTER_LONGITUDE,
+            "distance": 500,
+            "open_now": 1,
+        },
+    ),
+    (
+        "open_until_across_days",
+        {
+            "center_latitude": CENTER_LATITUDE,
+            "center_longitude": CENTER_LONGITUDE,
+            "distance": 2000,
+            "open_at": "Friday,20:00",
+            "open_until": "Monday,08:00",
+        },
+    ),
+    (
+        "fuzzy_hours",
+        {
+            "center_latitude": CENTER_LATITUDE,
+            "center_longitude": CENTER_LONGITUDE,
+            "distance": 2000,
+            "fuzzy_hours_start": "Tuesday,10:00",
+            "fuzzy_hours_end": "Tuesday,14:00",
+        },
+    ),
+    (
+        "extended_info_or_group",
+        {
+            "center_latitude": CENTER_LATITUDE,
+            "center_longitude": CENTER_LONGITUDE,
+            "distance": 1000,
+            "extended_info:or_group": ["has_whiteboards", "has_outlets"],
+            "extended_info:noise_level": "quiet",
+            "type": ["study_room", "study_area"],
+        },
+    ),
+    (
+        "item_category",
+        {
+            "extended_info:app_type": "tech",
+            "item:category": "Laptop Computer",
+            "limit": 0,
+        },
+    ),
+    (
+        "type_wide_radius",
+        {
+            "center_latitude": CENTER_LATITUDE,
+            "center_longitude": CENTER_LONGITUDE,
+            "distance": 5000,
+            "type": "study_room",
+        },
+    ),
+    (
+        "expand_radius_nearest",
+        {
+            "center_latitude": CENTER_LATITUDE + 0.03,
+            "center_longitude": CENTER_LONGITUDE,
+            "distance": 100,
+            "expand_radius": 1,
+            "type": "study_room",
+        },
+    ),
+    (
+        "campus_unbounded",
+        {"extended_info:campus": "seattle", "limit": 0},
+    ),
+    (
+        "type_building_items",
+        {
+            "center_latitude": CENTER_LATITUDE,
+            "center_longitude": CENTER_LONGITUDE,
+            "distance": 2000,
+            "type": ["study_room", "study_area", "computer_lab", "cafe"],
+            "building_name": [
+                "Building %s (B%03d)" % (i, i) for i in range(50)
+            ],
+            "item:category": ["Laptop Computer", "Camera"],
+            "item:subcategory": ["DSLR", "Mac Laptop"],
+            "item:extended_info:i_checkout_period": ["1", "3"],
+            "extended_info:app_type": "tech",
+            "limit": 0,
+        },
+    ),
+]
+
+
+def _etag(rng):
+    return hashlib.sha1(str(rng.random()).encode("utf-8")).hexdigest()
+
+
+def _hours(rng):
+    """Returns a list of (day, start, end) windows for one spot."""
+    kind = rng.random()
+    hours = []
+    for day, name in SpotAvailableHours.DAY_CHOICES:
+        weekend = day in ("sa", "su")
+        if kind < 0.1:
+            # Open around the clock
+            hours.append((day, clock(0, 0), clock(23, 59)))
+        elif kind < 0.25:
+            # Open late; the night carries on into the next day
+            hours.append((day, clock(0, 0), clock(2, 0)))
+            hours.append((day, clock(7, 0), clock(23, 59)))
+        elif weekend and kind < 0.6:
+            continue
+        else:
+            start = rng.choice([7, 8, 9, 10])
+            end = rng.choice([17, 18, 20, 22])
+            if weekend:
+                start, end = start + 2, end - 2
+            if kind > 0.9:
+                # Closed over lunch
+                hours.append((day, clock(start, 0), clock(12, 0)))
+                hours.append((day, clock(13, 0), clock(end, 0)))
+            else:
+                hours.append((day, clock(start, 0), clock(end, 30)))
+    return hours
+
+
+def _extended_info(rng, spot_id):
+    """Returns a dict of the extended info for one spot."""
+    info = {"campus": rng.choice(validated_ei["campus"])}
+    app_type = rng.random()
+    if app_type < 0.1:
+        info["app_type"] = "food"
+    elif app_type < 0.15:
+        info["app_type"] = "tech"
+        info["has_cte_techloan"] = "true"
+        info["cte_techloan_id"] = str(spot_id)
+
+    for key, values in validated_ei.items():
+        if key in info or key in ("app_type", "campus"):
+            continue
+        if isinstance(values, list):
+            if values == ["true"]:
+                if rng.random() < 0.3:
+                    info[key] = "true"
+            elif rng.random() < 0.5:
+                info[key] = rng.choice(values)
+        elif values == "int" and rng.random() < 0.2:
+            info[key] = str(rng.randint(0, 200))
+
+    info["location_description"] = "Floor %s, near the %s entrance" % (
+        rng.randint(1, 6),
+        rng.choice(["north", "south", "east", "west"]),
+    )
+    return info
+
+
+def generate_catalog(count, seed=0, buildings=200):
+    """
+    Adds count spots to the database, spread over the given number of
+    buildings around the campus center, and returns the time it took in
+    seconds. The same seed always produces the same catalog.
+    """
+    started = time.perf_counter()
+    rng = random.Random(seed)
+
+    spot_types = [
+        SpotType.objects.get_or_create(name=name)[0] for name in SPOT_TYPES
+    ]
+    sites = [
+        (
+            "Building %s (B%03d)" % (i, i),
+            CENTER_LATITUDE + rng.uniform(-0.015, 0.015),
+            CENTER_LONGITUDE + rng.uniform(-0.02, 0.02),
+        )
+        for i in range(buildings)
+    ]
+
+    # Ids are assigned up front, since bulk_create doesn't return them
+    # on every database
+    first_id = (Spot.objects.aggregate(Max("pk"))["pk__max"] or 0) + 1
+    first_item_id = (Item.objects.aggregate(Max("pk"))["pk__max"] or 0) + 1
+
+    spots = []
+    types = []
+    hours = []
+    infos = []
+    images = []
+    items = []
+    item_infos = []
+    for number in range(count):
+        spot_id = first_id + number
+        building, latitude, longitude = rng.choice(sites)
+        spots.append(
+            Spot(
+                id=spot_id,
+                name="Space %s" % spot_id,
+                building_name=building,
+                floor=str(rng.randint(1, 6)),
+                room_number=str(rng.randint(100, 699)),
+                capacity=rng.choice([None, 2, 4, 8, 20, 50, 200]),
+                latitude=Decimal("%.8f" % (latitude + rng.gauss(0, 0.0003))),
+                longitude=Decimal(
+                    "%.8f" % (longitude + rng.gauss(0, 0.0003))
+                ),
+                etag=_etag(rng),
+            )
+        )
+
+        for spot_type in rng.sample(spot_types, rng.randint(1, 2)):
+            types.append(
+                Spot.spottypes.through(spot_id=spot_id, spottype=spot_type)
+            )
+
+        for day, start, end in _hours(rng):
+            hours.append(
+                SpotAvailableHours(
+                    spot_id=spot_id, day=day, start_time=start, end_time=end
+                )
+            )
+
+        info = _extended_info(rng, spot_id)
+        for key, value in info.items():
+            infos.append(
+                SpotExtendedInfo(spot_id=spot_id, key=key, value=value)
+            )
+
+        for display_index in range(rng.choice([0, 1, 1, 2, 3])):
+            images.append(
+                SpotImage(
+                    spot_id=spot_id,
+                    image="space_images/benchmark.jpg",
+                    display_index=display_index,
+                    content_type="image/jpeg",
+                    width=1024,
+                    height=768,
+                    etag=_etag(rng),
+                    upload_user="benchmark",
+                    upload_application="benchmark",
+                )
+            )
+
+        if info.get("app_type") == "tech":
+            for i in range(rng.randint(1, 5)):
+                item_id = first_item_id + len(items)
+                category = rng.choice(sorted(ITEM_CATEGORIES))
+                items.append(
+                    Item(
+                        id=item_id,
+                        name="Item %s" % item_id,
+                        spot_id=spot_id,
+                        item_category=category,
+                        item_subcategory=rng.choice(
+                            ITEM_CATEGORIES[category]
+                        ),
+                    )
+                )
+                item_infos.append(
+                    ItemExtendedInfo(
+                        item_id=item_id,
+                        key="i_checkout_period",
+                        value=str(rng.choice([1, 3, 7])),
+                    )
+                )
+
+    # bulk_create skips the models' save(), which would otherwise merge
+    # hours and re-save the spot for every row.
+    for model, rows in (
+        (Spot, spots),
+        (Spot.spottypes.through, types),
+        (SpotAvailableHours, hours),
+        (SpotExtendedInfo, infos),
+        (SpotImage, images),
+        (Item, items),
+        (ItemExtendedInfo, item_infos),
+    ):
+        model.objects.bulk_create(rows, batch_size=500)
+
+    # Nothing was saved through the ORM signals
+    catalog.bump_generation()
+    return time.perf_counter() - started
+
+
+def _percentile(values, percent):
+    """The nearest-rank percentile of a sorted list."""
+    rank = max(int(ceil(percent / 100.0 * len(values))), 1)
+    return values[rank - 1]
+
+
+def _content(response):
+    if response.streaming:
+        return b"".join(response.streaming_content)
+    return response.content
+
+
+def run_scenarios(repeat=20, scenarios=SCENARIOS):
+    """
+    Runs each scenario's search repeat times, after one warm up run, and
+    returns a dict of scenario name to its results: the parameters, the
+    status and number of spots of the last run, and the latency
+    percentiles (in milliseconds), median query count and median time
+    spent in SQL of the timed runs.
+    """
+    client = Client()
+    report = {}
+    for name, params in scenarios:
+        client.get("/api/v1/spot", params)
+
+        latencies = []
+        query_counts = []
+        query_times = []
+        for i in range(repeat):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = client.get("/api/v1/spot", params)
+                content = _content(response)
+                latencies.append((time.perf_counter() - started) * 1000)
+            query_counts.append(len(queries))
+            query_times.append(
+                sum(float(query["time"]) for query in queries) * 1000
+            )
+
+        results = None
+        if response.status_code == 200:
+            results = len(json.loads(content))
+
+        latencies.sort()
+        query_counts.sort()
+        query_times.sort()
+        report[name] = {
+            "params": params,
+            "status": response.status_code,
+            "results": results,
+            "p50_ms": round(_percentile(latencies, 50), 3),
+            "p95_ms": round(_percentile(latencies, 95), 3),
+            "p99_ms": round(_percentile(latencies, 99), 3),
+            "mean_ms": round(sum(latencies) / len(latencies), 3),
+            "queries": _percentile(query_counts, 50),
+            "sql_p50_ms": round(_percentile(query_times, 50), 3),
+        }
+    return report
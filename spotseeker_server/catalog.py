@@ -0,0 +1,117 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" The catalog generation.
+
+    A counter kept in the shared cache that moves on whenever a spot,
+    or anything attached to a spot, is saved or deleted. Anything
+    derived from the catalog as a whole (cached search results, the
+    per-worker indexes) records the generation it was built from, and
+    is thrown away once the generation changes.
+
+    A write inside a transaction moves the generation on twice: at once,
+    and again when the transaction commits. Another worker can search
+    the old rows until then, and whatever it derives from them is kept
+    under the first generation, which the second leaves behind.
+
+    The cache may be a DummyCache, in which case generation() is None;
+    local_generation() still tracks the writes made by this process.
+"""
+
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+GENERATION_KEY = "spotseeker:catalog:generation"
+
+# Models whose rows are part of a spot as far as searching goes
+CATALOG_MODELS = (
+    "spotseeker_server.Spot",
+    "spotseeker_server.SpotAvailableHours",
+    "spotseeker_server.SpotExtendedInfo",
+    "spotseeker_server.Item",
+    "spotseeker_server.ItemExtendedInfo",
+)
+
+_local_generation = 0
+_local_lock = threading.Lock()
+
+# Whether this thread has written to the catalog since it last committed
+_uncommitted = threading.local()
+
+
+def local_generation():
+    """Returns a counter of the catalog writes made by this process."""
+    return _local_generation
+
+
+def generation():
+    """Returns the shared catalog generation, or None without a cache."""
+    value = cache.get(GENERATION_KEY)
+    if value is None:
+        # Start from the clock rather than 1, so that a counter that
+        # was evicted never comes back with a value already used.
+        cache.add(GENERATION_KEY, int(time.time() * 1000), None)
+        value = cache.get(GENERATION_KEY)
+    return value
+
+
+def bump_generation(using=None):
+    """
+    Record that the catalog changed, now and, inside a transaction on
+    the database using, again once it commits.
+    """
+    _bump()
+    if transaction.get_connection(using).in_atomic_block:
+        _uncommitted.writes = True
+        transaction.on_commit(_committed, using)
+
+
+def _bump():
+    global _local_generation
+    with _local_lock:
+        _local_generation += 1
+
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        # Not in the cache; starting a new one moves it on just as well
+        generation()
+
+
+def _committed():
+    # Every write in the transaction registered this; bump once
+    if getattr(_uncommitted, "writes", False):
+        _uncommitted.writes = False
+        _bump()
+
+
+def _catalog_changed(sender, using=None, **kwargs):
+    bump_generation(using)
+
+
+def _spottypes_changed(sender, using=None, **kwargs):
+    if kwargs["action"].startswith("post_"):
+        bump_generation(using)
+
+
+for model in CATALOG_MODELS:
+    post_save.connect(
+        _catalog_changed,
+        sender=model,
+        dispatch_uid="spotseeker_server.catalog.saved.%s" % model,
+    )
+    post_delete.connect(
+        _catalog_changed,
+        sender=model,
+        dispatch_uid="spotseeker_server.catalog.deleted.%s" % model,
+    )
+
+m2m_changed.connect(
+    _spottypes_changed,
+    sender="spotseeker_server.Spot_spottypes",
+    dispatch_uid="spotseeker_server.catalog.spottypes",
+)
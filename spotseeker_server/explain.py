@@ -0,0 +1,84 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" Profiling for a single search, as returned by ?_explain=1.
+
+    The search marks the end of each of its stages with lap(), and the
+    time and SQL since the previous lap are recorded under that stage's
+    name. Code that takes an explain argument uses NO_EXPLAIN when not
+    explaining, whose lap() does nothing.
+"""
+
+import time
+
+from django.db import connection
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 3)
+
+
+class Explain(object):
+    """
+    Records the stages of a search. Use it as a context manager around
+    the search; SQL is only captured inside the with block.
+
+    Instance Variables:
+        stages: a list of dicts, one per lap, with the stage's name,
+            time, query_count, query_time and queries (the SQL text).
+    """
+
+    def __init__(self):
+        self.stages = []
+
+    def __enter__(self):
+        # The same as DEBUG = True, for this connection only
+        self._force_debug_cursor = connection.force_debug_cursor
+        connection.force_debug_cursor = True
+        connection.ensure_connection()
+        self._lap_query = len(connection.queries_log)
+        self._started = time.perf_counter()
+        self._lap_started = self._started
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        connection.force_debug_cursor = self._force_debug_cursor
+
+    def lap(self, name):
+        """Record everything since the last lap as the stage name."""
+        now = time.perf_counter()
+        queries = connection.queries[self._lap_query:]
+        self.stages.append(
+            {
+                "name": name,
+                "time": _ms(now - self._lap_started),
+                "query_count": len(queries),
+                "query_time": _ms(
+                    sum(float(query["time"]) for query in queries)
+                ),
+                "queries": [query["sql"] for query in queries],
+            }
+        )
+        self._lap_started = now
+        self._lap_query += len(queries)
+
+    def summary(self):
+        """The totals and the stages, ready to be sent as JSON."""
+        return {
+            "time": _ms(time.perf_counter() - self._started),
+            "query_count": sum(stage["query_count"] for stage in self.stages),
+            "query_time": round(
+                sum(stage["query_time"] for stage in self.stages), 3
+            ),
+            "stages": self.stages,
+        }
+
+
+class NoExplain(object):
+    """Stands in for an Explain when a search isn't being explained."""
+
+    def lap(self, name):
+        pass
+
+
+NO_EXPLAIN = NoExplain()
@@ -0,0 +1,108 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" Per-worker, in-memory indexes over the spot catalog.
+
+    Each index is built lazily from the database the first time it is
+    used, and is rebuilt whenever the catalog version changes. The
+    version combines the catalog generations (see catalog.py) with a
+    cheap signature of the Spot table, so that writes are picked up
+    even when there is no shared cache. With one, the generation moves
+    on with every write made through the models, and the table is only
+    checked every SPOTSEEKER_CATALOG_CHECK_INTERVAL seconds, for any
+    made around them. The workers on a node can share the indexes they
+    build through snapshot files (see snapshot.py).
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.db.models import Count, Max
+
+from spotseeker_server import catalog
+from spotseeker_server.index import snapshot
+from spotseeker_server.models import Spot
+
+
+# When the Spot table was last checked, and its signature then
+_checked = (None, None)
+
+
+def catalog_version():
+    """
+    Returns a value that changes whenever the spot catalog changes,
+    either in this process or in the database.
+    """
+    global _checked
+    shared = catalog.generation()
+    checked_at, signature = _checked
+    now = time.time()
+    interval = getattr(settings, "SPOTSEEKER_CATALOG_CHECK_INTERVAL", 60)
+    if shared is None or checked_at is None or now - checked_at >= interval:
+        aggregate = Spot.objects.aggregate(
+            count=Count("pk"), modified=Max("last_modified")
+        )
+        signature = (aggregate["count"], aggregate["modified"])
+        _checked = (now, signature)
+    return (catalog.local_generation(), shared) + signature
+
+
+class CatalogVersion(object):
+    """
+    The catalog_version() for one search: looked up the first time one
+    of the indexes the search uses needs it, and shared by the rest, so
+    a search checks the version once however many indexes it uses.
+    """
+
+    def __init__(self):
+        self._version = None
+
+    def __call__(self):
+        if self._version is None:
+            self._version = catalog_version()
+        return self._version
+
+
+class CatalogIndex(object):
+    """
+    Base class for an in-memory index over the spot catalog. Subclasses
+    implement build(), which loads whatever they need from the
+    database and returns it; the result is swapped in as self.data in
+    one assignment so readers never see a half-built index.
+
+    Instance Variables:
+        data: whatever build() last returned, or None before the
+            first build.
+    """
+
+    def __init__(self):
+        self.data = None
+        self._version = None
+        self._lock = threading.Lock()
+
+    def build(self):
+        """Load the index from the database and return it."""
+        raise NotImplementedError()
+
+    def current(self, version=None):
+        """
+        Make sure the index reflects the catalog, rebuilding it if
+        needed, and return self. Pass a version from catalog_version()
+        to share one version check between several indexes.
+        """
+        if version is None:
+            version = catalog_version()
+
+        if self.data is None or self._version != version:
+            with self._lock:
+                if self.data is None or self._version != version:
+                    self.data = snapshot.load_or_build(self, version)
+                    self._version = version
+        return self
+
+    def invalidate(self):
+        """Drop the index so the next use rebuilds it."""
+        with self._lock:
+            self.data = None
+            self._version = None
@@ -0,0 +1,192 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" An inverted index of the spots' extended info.
+
+    Every (key, value) pair maps to the SpotSet of the spots that have
+    it (see spot_set.py). The extended info filters in the search, and
+    in the org filters, are expressed as an ExtendedInfoQuery, and
+    ExtendedInfoIndex answers it with set intersections, unions and
+    differences instead of one join on spotextendedinfo per filter.
+
+    A spot has at most one value for each key, so "has key k set to v"
+    is always about a single extended info row.
+
+    Keys and values are matched ignoring case, as the database's
+    collation matches them in the ORM filters the index replaces.
+"""
+
+from collections import namedtuple
+
+from spotseeker_server.index import CatalogIndex
+from spotseeker_server.index.spot_set import SpotSet
+from spotseeker_server.models import Spot, SpotExtendedInfo
+
+
+class ValueRange(namedtuple("ValueRange", ["minimum", "maximum"])):
+    """
+    The numeric values from minimum to maximum, ends included, either of
+    which can be None. Values that aren't numbers are never in range.
+    """
+
+    def __contains__(self, value):
+        try:
+            value = float(value)
+        except ValueError:
+            return False
+        if self.minimum is not None and value < self.minimum:
+            return False
+        return self.maximum is None or value <= self.maximum
+
+
+class ExtendedInfoQuery(object):
+    """
+    The extended info conditions of one search. Each method adds a
+    condition, and a spot has to meet all of them.
+
+    Each condition is a (alternatives, negated) tuple. An alternative is
+    a (key, values) tuple, met by a spot with the key set to one of the
+    values, or to anything if values is None. values can also be a
+    ValueRange. Keys and values are kept lowercased. A condition is met
+    when any of its alternatives is, or when none are if negated.
+
+    A condition that's already there isn't added again, so the same
+    condition coming from several places is only checked once.
+    """
+
+    def __init__(self):
+        self.conditions = []
+
+    def __bool__(self):
+        return bool(self.conditions)
+
+    def _add(self, alternatives, negated):
+        alternatives = [
+            (key.lower(), _frozen(values)) for key, values in alternatives
+        ]
+        condition = (alternatives, negated)
+        if condition not in self.conditions:
+            self.conditions.append(condition)
+
+    def has(self, key, values):
+        """The spot has key set to one of values."""
+        self._add([(key, values)], False)
+
+    def has_any(self, pairs):
+        """The spot has at least one of the (key, value) pairs."""
+        self._add([(key, [value]) for key, value in pairs], False)
+
+    def between(self, key, minimum=None, maximum=None):
+        """The spot has key set to a number from minimum to maximum."""
+        self._add([(key, ValueRange(minimum, maximum))], False)
+
+    def lacks(self, key, values=None):
+        """
+        The spot doesn't have key set to one of values, or doesn't have
+        key at all if values is None.
+        """
+        self._add([(key, values)], True)
+
+
+def _frozen(values):
+    """
+    values as a frozenset of lowercased strings, so conditions can be
+    compared.
+    """
+    if values is None or isinstance(values, ValueRange):
+        return values
+    return frozenset(str(value).lower() for value in values)
+
+
+class ExtendedInfoIndex(CatalogIndex):
+    """
+    data is an (everything, postings, folded) tuple: everything is the
+    SpotSet of every spot, postings maps each key to a dict of value to
+    the SpotSet of the spots with that value, and folded maps each
+    lowercased key to a dict of lowercased value to the (key, value)
+    pairs of postings that lowercase to them.
+    """
+
+    def build(self):
+        everything = SpotSet.of(Spot.objects.values_list("pk", flat=True))
+
+        spot_ids = {}
+        rows = SpotExtendedInfo.objects.values_list("spot_id", "key", "value")
+        for spot_id, key, value in rows:
+            spot_ids.setdefault(key, {}).setdefault(value, []).append(spot_id)
+
+        postings = {}
+        folded = {}
+        for key, values in spot_ids.items():
+            postings[key] = {
+                value: SpotSet.of(ids) for value, ids in values.items()
+            }
+            folded_values = folded.setdefault(key.lower(), {})
+            for value in values:
+                pairs = folded_values.setdefault(value.lower(), [])
+                pairs.append((key, value))
+        return everything, postings, folded
+
+    def _having(self, key, values):
+        """Returns the SpotSet of spots with key set to one of values."""
+        postings = self.data[1]
+        folded = self.data[2].get(key, {})
+        if values is None:
+            wanted = folded.values()
+        elif isinstance(values, ValueRange):
+            wanted = [
+                pairs for value, pairs in folded.items() if value in values
+            ]
+        else:
+            wanted = [folded[value] for value in values if value in folded]
+
+        return SpotSet.union(
+            postings[pair[0]][pair[1]] for pairs in wanted for pair in pairs
+        )
+
+    def matching_spots(self, info_query):
+        """Returns the SpotSet of spots that meet every condition."""
+        found = self.data[0]
+        for alternatives, negated in info_query.conditions:
+            having = SpotSet.union(
+                self._having(key, values) for key, values in alternatives
+            )
+            if negated:
+                found -= having
+            else:
+                found &= having
+        return found
+
+    def matching(self, info_query):
+        """Returns the ids of the spots that meet every condition."""
+        return self.matching_spots(info_query).ids()
+
+    def filter(self, query, info_query):
+        """
+        Narrows a Spot queryset to the spots that meet every condition.
+        The database is given whichever of the matching or the other
+        spots is the shorter list of ids.
+        """
+        found = self.matching_spots(info_query)
+        others = self.data[0] - found
+        if len(found) <= len(others):
+            return query.filter(pk__in=found.ids())
+        return query.exclude(pk__in=others.ids())
+
+    def counts(self, spot_ids, keys):
+        """
+        Returns, for each of keys, a dict of value to the number of
+        spot_ids with that value. Values no spot has are left out.
+        """
+        spots = SpotSet.of(spot_ids)
+        counts = {}
+        for key in keys:
+            counts[key] = {}
+            for value, posting in self.data[1].get(key, {}).items():
+                count = len(posting & spots)
+                if count:
+                    counts[key][value] = count
+        return counts
+
+
+extended_info_index = ExtendedInfoIndex()
@@ -0,0 +1,257 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" A grid index over spot locations, used by the distance search.
+
+    Spots are bucketed into cells of CELL_SIZE degrees of latitude and
+    longitude. A bounding box lookup only visits the cells that overlap
+    the box, so a search near campus never looks at spots elsewhere.
+
+    A nearest-k search starts from the cells around the center and adds
+    rings of cells until it has found k matching spots closer than
+    anything outside the rings could be.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+import heapq
+from math import asin, cos, floor, radians, sin
+
+from pyproj import Geod
+
+from spotseeker_server.index import CatalogIndex
+from spotseeker_server.models import Spot
+
+# Roughly 550m north-south; a typical campus search covers a few cells.
+CELL_SIZE = 0.005
+
+geod = Geod(ellps="clrk66")
+
+# The least radius of curvature of the ellipsoid; a distance on a sphere
+# this size never overstates the distance on the ellipsoid.
+MIN_RADIUS = 6335000.0
+
+
+def _cell(value):
+    return int(floor(value / CELL_SIZE))
+
+
+class SpatialIndex(CatalogIndex):
+    """
+    Maps every spot that has a latitude and longitude to its grid cell.
+
+    data is an (ids, latitudes, longitudes, positions, cells) tuple. The
+    located spots' ids are in the array ids, in order, and their
+    locations at the same positions in the float arrays latitudes and
+    longitudes. The positions of the spots in each cell are together in
+    the array positions, and cells maps a (row, column) cell to the
+    (start, end) of its slice of positions.
+    """
+
+    def build(self):
+        ids = array("i")
+        latitudes = array("d")
+        longitudes = array("d")
+        members = defaultdict(list)
+
+        located = Spot.objects.filter(
+            latitude__isnull=False, longitude__isnull=False
+        ).order_by("pk").values_list("pk", "latitude", "longitude")
+        for pk, latitude, longitude in located:
+            latitude = float(latitude)
+            longitude = float(longitude)
+            members[(_cell(latitude), _cell(longitude))].append(len(ids))
+            ids.append(pk)
+            latitudes.append(latitude)
+            longitudes.append(longitude)
+
+        positions = array("i")
+        cells = {}
+        for cell, cell_positions in members.items():
+            start = len(positions)
+            positions.extend(cell_positions)
+            cells[cell] = (start, len(positions))
+
+        return ids, latitudes, longitudes, positions, cells
+
+    def _positions(self, spans):
+        """The positions of the spots in the cells with the spans."""
+        positions = self.data[3]
+        return [
+            position
+            for start, end in spans
+            for position in positions[start:end]
+        ]
+
+    def within_box(self, bottom, top, left, right):
+        """
+        Returns the ids of spots inside the box, edges included. As with
+        the database filter this replaces, a box that crosses the
+        antimeridian (left > right) matches nothing.
+        """
+        ids, latitudes, longitudes, positions, cells = self.data
+        rows = range(_cell(bottom), _cell(top) + 1)
+        columns = range(_cell(left), _cell(right) + 1)
+
+        if len(rows) * len(columns) > len(cells):
+            # The box covers more cells than are occupied; walking the
+            # occupied cells is cheaper.
+            spans = [
+                span
+                for (row, column), span in cells.items()
+                if row in rows and column in columns
+            ]
+        else:
+            spans = [
+                cells[(row, column)]
+                for row in rows
+                for column in columns
+                if (row, column) in cells
+            ]
+
+        found = []
+        for position in self._positions(spans):
+            latitude = latitudes[position]
+            longitude = longitudes[position]
+            if bottom <= latitude <= top and left <= longitude <= right:
+                found.append(ids[position])
+        return found
+
+    def _distances(self, longitude, latitude, positions):
+        """
+        The distances in meters from the point to the spots at
+        positions, computed in one call to pyproj.
+        """
+        if not positions:
+            return []
+        latitudes, longitudes = self.data[1:3]
+        count = len(positions)
+        az12, az21, dists = geod.inv(
+            [longitudes[position] for position in positions],
+            [latitudes[position] for position in positions],
+            [float(longitude)] * count,
+            [float(latitude)] * count,
+        )
+        return dists
+
+    def distances(self, longitude, latitude, spot_ids):
+        """
+        Returns a dict of spot id to the distance in meters from the
+        given point. All of the distances are computed in one call to
+        pyproj; spots without a location are left out.
+        """
+        ids = self.data[0]
+        located = []
+        positions = []
+        for pk in spot_ids:
+            position = bisect_left(ids, pk)
+            if position < len(ids) and ids[position] == pk:
+                located.append(pk)
+                positions.append(position)
+        return dict(
+            zip(located, self._distances(longitude, latitude, positions))
+        )
+
+    def nearest(self, longitude, latitude, spot_ids, count):
+        """
+        Returns up to count of spot_ids, closest to the point first.
+        Spots without a location sort after every located spot.
+        """
+        dists = self.distances(longitude, latitude, spot_ids)
+        # A heap only keeps count entries around instead of sorting
+        # every candidate.
+        closest = heapq.nsmallest(count, dists, key=dists.get)
+        if len(closest) < count:
+            closest.extend(pk for pk in spot_ids if pk not in dists)
+        return closest[:count]
+
+    def nearest_matching(
+        self, longitude, latitude, count, accept, max_distance=None
+    ):
+        """
+        Returns up to count (spot id, distance) pairs, closest first, of
+        the located spots that accept() takes and that are no more than
+        max_distance meters away. accept is called with a list of
+        candidate ids, nearest first, and returns the ones that match.
+
+        Rings of cells are added around the center only while none of
+        the candidates found so far is sure to be the next nearest, and
+        candidates are given to accept() in batches that double in size,
+        so a filter that matches few spots still only takes a few calls.
+        """
+        ids, cells = self.data[0], self.data[4]
+        longitude = float(longitude)
+        latitude = float(latitude)
+        row = _cell(latitude)
+        column = _cell(longitude)
+        # Away from the equator a cell is narrower than it is tall, so a
+        # ring is this many times as many columns wide as rows tall.
+        stretch = 1 / max(cos(radians(latitude)), 0.01)
+
+        rings = defaultdict(list)
+        for (cell_row, cell_column), span in cells.items():
+            columns = abs(cell_column - column)
+            if columns:
+                columns = int(floor((columns - 1) / stretch)) + 1
+            rings[max(abs(cell_row - row), columns)].append(span)
+        aways = sorted(rings)
+
+        # (distance, id) of the candidates not given to accept() yet
+        pending = []
+        found = []
+        batch = count
+        reach = 0
+        visited = 0
+        while len(found) < count:
+            if pending and pending[0][0] <= reach:
+                # Nothing in the rings not visited yet can be closer
+                ready = []
+                while (
+                    pending and pending[0][0] <= reach and len(ready) < batch
+                ):
+                    ready.append(heapq.heappop(pending))
+                accepted = set(accept([pk for dist, pk in ready]))
+                found.extend(
+                    (dist, pk) for dist, pk in ready if pk in accepted
+                )
+                batch *= 2
+            elif visited < len(aways) and (
+                max_distance is None or reach < max_distance
+            ):
+                positions = self._positions(rings[aways[visited]])
+                visited += 1
+                dists = self._distances(longitude, latitude, positions)
+                for position, dist in zip(positions, dists):
+                    if max_distance is None or dist <= max_distance:
+                        heapq.heappush(pending, (dist, ids[position]))
+
+                if visited < len(aways):
+                    reach = self._reach(
+                        longitude, latitude, aways[visited] - 1, stretch
+                    )
+                else:
+                    reach = float("inf")
+            else:
+                break
+
+        return [(pk, dist) for dist, pk in found[:count]]
+
+    def _reach(self, longitude, latitude, away, stretch):
+        """
+        The distance in meters from the point that is sure to stay within
+        away rows, and away * stretch columns, of the point's cell. Cells
+        don't wrap around the antimeridian, so near it nothing is sure.
+        """
+        north = MIN_RADIUS * radians(away * CELL_SIZE)
+        degrees = away * stretch * CELL_SIZE
+        if degrees >= 90 or abs(longitude) + degrees >= 180:
+            return 0
+        # To the nearest meridian outside
+        east = MIN_RADIUS * asin(
+            cos(radians(latitude)) * sin(radians(degrees))
+        )
+        return min(north, east)
+
+
+spatial_index = SpatialIndex()
@@ -0,0 +1,241 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" Minute-of-week bitmaps of each spot's available hours.
+
+    Every spot with hours gets three 10,080 bit bitmaps (one bit per
+    minute of the week, Monday 00:00 first):
+
+        open: set for every minute inside one of the spot's windows
+        starts: set for the minute each window starts
+        ends: set for the minute each window ends
+
+    The hours filters in the search are expressed as an HoursQuery,
+    and HoursIndex.matching() answers it with bitmask tests instead of
+    one join on spotavailablehours per filter. The bitmaps are kept as
+    bytes, all in one array, and a test only reads the bytes its mask
+    covers, which are within a day.
+
+    Windows on the same day never overlap or touch (SpotAvailableHours
+    merges them on save), so a run of set bits in the open bitmap is
+    always exactly one window. Times are compared at minute resolution;
+    a window's end is rounded up, so a window ending at 23:59:59 covers
+    the last minute of the day.
+"""
+
+from array import array
+
+from spotseeker_server.index import CatalogIndex
+from spotseeker_server.models import SpotAvailableHours
+
+MINUTES_PER_DAY = 24 * 60
+
+# The size of one bitmap, and of the three of a spot
+BITMAP_BYTES = 7 * MINUTES_PER_DAY // 8
+SPOT_BYTES = 3 * BITMAP_BYTES
+
+DAYS = [day for day, name in SpotAvailableHours.DAY_CHOICES]
+
+OPEN = 0
+STARTS = 1
+ENDS = 2
+
+
+def _minutes(value):
+    """
+    Returns (minute of the day, whether there is a remainder) for a
+    time, a datetime or a time string. Strings are parsed the same way
+    the database filter parses them.
+    """
+    if isinstance(value, str):
+        field = SpotAvailableHours._meta.get_field("start_time")
+        value = field.to_python(value)
+    minute = value.hour * 60 + value.minute
+    return minute, bool(value.second or value.microsecond)
+
+
+def _mask(day, first, last):
+    """Bits for minutes first through last - 1 of the day."""
+    first = max(first, 0)
+    last = min(last, MINUTES_PER_DAY)
+    if last <= first:
+        return 0
+    offset = DAYS.index(day) * MINUTES_PER_DAY
+    return ((1 << (last - first)) - 1) << (offset + first)
+
+
+def _test(bitmap, mask, require_all):
+    """
+    An alternative of an HoursQuery as a (start, end, mask,
+    require_all) test of the bytes start to end of a spot's bitmaps,
+    with mask shifted to match.
+    """
+    first = ((mask & -mask).bit_length() - 1) // 8
+    last = (mask.bit_length() + 7) // 8
+    offset = bitmap * BITMAP_BYTES
+    return offset + first, offset + last, mask >> (first * 8), require_all
+
+
+class HoursQuery(object):
+    """
+    The hours conditions of one search. Each method adds a condition,
+    and a spot has to meet all of them.
+
+    Each condition is a list of alternatives, at least one of which has
+    to hold. An alternative is a (bitmap, mask, require_all) tuple: the
+    spot's bitmap must have all of the mask's bits set, or any of them
+    if require_all is False.
+    """
+
+    def __init__(self):
+        self.conditions = []
+
+    def __bool__(self):
+        return bool(self.conditions)
+
+    def _add(self, alternatives):
+        # An empty mask would trivially pass a require_all test
+        self.conditions.append([alt for alt in alternatives if alt[1]])
+
+    def open_now(self, day, now):
+        """Open at now: start < now < end."""
+        # Check to see if the request was made in minute gap before
+        # midnight during which no space is open, based on the server.
+        before_midnight = now.replace(
+            hour=23, minute=58, second=59, microsecond=999999
+        )
+        right_before_midnight = now.replace(
+            hour=23, minute=59, second=59, microsecond=999999
+        )
+        if before_midnight < now and now < right_before_midnight:
+            # Makes it so that all spaces that are open
+            # until midnight or overnight will be returned.
+            now = now.replace(hour=23, minute=58, second=0, microsecond=0)
+
+        minute, partial = _minutes(now)
+        if partial:
+            self._add([(OPEN, _mask(day, minute, minute + 1), True)])
+        elif minute == 0:
+            # Nothing can start before midnight
+            self._add([])
+        else:
+            # Open for the minute before and the minute after now, which
+            # can only be the same window.
+            self._add([(OPEN, _mask(day, minute - 1, minute + 1), True)])
+
+    def open_at(self, day, at):
+        """Open at a time: start <= at < end."""
+        minute, partial = _minutes(at)
+        self._add([(OPEN, _mask(day, minute, minute + 1), True)])
+
+    def open_between(self, day, start, end):
+        """One window covers start through end: s <= start, e >= end."""
+        first, partial = _minutes(start)
+        last, partial = _minutes(end)
+        if first < last:
+            self._add([(OPEN, _mask(day, first, last), True)])
+        else:
+            # A window that includes the minute, or ends on it
+            self._add(
+                [
+                    (OPEN, _mask(day, first, first + 1), True),
+                    (OPEN, _mask(day, first - 1, first), True),
+                ]
+            )
+
+    def open_near(self, ranges):
+        """
+        Fuzzy hours: for any of the (start_day, start_time, end_day,
+        end_time) ranges, a window starts or ends inside the range or
+        spans all of it.
+        """
+        alternatives = []
+        for start_day, start, end_day, end in ranges:
+            start, partial = _minutes(start)
+            end, partial = _minutes(end)
+
+            alternatives += [
+                (STARTS, _mask(start_day, start, end), False),
+                (ENDS, _mask(end_day, start + 1, end + 1), False),
+            ]
+            if start_day != end_day:
+                alternatives += [
+                    (STARTS, _mask(start_day, start, MINUTES_PER_DAY), False),
+                    (ENDS, _mask(end_day, 0, end), False),
+                    (ENDS, _mask(end_day, start, MINUTES_PER_DAY), False),
+                    (STARTS, _mask(end_day, 0, end), False),
+                ]
+            elif start <= end:
+                # A window open from start through end
+                alternatives.append(
+                    (OPEN, _mask(end_day, start, end + 1), True)
+                )
+            else:
+                # A window that starts by start and ends after end
+                alternatives.append(
+                    (OPEN, _mask(end_day, end, start + 1), False)
+                )
+        self._add(alternatives)
+
+
+class HoursIndex(CatalogIndex):
+    """
+    data is an (ids, bitmaps) tuple: ids is the array of the ids of the
+    spots with any hours, in order, and bitmaps is an array of bytes
+    with the (open, starts, ends) bitmaps of each of them, in the same
+    order, each BITMAP_BYTES long and little endian.
+    """
+
+    def build(self):
+        spot_bitmaps = {}
+        hours = SpotAvailableHours.objects.values_list(
+            "spot_id", "day", "start_time", "end_time"
+        )
+        for spot_id, day, start_time, end_time in hours:
+            day = day.lower()
+            if day not in DAYS:
+                continue
+            start, partial = _minutes(start_time)
+            end, partial = _minutes(end_time)
+            if partial:
+                end += 1
+
+            spot_open, starts, ends = spot_bitmaps.get(spot_id, (0, 0, 0))
+            spot_open |= _mask(day, start, end)
+            starts |= _mask(day, start, start + 1)
+            if end < MINUTES_PER_DAY:
+                ends |= _mask(day, end, end + 1)
+            spot_bitmaps[spot_id] = (spot_open, starts, ends)
+
+        ids = array("i", sorted(spot_bitmaps))
+        bitmaps = array("B")
+        for spot_id in ids:
+            for bitmap in spot_bitmaps[spot_id]:
+                bitmaps.frombytes(bitmap.to_bytes(BITMAP_BYTES, "little"))
+        return ids, bitmaps
+
+    def matching(self, hours_query):
+        """Returns the ids of the spots that meet every condition."""
+        ids, bitmaps = self.data
+        conditions = [
+            [_test(*alternative) for alternative in alternatives]
+            for alternatives in hours_query.conditions
+        ]
+
+        found = []
+        for position, spot_id in enumerate(ids):
+            base = position * SPOT_BYTES
+            for alternatives in conditions:
+                for start, end, mask, require_all in alternatives:
+                    data = bitmaps[base + start:base + end]
+                    bits = int.from_bytes(data, "little") & mask
+                    if bits == mask if require_all else bits:
+                        break
+                else:
+                    break
+            else:
+                found.append(spot_id)
+        return found
+
+
+hours_index = HoursIndex()
@@ -0,0 +1,267 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" Catalog index snapshots shared by the workers on a node.
+
+    With SPOTSEEKER_INDEX_SNAPSHOT_DIR set, the first worker to build an
+    index for a catalog version publishes it there as a file named for
+    the index and the version. The other workers map that file
+    read-only and load the index from it, rather than each querying the
+    database and building their own. A snapshot is written to a
+    temporary file and renamed into place, so a reader sees either the
+    whole of it or nothing; the snapshots of older generations are
+    removed once a newer one is published, while a worker that is still
+    on an older generation leaves the newer snapshots alone.
+
+    Snapshots aren't pickles, so loading one can't run code: they hold
+    only None, bools, numbers, strings, bytes, tuples, lists, dicts,
+    sets, the namedtuples passed to record(), SpotSets, and arrays of
+    bytes, ints or floats. Arrays, and the id arrays of SpotSets, are
+    read in place from the mapped file, as memoryviews, so the workers
+    on a node share one copy of those pages; everything else is decoded
+    into each worker. The indexes keep their bulk in arrays and SpotSets
+    for that reason, leaving only their keys (extended info values,
+    trigrams, grid cells) to be decoded.
+
+    Snapshots are keyed on the shared catalog generation, so they are
+    only used when there is a shared cache to keep it (see catalog.py).
+"""
+
+from array import array
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import tempfile
+
+from django.conf import settings
+
+from spotseeker_server.index.spot_set import SpotSet
+
+logger = logging.getLogger(__name__)
+
+SUFFIX = ".snapshot"
+
+# The start of every snapshot; change it along with the format
+MAGIC = b"SPOTIDX\x02"
+
+# The namedtuples a snapshot can hold, by name
+RECORDS = {}
+
+_LENGTH = struct.Struct("<I")
+_FLOAT = struct.Struct("<d")
+_SEQUENCES = {tuple: b"(", list: b"[", set: b"<"}
+_SEQUENCE_TYPES = {b"(": tuple, b"[": list, b"<": set}
+# The typecodes of the arrays a snapshot can hold
+_ARRAY_TYPES = ("B", "i", "d")
+
+
+def record(cls):
+    """Lets snapshots hold the namedtuple class cls, and returns it."""
+    RECORDS[cls.__name__] = cls
+    return cls
+
+
+def _encode(value, out):
+    """Appends value to the bytearray out."""
+    if value is None:
+        out += b"N"
+    elif value is True or value is False:
+        out += b"T" if value else b"F"
+    elif isinstance(value, int):
+        size = value.bit_length() // 8 + 1
+        data = value.to_bytes(size, "little", signed=True)
+        out += b"I" + _LENGTH.pack(size) + data
+    elif isinstance(value, float):
+        out += b"D" + _FLOAT.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        out += b"S" + _LENGTH.pack(len(data)) + data
+    elif isinstance(value, bytes):
+        out += b"B" + _LENGTH.pack(len(value)) + value
+    elif isinstance(value, array) and value.typecode in _ARRAY_TYPES:
+        out += b"A" + value.typecode.encode("ascii")
+        out += _LENGTH.pack(len(value) * value.itemsize)
+        # Aligned, so the array can be read in place
+        out += bytes(-len(out) % 8) + value.tobytes()
+    elif isinstance(value, SpotSet):
+        is_bitmap, data = value.packed()
+        out += b"P1" if is_bitmap else b"P0"
+        out += _LENGTH.pack(len(data))
+        # Aligned, so the ids can be read in place
+        out += bytes(-len(out) % 4) + data
+    elif RECORDS.get(type(value).__name__) is type(value):
+        out += b"R"
+        _encode(type(value).__name__, out)
+        _encode(tuple(value), out)
+    elif type(value) is dict:
+        out += b"{" + _LENGTH.pack(len(value))
+        for key, item in value.items():
+            _encode(key, out)
+            _encode(item, out)
+    elif type(value) in _SEQUENCES:
+        out += _SEQUENCES[type(value)] + _LENGTH.pack(len(value))
+        for item in value:
+            _encode(item, out)
+    else:
+        raise TypeError("Can't snapshot a %s" % type(value).__name__)
+
+
+class _Reader(object):
+    """Decodes a snapshot from a memoryview of it."""
+
+    def __init__(self, view):
+        self.view = view
+        self.position = 0
+
+    def take(self, size):
+        start = self.position
+        if size < 0 or start + size > len(self.view):
+            raise ValueError("The snapshot is cut short")
+        self.position += size
+        return self.view[start:self.position]
+
+    def length(self):
+        return _LENGTH.unpack(self.take(_LENGTH.size))[0]
+
+    def snapshot(self):
+        if self.take(len(MAGIC)) != MAGIC:
+            raise ValueError("Not an index snapshot")
+        value = self.value()
+        if self.position != len(self.view):
+            raise ValueError("The snapshot has trailing data")
+        return value
+
+    def value(self):
+        tag = self.take(1).tobytes()
+        if tag == b"N":
+            return None
+        if tag in (b"T", b"F"):
+            return tag == b"T"
+        if tag == b"I":
+            data = self.take(self.length())
+            return int.from_bytes(data, "little", signed=True)
+        if tag == b"D":
+            return _FLOAT.unpack(self.take(_FLOAT.size))[0]
+        if tag == b"S":
+            return str(self.take(self.length()), "utf-8")
+        if tag == b"B":
+            return self.take(self.length()).tobytes()
+        if tag == b"A":
+            typecode = str(self.take(1), "ascii")
+            if typecode not in _ARRAY_TYPES:
+                raise ValueError("Unknown array type %r" % typecode)
+            size = self.length()
+            self.take(-self.position % 8)
+            return self.take(size).cast(typecode)
+        if tag == b"P":
+            is_bitmap = self.take(1) == b"1"
+            size = self.length()
+            self.take(-self.position % 4)
+            return SpotSet.unpacked(is_bitmap, self.take(size))
+        if tag == b"R":
+            name = self.value()
+            if name not in RECORDS:
+                raise ValueError("Unknown record %r" % (name,))
+            return RECORDS[name](*self.value())
+        if tag == b"{":
+            return dict(
+                (self.value(), self.value()) for i in range(self.length())
+            )
+        if tag in _SEQUENCE_TYPES:
+            return _SEQUENCE_TYPES[tag](
+                self.value() for i in range(self.length())
+            )
+        raise ValueError("Unknown tag %r" % tag)
+
+
+def snapshot_path(index, version):
+    """
+    Returns the path of the snapshot of index for a catalog_version(),
+    or None if snapshots aren't used.
+    """
+    directory = getattr(settings, "SPOTSEEKER_INDEX_SNAPSHOT_DIR", None)
+    if not directory or version[1] is None:
+        return None
+    # The first part of the version only counts this process' writes
+    key = hashlib.sha1(repr(version[1:]).encode("utf-8")).hexdigest()
+    return os.path.join(
+        directory,
+        "%s-%020d-%s%s" % (type(index).__name__, version[1], key[:16], SUFFIX),
+    )
+
+
+def _generation(name):
+    """
+    Returns the index and the catalog generation a snapshot file is
+    named for, or None if name isn't a snapshot_path().
+    """
+    parts = name[: -len(SUFFIX)].split("-")
+    if not name.endswith(SUFFIX) or len(parts) != 3 or not parts[1].isdigit():
+        return None
+    return parts[0], int(parts[1])
+
+
+def load(path):
+    """Returns the index data in the snapshot at path, or None."""
+    try:
+        with open(path, "rb") as f:
+            # Stays mapped for as long as the data reads from it
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return _Reader(memoryview(mapped)).snapshot()
+    except FileNotFoundError:
+        return None
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning("Can't load index snapshot %s: %s", path, e)
+        return None
+
+
+def publish(path, data):
+    """
+    Writes data as the snapshot at path, and removes the snapshots of
+    the same index from older catalog generations.
+    """
+    directory, name = os.path.split(path)
+    published = _generation(name)
+    try:
+        out = bytearray(MAGIC)
+        _encode(data, out)
+        os.makedirs(directory, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix=".")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(out)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+        for other in os.listdir(directory):
+            generation = _generation(other)
+            if (
+                published is not None
+                and generation is not None
+                and generation[0] == published[0]
+                and generation[1] < published[1]
+            ):
+                # A worker still reading it keeps it mapped until done
+                os.unlink(os.path.join(directory, other))
+    except (OSError, TypeError) as e:
+        logger.warning("Can't publish index snapshot %s: %s", path, e)
+
+
+def load_or_build(index, version):
+    """
+    Returns the data of index for the catalog version, from its
+    snapshot if one has been published, or else from index.build().
+    """
+    path = snapshot_path(index, version)
+    if path is None:
+        return index.build()
+
+    data = load(path)
+    if data is None:
+        data = index.build()
+        publish(path, data)
+    return data
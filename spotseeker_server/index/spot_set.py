@@ -0,0 +1,198 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" Sets of spot ids, as the indexes keep them.
+
+    Most postings in an index are small: a free text extended info key
+    like location_description has a posting for each distinct value,
+    with one or two spots in it. A SpotSet keeps those as a sorted array
+    of ids, four bytes each. Only a set with at least one id in DENSITY
+    of the ids up to its largest, where a bitmap is the smaller of the
+    two, is kept as a bitmap: an int with bit n set for id n, which
+    Python ands and ors a machine word at a time.
+
+    Either way, &, | and - work between any two SpotSets, and iterating
+    over one gives its ids in order. The ids can also be a memoryview of
+    a mapped index snapshot (see snapshot.py), which is read in place.
+"""
+
+from array import array
+from bisect import bisect_left
+
+# A set with at least one id in this many is kept as a bitmap
+DENSITY = 32
+
+# The bits set in each byte value, lowest first
+_BITS = [
+    tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)
+]
+
+
+def _to_bits(spot_ids):
+    """The bitmap of a sorted, non-empty list of ids."""
+    bits = bytearray(spot_ids[-1] // 8 + 1)
+    for spot_id in spot_ids:
+        bits[spot_id >> 3] |= 1 << (spot_id & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _bytes(bits):
+    return bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+
+
+def _bit_ids(bits):
+    """The ids whose bits are set, in order."""
+    spot_ids = []
+    for offset, byte in enumerate(_bytes(bits)):
+        if byte:
+            base = offset << 3
+            spot_ids.extend(base + bit for bit in _BITS[byte])
+    return spot_ids
+
+
+class SpotSet(object):
+    """
+    An immutable set of spot ids, as either a sorted array of the ids
+    or a bitmap. Build one with SpotSet.of() or SpotSet.union().
+    """
+
+    __slots__ = ("_ids", "_bits", "_bytes")
+
+    def __init__(self, ids=None, bits=None):
+        self._ids = ids
+        self._bits = bits
+        self._bytes = None
+
+    @classmethod
+    def of(cls, spot_ids):
+        """The set of spot_ids, in any order."""
+        return cls._sorted(sorted(set(spot_ids)))
+
+    @classmethod
+    def _sorted(cls, spot_ids):
+        """The set of a sorted list of distinct ids."""
+        if (
+            spot_ids
+            and spot_ids[0] >= 0
+            and len(spot_ids) * DENSITY >= spot_ids[-1]
+        ):
+            return cls(bits=_to_bits(spot_ids))
+        return cls(ids=array("i", spot_ids))
+
+    @classmethod
+    def union(cls, spot_sets):
+        """The union of any number of SpotSets, merged at once."""
+        bits = 0
+        spot_ids = set()
+        for spot_set in spot_sets:
+            if spot_set._bits is not None:
+                bits |= spot_set._bits
+            else:
+                spot_ids.update(spot_set._ids)
+        if not spot_ids:
+            return cls(bits=bits)
+        merged = cls._sorted(sorted(spot_ids))
+        if not bits:
+            return merged
+        return cls(bits=bits | merged.bits())
+
+    def bits(self):
+        """This set as a bitmap."""
+        if self._bits is not None:
+            return self._bits
+        return _to_bits(self._ids) if self._ids else 0
+
+    def filter(self, spot_ids):
+        """The spot_ids that are in this set, in the same order."""
+        if self._bits is not None:
+            if self._bytes is None:
+                self._bytes = _bytes(self._bits)
+            data = self._bytes
+            size = len(data)
+            return [
+                spot_id
+                for spot_id in spot_ids
+                if 0 <= spot_id >> 3 < size
+                and data[spot_id >> 3] >> (spot_id & 7) & 1
+            ]
+        return [spot_id for spot_id in spot_ids if spot_id in self]
+
+    def __contains__(self, spot_id):
+        # For one id; filter() is quicker for many
+        if self._bits is not None:
+            return spot_id >= 0 and bool(self._bits >> spot_id & 1)
+        i = bisect_left(self._ids, spot_id)
+        return i < len(self._ids) and self._ids[i] == spot_id
+
+    def __and__(self, other):
+        if self._bits is not None and other._bits is not None:
+            return SpotSet(bits=self._bits & other._bits)
+        # Keep the ids of the (shorter) array that are in the other set
+        array_set, other_set = self, other
+        if self._bits is not None or (
+            other._bits is None and len(other._ids) < len(self._ids)
+        ):
+            array_set, other_set = other, self
+        return SpotSet(ids=array("i", other_set.filter(array_set._ids)))
+
+    def __or__(self, other):
+        return SpotSet.union([self, other])
+
+    def __sub__(self, other):
+        if self._bits is not None:
+            return SpotSet(bits=self._bits & ~other.bits())
+        found = set(other.filter(self._ids))
+        return SpotSet(
+            ids=array("i", [i for i in self._ids if i not in found])
+        )
+
+    def __iter__(self):
+        if self._bits is not None:
+            return iter(_bit_ids(self._bits))
+        return iter(self._ids)
+
+    def __len__(self):
+        if self._bits is not None:
+            return bin(self._bits).count("1")
+        return len(self._ids)
+
+    def __bool__(self):
+        if self._bits is not None:
+            return self._bits != 0
+        return len(self._ids) > 0
+
+    def __eq__(self, other):
+        return isinstance(other, SpotSet) and list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return "SpotSet(%r)" % list(self)
+
+    def ids(self):
+        """The ids in the set, in order."""
+        return list(self)
+
+    def packed(self):
+        """
+        Returns (is_bitmap, data): the bytes of the bitmap, or those of
+        the array of ids in native byte order.
+        """
+        if self._bits is not None:
+            return True, _bytes(self._bits)
+        return False, self._ids.tobytes()
+
+    @classmethod
+    def unpacked(cls, is_bitmap, data):
+        """
+        The SpotSet that packed() returned data for, given as a
+        memoryview. An array of ids is read from data in place, without
+        a copy.
+        """
+        if is_bitmap:
+            return cls(bits=int.from_bytes(data, "little"))
+        return cls(ids=data.cast("i"))
+
+
+EMPTY = SpotSet(ids=array("i"))
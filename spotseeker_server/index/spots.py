@@ -0,0 +1,203 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" A compact copy of the searchable columns of the spot catalog.
+
+    Along with the geo, hours, extended info and text indexes, this is
+    everything the memory search backend needs to answer a search
+    without SQL. Spot types, buildings and items are kept as SpotSets of
+    the spots that have them (see spot_set.py), capacities as a
+    sorted column, and a few more Spot fields as columns for the search
+    filters' predicates.
+
+    A column is an array with an entry for every spot, in the order of
+    their ids, so it is read in place from a snapshot. Each entry is the
+    position of the spot's value in a tuple of the column's distinct
+    values, and a predicate is tested once for each distinct value
+    rather than once for each spot.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+
+from spotseeker_server.index import CatalogIndex, snapshot
+from spotseeker_server.index.spot_set import SpotSet
+from spotseeker_server.models import Item, ItemExtendedInfo, Spot
+
+# The Spot fields a search filter's predicates can be on
+COLUMNS = ("building_name", "capacity", "floor", "name", "room_number")
+
+# The fields of an item that can be searched on
+ITEM_FIELDS = ("id", "name", "item_category", "item_subcategory")
+
+SpotColumns = snapshot.record(
+    namedtuple(
+        "SpotColumns",
+        [
+            "everything",
+            "ids",
+            "columns",
+            "capacities",
+            "capacity_ids",
+            "no_capacity",
+            "types",
+            "buildings",
+            "items",
+            "item_info",
+        ],
+    )
+)
+
+
+def _column(values):
+    """
+    Returns (distinct, codes): the tuple of the distinct values, and the
+    array of the position in it of each of values.
+    """
+    distinct = {}
+    codes = array(
+        "i", [distinct.setdefault(value, len(distinct)) for value in values]
+    )
+    return tuple(distinct), codes
+
+
+class SpotIndex(CatalogIndex):
+    """
+    data is a SpotColumns:
+        everything: the SpotSet of every spot.
+        ids: the array of the ids of every spot, in order.
+        columns: dict of each of COLUMNS to a (distinct, codes) pair:
+            the tuple of the column's distinct values, and an array of
+            the position in distinct of each spot's value, in the same
+            order as ids.
+        capacities: a sorted array of the capacity of every spot with a
+            capacity.
+        capacity_ids: an array of the ids of those spots, in the same
+            order as capacities.
+        no_capacity: the SpotSet of the spots without a capacity.
+        types: dict of spot type name to a SpotSet of the spots of that
+            type.
+        buildings: dict of building name to a SpotSet of its spots.
+        items: dict of (field, value) to a SpotSet of the spots with an
+            item with that value, for each of ITEM_FIELDS. Values are
+            strings, as they come in a search.
+        item_info: dict of (key, value) to a SpotSet of the spots with an
+            item with that extended info.
+    """
+
+    def build(self):
+        rows = list(Spot.objects.order_by("pk").values_list("pk", *COLUMNS))
+        ids = array("i", [row[0] for row in rows])
+        columns = dict(
+            (column, _column(row[number] for row in rows))
+            for number, column in enumerate(COLUMNS, 1)
+        )
+
+        capacity = COLUMNS.index("capacity") + 1
+        by_capacity = sorted(
+            (row[capacity], row[0])
+            for row in rows
+            if row[capacity] is not None
+        )
+        no_capacity = SpotSet.of(
+            row[0] for row in rows if row[capacity] is None
+        )
+
+        types = self._postings(
+            Spot.spottypes.through.objects.values_list(
+                "spottype__name", "spot_id"
+            )
+        )
+        building = COLUMNS.index("building_name") + 1
+        buildings = self._postings((row[building], row[0]) for row in rows)
+
+        item_rows = []
+        for row in Item.objects.values_list("spot_id", *ITEM_FIELDS):
+            for field, value in zip(ITEM_FIELDS, row[1:]):
+                item_rows.append(((field, str(value)), row[0]))
+        items = self._postings(item_rows)
+
+        item_info = self._postings(
+            ((key, value), spot_id)
+            for spot_id, key, value in ItemExtendedInfo.objects.values_list(
+                "item__spot_id", "key", "value"
+            )
+        )
+
+        return SpotColumns(
+            SpotSet.of(ids),
+            ids,
+            columns,
+            array("i", [value for value, spot_id in by_capacity]),
+            array("i", [spot_id for value, spot_id in by_capacity]),
+            no_capacity,
+            types,
+            buildings,
+            items,
+            item_info,
+        )
+
+    def _postings(self, pairs):
+        """Returns a dict of each value to the SpotSet of its spot ids."""
+        spot_ids = {}
+        for value, spot_id in pairs:
+            if spot_id is not None:
+                spot_ids.setdefault(value, []).append(spot_id)
+        return dict(
+            (value, SpotSet.of(ids)) for value, ids in spot_ids.items()
+        )
+
+    def _lookup(self, postings, values):
+        return SpotSet.union(
+            postings[value] for value in values if value in postings
+        )
+
+    def with_capacity(self, capacity):
+        """
+        Returns the SpotSet of the spots with at least the capacity, or
+        with no capacity set.
+        """
+        data = self.data
+        first = bisect_left(data.capacities, capacity)
+        return SpotSet.of(data.capacity_ids[first:]) | data.no_capacity
+
+    def of_type(self, names):
+        """Returns the SpotSet of the spots of any of the types."""
+        return self._lookup(self.data.types, names)
+
+    def in_building(self, names):
+        """Returns the SpotSet of the spots in any of the buildings."""
+        return self._lookup(self.data.buildings, names)
+
+    def with_item(self, field, values):
+        """
+        Returns the SpotSet of the spots with an item whose field is one
+        of values.
+        """
+        return self._lookup(
+            self.data.items, [(field, str(value)) for value in values]
+        )
+
+    def with_item_info(self, key, values):
+        """
+        Returns the SpotSet of the spots with an item with key set to one
+        of values in its extended info.
+        """
+        return self._lookup(
+            self.data.item_info, [(key, value) for value in values]
+        )
+
+    def matching_column(self, field, test):
+        """Returns the SpotSet of the spots whose field passes test()."""
+        distinct, codes = self.data.columns[field]
+        passes = [test(value) for value in distinct]
+        ids = self.data.ids
+        return SpotSet.of(
+            ids[position]
+            for position, code in enumerate(codes)
+            if passes[code]
+        )
+
+
+spot_index = SpotIndex()
@@ -0,0 +1,175 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" A trigram index over the text of each spot.
+
+    The indexed fields are the spot's name, building_name and
+    room_number, and its location_description extended info. Every
+    three character run of a field's lowercased text maps to the spots
+    whose field contains it, so finding the spots that contain a word
+    only has to check the spots that have all of its trigrams, instead
+    of a LIKE '%word%' over the whole table.
+
+    A free text search (the q parameter) matches the spots that contain
+    every word of the query in one of the fields, best matches first.
+
+    The text of every field of every spot is kept in one array of UTF-8
+    bytes, and a field is only decoded when a spot it belongs to is a
+    candidate.
+"""
+
+from array import array
+import re
+
+from spotseeker_server.index import CatalogIndex
+from spotseeker_server.index.spot_set import EMPTY, SpotSet
+from spotseeker_server.models import Spot, SpotExtendedInfo
+
+# The indexed fields and how much a match in each counts for
+FIELD_WEIGHTS = (
+    ("name", 4),
+    ("building_name", 2),
+    ("room_number", 2),
+    ("location_description", 1),
+)
+FIELDS = [field for field, weight in FIELD_WEIGHTS]
+
+# The indexed fields that are columns of the Spot table
+SPOT_FIELDS = FIELDS[:3]
+
+
+def _trigrams(text):
+    return set(text[i:i + 3] for i in range(len(text) - 2))
+
+
+class TextIndex(CatalogIndex):
+    """
+    data is an (ids, offsets, text, trigrams) tuple. ids is the array of
+    the ids of every spot, in order. text is an array of the UTF-8 bytes
+    of the lowercased text of each of FIELDS of each spot, one after the
+    other in the same order, and field f of the spot at position p runs
+    from offsets[p * len(FIELDS) + f] to the offset after it. trigrams
+    maps each trigram to the SpotSet of the positions of the spots with
+    it in any field.
+    """
+
+    def build(self):
+        texts = {}
+        for row in Spot.objects.values_list("pk", *SPOT_FIELDS):
+            texts[row[0]] = [value.lower() for value in row[1:]] + [""]
+
+        descriptions = SpotExtendedInfo.objects.filter(
+            key="location_description"
+        ).values_list("spot_id", "value")
+        for spot_id, value in descriptions:
+            if spot_id in texts:
+                texts[spot_id][3] = value.lower()
+
+        ids = array("i", sorted(texts))
+        offsets = array("i", [0])
+        text = bytearray()
+        positions = {}
+        for position, spot_id in enumerate(ids):
+            for field in texts[spot_id]:
+                text += field.encode("utf-8")
+                offsets.append(len(text))
+                for trigram in _trigrams(field):
+                    positions.setdefault(trigram, []).append(position)
+
+        trigrams = dict(
+            (trigram, SpotSet.of(found))
+            for trigram, found in positions.items()
+        )
+        return ids, offsets, array("B", text), trigrams
+
+    def _field(self, position, number):
+        """The lowercased text of FIELDS[number] of the spot at position."""
+        offsets, text = self.data[1:3]
+        i = position * len(FIELDS) + number
+        return str(text[offsets[i]:offsets[i + 1]], "utf-8")
+
+    def _candidates(self, word):
+        """
+        Returns the SpotSet of the positions of the spots that might
+        contain word, or None if word is too short to narrow them down.
+        """
+        trigrams = self.data[3]
+        postings = [
+            trigrams.get(trigram, EMPTY) for trigram in _trigrams(word)
+        ]
+        if not postings:
+            return None
+        postings.sort(key=len)
+        found = postings[0]
+        for posting in postings[1:]:
+            found &= posting
+        return found
+
+    def containing(self, field, value):
+        """
+        Returns the ids of the spots whose field contains value, ignoring
+        case, the same spots as a field__icontains filter.
+        """
+        ids = self.data[0]
+        number = FIELDS.index(field)
+        value = value.lower()
+
+        candidates = self._candidates(value)
+        if candidates is None:
+            candidates = range(len(ids))
+        return [
+            ids[position]
+            for position in candidates
+            if value in self._field(position, number)
+        ]
+
+    def search(self, text):
+        """
+        Returns the ids of the spots that contain every word of text,
+        best match first. A word counts for more in a heavier field, and
+        for more at the start of the field or of a word in it.
+        """
+        ids = self.data[0]
+        words = text.lower().split()
+        if not words:
+            return []
+
+        candidates = None
+        for word in words:
+            found = self._candidates(word)
+            if found is not None:
+                if candidates is None:
+                    candidates = found
+                else:
+                    candidates &= found
+        if candidates is None:
+            candidates = range(len(ids))
+
+        scores = {}
+        for position in candidates:
+            fields = [
+                self._field(position, number)
+                for number in range(len(FIELDS))
+            ]
+            score = 0
+            for word in words:
+                best = 0
+                for field_text, (field, weight) in zip(fields, FIELD_WEIGHTS):
+                    found = field_text.find(word)
+                    if found == -1:
+                        continue
+                    if found == 0:
+                        weight *= 3
+                    elif re.search(r"\b" + re.escape(word), field_text):
+                        weight *= 2
+                    best = max(best, weight)
+                if not best:
+                    break
+                score += best
+            else:
+                scores[ids[position]] = score
+
+        return sorted(scores, key=lambda spot_id: (-scores[spot_id], spot_id))
+
+
+text_index = TextIndex()
@@ -27,9 +27,12 @@ class LogMiddleware(MiddlewareMixin):
 
         # response.content will empty out the FileWrapper object
         # on file downloads - those views need to correctly set
-        # their own content length
+        # their own content length. Streamed responses don't have
+        # their content yet, so their length isn't known.
         if "Content-Length" in response:
             response_length = response["Content-Length"]
+        elif response.streaming:
+            response_length = "-"
         else:
             response_length = len(response.content)
 
@@ -0,0 +1,85 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+"""     This provides a management command to django's manage.py called
+    benchmark_search that times a fixed mix of searches over a
+    synthetic catalog, and prints the results as JSON.
+"""
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import (
+    override_settings,
+    setup_test_environment,
+    teardown_test_environment,
+)
+import simplejson as json
+
+from spotseeker_server.benchmark import generate_catalog, run_scenarios
+
+
+class Command(BaseCommand):
+    help = (
+        "Builds a synthetic catalog in a throwaway test database and "
+        "reports the latency and query count of a fixed mix of searches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--spots",
+            type=int,
+            default=10000,
+            help="The number of spots in the catalog",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="How many times to time each search",
+        )
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Seed for the catalog"
+        )
+        parser.add_argument(
+            "--result-cache",
+            action="store_true",
+            default=False,
+            help="Leave the search results cache on",
+        )
+        parser.add_argument(
+            "--output", help="Write the JSON report to this file"
+        )
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True
+        )
+        try:
+            overrides = {
+                "SPOTSEEKER_AUTH_MODULE": "spotseeker_server.auth.all_ok"
+            }
+            if not options["result_cache"]:
+                overrides["SPOTSEEKER_SEARCH_CACHE_TIMEOUT"] = 0
+
+            with override_settings(**overrides):
+                generate_seconds = generate_catalog(
+                    options["spots"], seed=options["seed"]
+                )
+                scenarios = run_scenarios(repeat=options["repeat"])
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        report = {
+            "spots": options["spots"],
+            "seed": options["seed"],
+            "repeat": options["repeat"],
+            "result_cache": options["result_cache"],
+            "generate_seconds": round(generate_seconds, 3),
+            "scenarios": scenarios,
+        }
+        output = json.dumps(report, sort_keys=True, indent=4 * " ")
+        if options["output"]:
+            with open(options["output"], "w") as report_file:
+                report_file.write(output)
+        self.stdout.write(output)
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.29 on 2026-10-18 07:55
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('spotseeker_server', '0005_auto_20230407_2345'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpotDocument',
+            fields=[
+                ('spot', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, serialize=False, to='spotseeker_server.Spot')),
+                ('etag', models.CharField(max_length=40)),
+                ('document', models.TextField()),
+            ],
+        ),
+    ]
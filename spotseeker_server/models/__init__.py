@@ -3,5 +3,8 @@
 
 from .auth import TrustedOAuthClient
 from .item import Item, ItemExtendedInfo, ItemImage
-from .spot import Spot, SpotAvailableHours, SpotExtendedInfo, \
-    SpotImage, SpotType
+from .spot import Spot, SpotAvailableHours, SpotDocument, \
+    SpotExtendedInfo, SpotImage, SpotTombstone, SpotType
+
+# Connects the receivers that track changes to the catalog
+import spotseeker_server.catalog
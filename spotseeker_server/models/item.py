@@ -6,10 +6,12 @@ from PIL import Image
 from django.core.files.uploadedfile import UploadedFile
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
 from django.urls import reverse
 
-from .spot import Spot
-from .utility import update_etag
+from .spot import Spot, refresh_now, refresh_spot
+from .utility import content_etag
 
 
 class Item(models.Model):
@@ -118,7 +120,6 @@ class ItemImage(models.Model):
             "height": self.height
         }
 
-    @update_etag
     def save(self, *args, **kwargs):
         try:
             if (isinstance(self.image, UploadedFile) and
@@ -134,10 +135,14 @@ class ItemImage(models.Model):
 
         self.content_type = ItemImage.CONTENT_TYPES[img.format]
         self.width, self.height = img.size
+        self.etag = content_etag([self.description,
+                                  self.display_index,
+                                  self.upload_user,
+                                  self.upload_application],
+                                 [self.image])
 
         super(ItemImage, self).save(*args, **kwargs)
 
-    @update_etag
     def delete(self, *args, **kwargs):
         self.image.delete(save=False)
         super(ItemImage, self).delete(*args, **kwargs)
@@ -146,3 +151,58 @@ class ItemImage(models.Model):
         return reverse('item-image',
                        kwargs={'item_id': self.item.pk,
                                'image_id': self.pk})
+
+
+@receiver(pre_save, sender=Item, dispatch_uid="spotseeker_server.item.moving")
+def _item_moving(sender, instance, **kwargs):
+    # The spot an item is moved off needs its etag brought up to date too
+    if instance.pk is not None:
+        instance._old_spot_id = (
+            Item.objects.filter(pk=instance.pk)
+            .values_list("spot_id", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Item, dispatch_uid="spotseeker_server.item.saved")
+def _item_saved(sender, instance, **kwargs):
+    old_spot_id = instance.__dict__.pop("_old_spot_id", None)
+    if old_spot_id != instance.spot_id:
+        refresh_spot(old_spot_id)
+    if refresh_now(instance.spot_id):
+        instance.spot.save()
+
+
+@receiver(
+    post_delete, sender=Item, dispatch_uid="spotseeker_server.item.deleted"
+)
+def _item_deleted(sender, instance, **kwargs):
+    refresh_spot(instance.spot_id)
+
+
+@receiver(
+    post_save,
+    sender=ItemImage,
+    dispatch_uid="spotseeker_server.item.image_saved",
+)
+@receiver(
+    post_delete,
+    sender=ItemImage,
+    dispatch_uid="spotseeker_server.item.image_deleted",
+)
+@receiver(
+    post_save,
+    sender=ItemExtendedInfo,
+    dispatch_uid="spotseeker_server.item.extended_info_saved",
+)
+@receiver(
+    post_delete,
+    sender=ItemExtendedInfo,
+    dispatch_uid="spotseeker_server.item.extended_info_deleted",
+)
+def _item_row_changed(sender, instance, **kwargs):
+    refresh_spot(
+        Item.objects.filter(pk=instance.item_id)
+        .values_list("spot_id", flat=True)
+        .first()
+    )
@@ -12,18 +12,41 @@
         proper exception is thrown on an invalid image type.
 """
 
+from contextlib import contextmanager
+from datetime import timedelta
+from decimal import Decimal
+import threading
+import time
+
 from PIL import Image
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.core.cache import cache
 from django.core.files.uploadedfile import UploadedFile
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_slug
-from django.db import models
-from django.db.models import Sum, Count
+from django.db import IntegrityError, models, transaction
+from django.db.models import (
+    Count,
+    Prefetch,
+    Sum,
+    prefetch_related_objects,
+)
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+)
+from django.dispatch import receiver
 from django.urls import reverse
+from django.utils import timezone
+import simplejson as json
+
+from spotseeker_server import spot_cache
 
-from .utility import update_etag
+from .utility import content_etag
 
 
 class SpotType(models.Model):
@@ -58,7 +81,7 @@ class Spot(models.Model):
     organization = models.CharField(max_length=50, blank=True)
     manager = models.CharField(max_length=50, blank=True)
     etag = models.CharField(max_length=40)
-    last_modified = models.DateTimeField(auto_now=True)
+    last_modified = models.DateTimeField(auto_now=True, db_index=True)
     external_id = models.CharField(
         max_length=100,
         null=True,
@@ -68,6 +91,16 @@ class Spot(models.Model):
         validators=[validate_slug],
     )
 
+    # Everything _build_json_data_structure() reads from related tables
+    JSON_PREFETCH = (
+        "spotextendedinfo_set",
+        "spotavailablehours_set",
+        "spotimage_set",
+        "spottypes",
+        "item_set__itemextendedinfo_set",
+        "item_set__itemimage_set",
+    )
+
     def __unicode__(self):
         return self.name
 
@@ -77,15 +110,114 @@ class Spot(models.Model):
     def json_cache_key(self):
         return "Spot:" + str(self.id) + ":json"
 
+    def json_bytes_cache_key(self):
+        return "Spot:" + str(self.id) + ":json_bytes"
+
     def invalidate_cache(self):
-        """Remove this spot's cache entry"""
-        cache.delete(self.json_cache_key())
+        """Remove this spot's cache entries"""
+        cache.delete_many([self.json_cache_key(), self.json_bytes_cache_key()])
 
-    @update_etag
     def save(self, *args, **kwargs):
+        if _related_writes.deferred is not None:
+            # In a deferred_refresh() block, the etag is brought up to
+            # date once, at the end, along with the related rows
+            if not self._state.adding and "update_fields" not in kwargs:
+                kwargs["update_fields"] = [
+                    field.name
+                    for field in self._meta.concrete_fields
+                    if not field.primary_key
+                    and field.name not in ("etag", "last_modified")
+                ]
+            super(Spot, self).save(*args, **kwargs)
+            _related_writes.deferred.add(self.pk)
+            return
+
+        if self._state.adding:
+            super(Spot, self).save(*args, **kwargs)
+            # The etag covers the id the spot was just given. A new spot
+            # has no related rows yet, so there's nothing to read.
+            prefetch_related_objects(
+                [self],
+                *[
+                    Prefetch(name, getattr(self, name).none())
+                    for name in set(
+                        lookup.split("__")[0] for lookup in Spot.JSON_PREFETCH
+                    )
+                ]
+            )
+            self.etag = self._prefetched_etag()
+            Spot.objects.filter(pk=self.pk).update(etag=self.etag)
+            return
+
+        self._save_etag(self.content_etag(), *args, **kwargs)
+
+    def _save_etag(self, etag, *args, **kwargs):
+        """Saves the spot with etag, unless that's the etag it has."""
+        if etag == self.etag:
+            # Nothing in the spot's document changed
+            return
+        self.etag = etag
         self.invalidate_cache()
         super(Spot, self).save(*args, **kwargs)
 
+    def content_etag(self):
+        """
+        Returns the etag of this spot's fields, and of what's in the
+        database for its extended info, hours, types, items and images:
+        a hash of its json_data_structure(), but for the etag and
+        last_modified, with images by their etags rather than by when
+        they were uploaded. Saving a spot without changing any of those
+        leaves its etag, and its cache entries, as they were.
+        """
+        # Anything prefetched may be out of date
+        self.__dict__.pop("_prefetched_objects_cache", None)
+        prefetch_related_objects([self], *Spot.JSON_PREFETCH)
+        etag = self._prefetched_etag()
+        self.__dict__.pop("_prefetched_objects_cache", None)
+        return etag
+
+    def _prefetched_etag(self):
+        """content_etag(), from the related rows already prefetched."""
+        spot_json = self._build_json_data_structure()
+
+        location = spot_json["location"]
+        for name in ("latitude", "longitude", "height_from_sea_level"):
+            if location[name] is not None:
+                # As the database has it, however it was given
+                places = self._meta.get_field(name).decimal_places
+                location[name] = Decimal(str(location[name])).quantize(
+                    Decimal(10) ** -places
+                )
+
+        items = dict((item.pk, item) for item in self.item_set.all())
+        spot_json.update(
+            {
+                "etag": None,
+                "last_modified": None,
+                "type": sorted(spot_json["type"]),
+                "images": sorted(
+                    [image.pk, image.etag]
+                    for image in self.spotimage_set.all()
+                ),
+                "items": sorted(
+                    (
+                        dict(
+                            item,
+                            images=sorted(
+                                [image.pk, image.etag]
+                                for image in items[
+                                    item["id"]
+                                ].itemimage_set.all()
+                            ),
+                        )
+                        for item in spot_json["items"]
+                    ),
+                    key=lambda item: item["id"],
+                ),
+            }
+        )
+        return content_etag(spot_json)
+
     def rest_url(self):
         return reverse("spot", kwargs={"spot_id": self.pk})
 
@@ -93,12 +225,250 @@ class Spot(models.Model):
         """
         Get a dictionary representing this spot which can be JSON encoded
         """
-        # If this data is cached, and the etags match, return the cached
-        # version.
-        cached_entry = cache.get(self.json_cache_key())
-        if cached_entry and cached_entry["etag"] == self.etag:
-            return cached_entry
+        return Spot.bulk_json_data_structure([self])[0]
+
+    @classmethod
+    def bulk_json_data_structure(cls, spots):
+        """
+        The same as calling json_data_structure() on each of the spots,
+        in order, but with one lookup in each tier of the spot cache for
+        all of them, one read of the SpotDocuments of the ones that
+        aren't cached, and one set of queries to build the ones without
+        an up to date document.
+        """
+        spots = list(spots)
+        found = {}
+        local = spot_cache.local_cache.get_many(spots)
+        for pk, document in local.items():
+            found[pk] = json.loads(document, use_decimal=True)
+        spot_cache.record("local", len(local), len(spots) - len(local))
+        remaining = [spot for spot in spots if spot.pk not in local]
+        if not remaining:
+            return [found[spot.pk] for spot in spots]
+
+        cached = cache.get_many([spot.json_cache_key() for spot in remaining])
+        misses = []
+        for spot in remaining:
+            cached_entry = cached.get(spot.json_cache_key())
+            if spot_cache.is_fresh(cached_entry, spot.etag):
+                found[spot.pk] = cached_entry[1]
+            else:
+                misses.append(spot)
+        spot_cache.record(
+            "shared", len(remaining) - len(misses), len(misses)
+        )
+
+        if misses:
+            started = time.perf_counter()
+            stored = SpotDocument.read(misses)
+            read = [spot for spot in misses if spot.pk in stored]
+            unbuilt = [spot for spot in misses if spot.pk not in stored]
+            spot_cache.record("document", len(read), len(unbuilt))
+            encoded = []
+            for spot in read:
+                found[spot.pk] = json.loads(stored[spot.pk], use_decimal=True)
+                encoded.append((spot, stored[spot.pk].encode("utf-8")))
+            delta = time.perf_counter() - started
+            cache.set_many(
+                dict(
+                    (
+                        spot.json_cache_key(),
+                        spot_cache.shared_entry(
+                            spot.etag, found[spot.pk], delta
+                        ),
+                    )
+                    for spot in read
+                )
+            )
+            if unbuilt:
+                built = cls._build_once(unbuilt)
+                for spot in unbuilt:
+                    found[spot.pk], document = built[spot.pk]
+                    encoded.append((spot, document))
+            spot_cache.local_cache.set_many(encoded)
+
+        return [found[spot.pk] for spot in spots]
+
+    @classmethod
+    def bulk_json_bytes(cls, spots):
+        """
+        Returns each spot's json_data_structure(), already encoded as
+        JSON bytes. The encoded form is cached with the etag it was
+        built from, so list responses can be put together from the
+        fragments without encoding anything again. A spot that isn't
+        in either tier of the spot cache is read from its SpotDocument,
+        which is already encoded.
+        """
+        spots = list(spots)
+        found = spot_cache.local_cache.get_many(spots)
+        spot_cache.record("local", len(found), len(spots) - len(found))
+        remaining = [spot for spot in spots if spot.pk not in found]
+        if not remaining:
+            return [found[spot.pk] for spot in spots]
+
+        cached = cache.get_many(
+            [spot.json_bytes_cache_key() for spot in remaining]
+        )
+        misses = []
+        for spot in remaining:
+            cached_entry = cached.get(spot.json_bytes_cache_key())
+            if spot_cache.is_fresh(cached_entry, spot.etag):
+                found[spot.pk] = cached_entry[1]
+            else:
+                misses.append(spot)
+        spot_cache.record(
+            "shared", len(remaining) - len(misses), len(misses)
+        )
+
+        if misses:
+            started = time.perf_counter()
+            stored = SpotDocument.read(misses)
+            read = [spot for spot in misses if spot.pk in stored]
+            unbuilt = [spot for spot in misses if spot.pk not in stored]
+            spot_cache.record("document", len(read), len(unbuilt))
+            for spot in read:
+                found[spot.pk] = stored[spot.pk].encode("utf-8")
+            delta = time.perf_counter() - started
+            cache.set_many(
+                dict(
+                    (
+                        spot.json_bytes_cache_key(),
+                        spot_cache.shared_entry(
+                            spot.etag, found[spot.pk], delta
+                        ),
+                    )
+                    for spot in read
+                )
+            )
+            if unbuilt:
+                built = cls._build_once(unbuilt)
+                for spot in unbuilt:
+                    found[spot.pk] = built[spot.pk][1]
+
+        spot_cache.local_cache.set_many(
+            (spot, found[spot.pk]) for spot in remaining
+        )
+        return [found[spot.pk] for spot in spots]
+
+    @classmethod
+    def _build_documents(cls, spots, prefetched=False):
+        """
+        Builds the json_data_structure() of each of the spots, and saves
+        them as their SpotDocuments. Returns a list of the (spot,
+        structure, JSON document) of each. Pass prefetched=True if
+        everything in JSON_PREFETCH is already prefetched for them.
+        """
+        if not prefetched:
+            prefetch_related_objects(spots, *cls.JSON_PREFETCH)
+        built = []
+        for spot in spots:
+            spot_json = spot._build_json_data_structure()
+            built.append((spot, spot_json, json.dumps(spot_json)))
+        SpotDocument.write(
+            [(spot.pk, spot.etag, document) for spot, _, document in built]
+        )
+        return built
+
+    @classmethod
+    def _build_and_cache(cls, spots, prefetched=False):
+        """
+        Builds the spots' documents with _build_documents(), and puts
+        them in both of their shared cache entries. Returns a dict of
+        spot id to the (structure, JSON bytes) of each.
+        """
+        started = time.perf_counter()
+        built = cls._build_documents(spots, prefetched)
+        delta = time.perf_counter() - started
+
+        documents = {}
+        entries = {}
+        for spot, spot_json, document in built:
+            document = document.encode("utf-8")
+            documents[spot.pk] = (spot_json, document)
+            entries[spot.json_cache_key()] = spot_cache.shared_entry(
+                spot.etag, spot_json, delta
+            )
+            entries[spot.json_bytes_cache_key()] = spot_cache.shared_entry(
+                spot.etag, document, delta
+            )
+        cache.set_many(entries)
+        return documents
+
+    @classmethod
+    def _build_once(cls, spots):
+        """
+        The same as _build_and_cache(), but a spot that another request
+        is already building is waited for instead, and only built here
+        if its entries don't turn up in time. Keeps a burst of requests
+        for a changed spot from all building it at once.
+        """
+        documents = {}
+        leased, building = spot_cache.lease(spots)
+        if leased:
+            try:
+                documents.update(cls._build_and_cache(leased))
+            finally:
+                spot_cache.release(leased)
+
+        if building:
+            waited = spot_cache.wait_for(building, Spot.json_bytes_cache_key)
+            for pk, document in waited.items():
+                spot_json = json.loads(document, use_decimal=True)
+                documents[pk] = (spot_json, document)
+            late = [spot for spot in building if spot.pk not in waited]
+            if late:
+                documents.update(cls._build_and_cache(late))
+        return documents
+
+    def save_document(self):
+        """
+        Brings this spot's etag up to date, rebuilds its SpotDocument
+        and cache entries from the database, and returns its
+        json_data_structure(), all from one read of its related rows.
+        Write paths call this once everything in the spot's document is
+        saved, in the same transaction; that includes what's written
+        without saving the spot, like its types, items and images. In a
+        deferred_refresh() block, the spot isn't brought up to date
+        again at the end.
+        """
+        spot = Spot.objects.prefetch_related(*Spot.JSON_PREFETCH).get(
+            pk=self.pk
+        )
+        spot._save_etag(spot._prefetched_etag())
+        if _related_writes.deferred is not None:
+            _related_writes.deferred.discard(spot.pk)
+        self.etag = spot.etag
+        self.last_modified = spot.last_modified
+        built = Spot._build_and_cache([spot], prefetched=True)
+        spot_json, document = built[spot.pk]
+        spot_cache.local_cache.set_many([(spot, document)])
+        return spot_json
 
+    @classmethod
+    def stream_json_bytes(cls, spots, chunk_size=None):
+        """
+        Yields bulk_json_bytes() for chunk_size spots at a time, so that
+        only one chunk of spots is serialized in memory at once. Pass a
+        queryset's iterator() to avoid loading every spot up front.
+        """
+        if chunk_size is None:
+            chunk_size = getattr(settings, "SPOTSEEKER_STREAM_CHUNK_SIZE", 200)
+
+        chunk = []
+        for spot in spots:
+            chunk.append(spot)
+            if len(chunk) >= chunk_size:
+                yield cls.bulk_json_bytes(chunk)
+                chunk = []
+        if chunk:
+            yield cls.bulk_json_bytes(chunk)
+
+    def _build_json_data_structure(self):
+        """
+        Builds the dictionary for json_data_structure() from the
+        database. Only uses all() on related managers, so anything
+        in JSON_PREFETCH that was prefetched isn't queried again.
+        """
         extended_info = {}
         info = self.spotextendedinfo_set.all()
         for attr in info:
@@ -114,13 +484,20 @@ class Spot(models.Model):
             "sunday": [],
         }
 
-        hours = self.spotavailablehours_set.order_by("start_time")
+        hours = sorted(
+            self.spotavailablehours_set.all(),
+            key=lambda window: window.start_time,
+        )
         for window in hours:
             available_hours[window.get_day_display()].append(
                 window.json_data_structure()
             )
 
-        images_set = self.spotimage_set.order_by("display_index")
+        # Same order as the database gives, with unindexed images first
+        images_set = sorted(
+            self.spotimage_set.all(),
+            key=lambda img: (img.display_index is not None, img.display_index),
+        )
         images = [img.json_data_structure() for img in images_set]
 
         types = [t.name for t in self.spottypes.all()]
@@ -157,14 +534,8 @@ class Spot(models.Model):
             "last_modified": self.last_modified.isoformat(),
             "external_id": self.external_id,
         }
-        # Add this spot's data to the cache
-        cache.set(self.json_cache_key(), spot_json)
         return spot_json
 
-    def delete(self, *args, **kwargs):
-        self.invalidate_cache()
-        super(Spot, self).delete(*args, **kwargs)
-
     @classmethod
     def get_with_external(cls, spot_id):
         if spot_id and str(spot_id).startswith("external:"):
@@ -173,6 +544,96 @@ class Spot(models.Model):
             return cls.objects.get(pk=spot_id)
 
 
+class SpotDocument(models.Model):
+    """
+    A Spot's json_data_structure(), JSON encoded, as of the spot's etag.
+    Rewritten along with the spot, so that a spot that isn't in the
+    cache costs one read rather than the queries to build it again. A
+    document whose etag isn't the spot's is out of date, and is rebuilt
+    the next time the spot is read.
+    """
+
+    spot = models.OneToOneField(Spot, primary_key=True)
+    etag = models.CharField(max_length=40)
+    document = models.TextField()
+
+    def __unicode__(self):
+        return "%s[%s]" % (self.spot_id, self.etag)
+
+    def __str__(self):
+        return self.__unicode__()
+
+    @classmethod
+    def read(cls, spots):
+        """
+        Returns a dict of spot id to the JSON document of each of the
+        spots whose SpotDocument is up to date.
+        """
+        etags = dict((spot.pk, spot.etag) for spot in spots)
+        rows = cls.objects.filter(spot_id__in=list(etags)).values_list(
+            "spot_id", "etag", "document"
+        )
+        return dict(
+            (spot_id, document)
+            for spot_id, etag, document in rows
+            if etag == etags[spot_id]
+        )
+
+    @classmethod
+    def write(cls, documents):
+        """Saves a list of (spot id, etag, JSON document)s."""
+        spot_ids = [spot_id for spot_id, etag, document in documents]
+        try:
+            with transaction.atomic():
+                cls.objects.filter(spot_id__in=spot_ids).delete()
+                cls.objects.bulk_create(
+                    [
+                        cls(spot_id=spot_id, etag=etag, document=document)
+                        for spot_id, etag, document in documents
+                    ]
+                )
+        except IntegrityError:
+            # Another request saved them first
+            pass
+
+
+class SpotTombstone(models.Model):
+    """
+    Records that a spot was deleted, so the clients syncing changes at
+    /api/v1/spot/changes can drop it too.
+    """
+
+    spot_id = models.IntegerField()
+    deleted = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    @staticmethod
+    def kept_since():
+        """
+        Returns the moment from which tombstones are kept, by
+        SPOTSEEKER_TOMBSTONE_RETENTION (seconds, 30 days by default), or
+        None if they're kept forever.
+        """
+        retention = getattr(
+            settings, "SPOTSEEKER_TOMBSTONE_RETENTION", 30 * 24 * 60 * 60
+        )
+        if retention is None:
+            return None
+        return timezone.now() - timedelta(seconds=retention)
+
+    @classmethod
+    def prune(cls):
+        """Deletes the tombstones older than kept_since()."""
+        kept_since = cls.kept_since()
+        if kept_since is not None:
+            cls.objects.filter(deleted__lt=kept_since).delete()
+
+    def __unicode__(self):
+        return "%s deleted %s" % (self.spot_id, self.deleted)
+
+    def __str__(self):
+        return self.__unicode__()
+
+
 class SpotAvailableHours(models.Model):
     """The hours a Spot is available, i.e. the open or closed hours for
     the building the spot is located in.
@@ -232,7 +693,6 @@ class SpotAvailableHours(models.Model):
                 self.start_time = min(h.start_time, self.start_time)
                 self.end_time = max(h.end_time, self.end_time)
                 h.delete()
-        self.spot.save()  # Update the spot's last_modified
         super(SpotAvailableHours, self).save(*args, **kwargs)
 
 
@@ -258,7 +718,6 @@ class SpotExtendedInfo(models.Model):
 
     def save(self, *args, **kwargs):
         self.full_clean()
-        self.spot.save()  # Update the last_modified on the spot
         super(SpotExtendedInfo, self).save(*args, **kwargs)
 
 
@@ -315,7 +774,6 @@ class SpotImage(models.Model):
             "display_index": self.display_index,
         }
 
-    @update_etag
     def save(self, *args, **kwargs):
         try:
             if (
@@ -333,17 +791,150 @@ class SpotImage(models.Model):
 
         self.content_type = SpotImage.CONTENT_TYPES[img.format]
         self.width, self.height = img.size
+        self.etag = content_etag(
+            [
+                self.description,
+                self.display_index,
+                self.upload_user,
+                self.upload_application,
+            ],
+            [self.image],
+        )
 
-        self.spot.invalidate_cache()
-        super(SpotImage, self).save(*args, **kwargs)
+        with transaction.atomic():
+            super(SpotImage, self).save(*args, **kwargs)
+            self.spot.save_document()
 
-    @update_etag
     def delete(self, *args, **kwargs):
-        self.spot.invalidate_cache()
         self.image.delete(save=False)
-        super(SpotImage, self).delete(*args, **kwargs)
+        with transaction.atomic():
+            super(SpotImage, self).delete(*args, **kwargs)
+            self.spot.save_document()
 
     def rest_url(self):
         return reverse(
             "spot-image", kwargs={"spot_id": self.spot.pk, "image_id": self.pk}
         )
+
+
+class _RelatedWrites(threading.local):
+    def __init__(self):
+        # Spots being deleted, along with their related rows
+        self.deleting = set()
+        # Spots written to in a deferred_refresh() block
+        self.deferred = None
+
+
+_related_writes = _RelatedWrites()
+
+
+def refresh_now(spot_id):
+    """
+    Whether a spot needs its etag brought up to date now, after a write
+    to one of the related rows in its document. Not if it's being
+    deleted, nor in a deferred_refresh() block, which brings it up to
+    date at the end instead.
+    """
+    if spot_id is None or spot_id in _related_writes.deleting:
+        return False
+    if _related_writes.deferred is not None:
+        _related_writes.deferred.add(spot_id)
+        return False
+    return True
+
+
+def refresh_spot(spot_id):
+    """
+    Brings a spot's etag, and with it its last_modified, up to date
+    with its related rows. Its SpotDocument and cache entries stop
+    matching, and are rebuilt the next time it's read.
+    """
+    if refresh_now(spot_id):
+        for spot in Spot.objects.filter(pk=spot_id):
+            spot.save()
+
+
+@contextmanager
+def deferred_refresh():
+    """
+    Brings the spots whose related rows are written in the block up to
+    date once, at the end, rather than after each write.
+    """
+    if _related_writes.deferred is not None:
+        yield
+        return
+
+    _related_writes.deferred = set()
+    try:
+        yield
+        spot_ids = _related_writes.deferred
+    finally:
+        _related_writes.deferred = None
+    for spot in Spot.objects.filter(pk__in=spot_ids):
+        spot.save()
+
+
+@receiver(
+    pre_delete, sender=Spot, dispatch_uid="spotseeker_server.spot.deleting"
+)
+def _spot_deleting(sender, instance, **kwargs):
+    _related_writes.deleting.add(instance.pk)
+
+
+@receiver(
+    post_delete, sender=Spot, dispatch_uid="spotseeker_server.spot.deleted"
+)
+def _spot_deleted(sender, instance, **kwargs):
+    _related_writes.deleting.discard(instance.pk)
+    # Here rather than in Spot.delete(), so deleting a queryset of
+    # spots leaves their tombstones too; it's in the same transaction
+    instance.invalidate_cache()
+    SpotTombstone.prune()
+    SpotTombstone.objects.create(spot_id=instance.pk)
+
+
+@receiver(
+    post_save,
+    sender=SpotAvailableHours,
+    dispatch_uid="spotseeker_server.spot.hours_saved",
+)
+@receiver(
+    post_delete,
+    sender=SpotAvailableHours,
+    dispatch_uid="spotseeker_server.spot.hours_deleted",
+)
+@receiver(
+    post_save,
+    sender=SpotExtendedInfo,
+    dispatch_uid="spotseeker_server.spot.extended_info_saved",
+)
+@receiver(
+    post_delete,
+    sender=SpotExtendedInfo,
+    dispatch_uid="spotseeker_server.spot.extended_info_deleted",
+)
+def _spot_row_changed(sender, instance, **kwargs):
+    # Through the row's own spot, so that its etag is up to date too
+    if refresh_now(instance.spot_id):
+        instance.spot.save()
+
+
+@receiver(
+    m2m_changed,
+    sender=Spot.spottypes.through,
+    dispatch_uid="spotseeker_server.spot.spottypes_changed",
+)
+def _spottypes_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action.startswith("post_") and refresh_now(instance.pk):
+            instance.save()
+    elif action == "pre_clear":
+        # Which spots the type is being taken off
+        instance._cleared_spot_ids = list(
+            instance.spots.values_list("pk", flat=True)
+        )
+    elif action.startswith("post_"):
+        if action == "post_clear":
+            pk_set = instance.__dict__.pop("_cleared_spot_ids", ())
+        for spot_id in pk_set:
+            refresh_spot(spot_id)
@@ -1,18 +1,17 @@
 # Copyright 2026 UW-IT, University of Washington
 # SPDX-License-Identifier: Apache-2.0
 
-from functools import wraps
 import hashlib
-import random
-import time
 
+import simplejson as json
 
-def update_etag(func):
-    """Any model with an ETag can decorate an instance method with
-    this to have a new ETag automatically generated. It's up to the
-    wrapped function, however, to call save()."""
-    def _newETag(self, *args, **kwargs):
-        self.etag = hashlib.sha1("{0} - {1}".format(random.random(),
-                                 time.time()).encode('utf-8')).hexdigest()
-        return func(self, *args, **kwargs)
-    return wraps(func)(_newETag)
+
+def content_etag(content, files=()):
+    """Returns the ETag of some content: a hash of its JSON encoding,
+    with dicts in key order, and of the bytes of any files. The same
+    content always has the same ETag, wherever it's computed."""
+    digest = hashlib.sha1(json.dumps(content, sort_keys=True).encode("utf-8"))
+    for f in files:
+        for chunk in f.chunks():
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -22,9 +22,106 @@
 """
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from spotseeker_server.explain import NO_EXPLAIN
+from spotseeker_server.index import catalog_version
+from spotseeker_server.index.extended_info import (
+    ExtendedInfoQuery,
+    extended_info_index,
+)
 from spotseeker_server.load_module import load_object_by_name
 
 
+class SearchPredicates(object):
+    """
+    Conditions on a search, declared by the search filters instead of
+    each filter narrowing the query itself. Keys are named the same way
+    as search parameters: a Spot field, such as "capacity", or
+    "extended_info:" followed by an extended info key.
+
+    Every filter in a chain declares its conditions on the same
+    instance, along with the search's own extended info conditions, so
+    the extended info index is consulted once for all of them and a
+    condition declared twice is only checked once.
+
+    Instance Variables:
+        info: the ExtendedInfoQuery for the extended info conditions.
+        includes: dict of Spot field to the values it must be one of.
+        excludes: dict of Spot field to the values it can't be, or to
+            None if the field must be empty.
+        ranges: dict of Spot field to its (minimum, maximum).
+    """
+
+    def __init__(self):
+        self.info = ExtendedInfoQuery()
+        self.includes = {}
+        self.excludes = {}
+        self.ranges = {}
+
+    def include(self, key, values):
+        """
+        Only spots with key set to one of values. Extended info is
+        matched ignoring case.
+        """
+        if key.startswith("extended_info:"):
+            self.info.has(key[14:], values)
+            return
+        values = set(values)
+        if key in self.includes:
+            values &= self.includes[key]
+        self.includes[key] = values
+
+    def exclude(self, key, values=None):
+        """
+        Leave out spots with key set to one of values, or with key set
+        at all if values is None. Extended info is matched ignoring
+        case.
+        """
+        if key.startswith("extended_info:"):
+            self.info.lacks(key[14:], values)
+        elif values is None or self.excludes.get(key, ()) is None:
+            self.excludes[key] = None
+        else:
+            self.excludes.setdefault(key, set()).update(values)
+
+    def range(self, key, minimum=None, maximum=None):
+        """Only spots with key set to a number from minimum to maximum."""
+        if key.startswith("extended_info:"):
+            self.info.between(key[14:], minimum, maximum)
+            return
+        low, high = self.ranges.get(key, (None, None))
+        if minimum is not None and (low is None or minimum > low):
+            low = minimum
+        if maximum is not None and (high is None or maximum < high):
+            high = maximum
+        self.ranges[key] = (low, high)
+
+    def filter(self, query, version=catalog_version, info=True):
+        """
+        Narrows a Spot queryset to the spots that meet every condition.
+        version is called for the catalog version if the extended info
+        index is needed, so a search can share one with its other
+        indexes. With info=False the conditions on extended info are
+        left to the caller.
+        """
+        if info and self.info:
+            query = extended_info_index.current(version()).filter(
+                query, self.info
+            )
+        for field, values in self.includes.items():
+            query = query.filter(**{field + "__in": values})
+        for field, values in self.excludes.items():
+            if values is None:
+                query = query.filter(**{field + "__isnull": True})
+            else:
+                query = query.exclude(**{field + "__in": values})
+        for field, (low, high) in self.ranges.items():
+            if low is not None:
+                query = query.filter(**{field + "__gte": low})
+            if high is not None:
+                query = query.filter(**{field + "__lte": high})
+        return query
+
+
 class SearchFilter(object):
     """
     A search filter base class. Implementers should subclass this and
@@ -46,6 +143,17 @@ class SearchFilter(object):
         self.request = request
         self.has_valid_search_param = False
 
+    def add_predicates(self, predicates):
+        """
+        Declares conditions on the search on predicates, a
+        SearchPredicates shared by every filter in the chain. Prefer
+        this to filter_query for conditions it can express; they're
+        merged with the other filters' and the search's own. Set
+        self.has_valid_search_param to True if you add a condition
+        that limits the search.
+        """
+        pass
+
     def filter_query(self, query):
         """
         Filters the model query before it is actualized. Set
@@ -102,20 +210,48 @@ class SearchFilterChain(object):
         for fclass in SearchFilterChain.filters:
             self.filters.append(fclass(request))
 
-    def filter_query(self, query):
+    def predicates(self, explain=NO_EXPLAIN):
+        """
+        Returns a SearchPredicates with the conditions declared by each
+        defined filter.
+        """
+        predicates = SearchPredicates()
+        for f in self.filters:
+            f.add_predicates(predicates)
+            explain.lap("%s.add_predicates" % self._filter_name(f))
+            if f.has_valid_search_param:
+                self.has_valid_search_param = True
+        return predicates
+
+    def filter_query(self, query, explain=NO_EXPLAIN):
         """Calls filter_query for each defined filter."""
         for f in self.filters:
             query = f.filter_query(query)
+            explain.lap("%s.filter_query" % self._filter_name(f))
             if f.has_valid_search_param:
                 self.has_valid_search_param = True
         return query
 
-    def filter_results(self, spots):
+    def filter_results(self, spots, explain=NO_EXPLAIN):
         """Calls filter_results for each defined filter."""
         for f in self.filters:
             spots = f.filter_results(spots)
+            explain.lap("%s.filter_results" % self._filter_name(f))
         return spots
 
+    def filters_results(self):
+        """
+        True if any defined filter redefines filter_results, and so
+        needs the spots themselves rather than their ids.
+        """
+        return any(
+            type(f).filter_results != SearchFilter.filter_results
+            for f in self.filters
+        )
+
+    def _filter_name(self, f):
+        return "%s.%s" % (f.__class__.__module__, f.__class__.__name__)
+
     def filters_key(self, key):
         return key in SearchFilterChain.keys
 
@@ -21,7 +21,6 @@
 """
 import logging
 import re
-from spotseeker_server.models import SpotExtendedInfo
 from spotseeker_server.org_filters import SearchFilter
 
 # UIUC LDAP
@@ -36,7 +35,7 @@ class Filter(SearchFilter):
         )
     )
 
-    def filter_query(self, query):
+    def add_predicates(self, predicates):
         """
         When searching on sample2, extend it in the following way:
 
@@ -53,15 +52,10 @@ class Filter(SearchFilter):
                     values.append("baz")
                 elif sample == "bar":
                     values.append("baz")
-                query = query.filter(
-                    spotextendedinfo__key="sample2",
-                    spotextendedinfo__value__in=values,
-                )
+                predicates.include("extended_info:sample2", values)
 
                 self.has_valid_search_param = True
 
-        return query
-
     def filter_results(self, spots):
         """
         Only include a spot if the query specified 'sample1'
@@ -8,7 +8,6 @@
         the search filter framework.
 """
 from spotseeker_server.org_filters import SearchFilter
-from django.db.models import Q
 
 
 class Filter(SearchFilter):
@@ -19,30 +18,22 @@ class Filter(SearchFilter):
         )
     )
 
-    def filter_query(self, query):
+    def add_predicates(self, predicates):
         """Filter based on reservable and noise_level."""
-
         if "extended_info:app_type" not in self.request.GET:
             self.has_valid_search_param = True
-            query = query.exclude(spotextendedinfo__key="app_type")
+            predicates.exclude("extended_info:app_type")
 
         if "extended_info:uwgroup" in self.request.GET:
             groups = self.request.GET.getlist("extended_info:uwgroup")
             if groups:
                 self.has_valid_search_param = True
-            or_q_obj = Q()
-            for group in groups:
-                or_q_obj |= Q(
-                    spotextendedinfo__key="uwgroup",
-                    spotextendedinfo__value=group,
-                )
-            query = query.filter(or_q_obj)
+                predicates.include("extended_info:uwgroup", groups)
 
         if "extended_info:reservable" in self.request.GET:
             self.has_valid_search_param = True
-            query = query.filter(
-                spotextendedinfo__key="reservable",
-                spotextendedinfo__value__in=["true", "reservations"],
+            predicates.include(
+                "extended_info:reservable", ["true", "reservations"]
             )
 
         if "extended_info:noise_level" in self.request.GET:
@@ -59,10 +50,5 @@ class Filter(SearchFilter):
             # excludes = all noise levels - chosen noise levels
             excludes.difference_update(included_levels)
 
-            for exclude in excludes:
-                query = query.exclude(
-                    spotextendedinfo__key="noise_level",
-                    spotextendedinfo__value__iexact=exclude,
-                )
-
-        return query
+            if excludes:
+                predicates.exclude("extended_info:noise_level", excludes)
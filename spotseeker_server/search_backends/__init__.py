@@ -0,0 +1,36 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" Pluggable search backends.
+
+    SearchView.filter_on_request() first offers each search to the
+    backend named by SPOTSEEKER_SEARCH_BACKEND. A backend can answer it
+    any way it likes, or hand it back to the view's own ORM search,
+    which is all the default backend does.
+"""
+
+from spotseeker_server.explain import NO_EXPLAIN
+from spotseeker_server.load_module import ModuleObjectLoader
+
+
+class ORMSearchBackend(object):
+    """
+    A search backend base class, which leaves every search to the ORM.
+    Implementers should subclass this and redefine filter_on_request.
+    """
+
+    def filter_on_request(
+        self, view, get_request, chain, request_meta, api, explain=NO_EXPLAIN
+    ):
+        """
+        Returns the spots found by a search, in the same order and with
+        the same errors as view.filter_on_request(), or None to leave
+        the search to the ORM. The search form has already been
+        validated, and get_request isn't empty.
+        """
+        return None
+
+
+class SearchBackend(ModuleObjectLoader):
+    setting_name = "SPOTSEEKER_SEARCH_BACKEND"
+    default = ORMSearchBackend
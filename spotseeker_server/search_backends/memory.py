@@ -0,0 +1,299 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" A search backend that answers searches from the in-memory indexes.
+
+    Every condition of a search becomes a SpotSet of the spots that meet
+    it (see index/spot_set.py), and the spots found are the ones in
+    all of them; the database is only asked for the spots to return,
+    and for the catalog version the indexes are checked against. The
+    results, and the errors, are the same as those of the ORM search in
+    SearchView.filter_on_request().
+
+    To use it:
+
+        SPOTSEEKER_SEARCH_BACKEND = (
+            "spotseeker_server.search_backends.memory.MemorySearchBackend"
+        )
+
+    Searches the indexes can't answer are left to the ORM: the
+    buildings api, search filters that redefine filter_query(), their
+    predicates on Spot fields other than those in index.spots.COLUMNS,
+    and search keys that fall through to an icontains filter.
+"""
+
+from django.conf import settings
+from pyproj.exceptions import GeodError
+
+from spotseeker_server.explain import NO_EXPLAIN
+from spotseeker_server.index import catalog_version
+from spotseeker_server.index.extended_info import (
+    ExtendedInfoQuery,
+    extended_info_index,
+)
+from spotseeker_server.index.geo import geod, spatial_index
+from spotseeker_server.index.hours import hours_index
+from spotseeker_server.index.spot_set import SpotSet
+from spotseeker_server.index.spots import COLUMNS, spot_index
+from spotseeker_server.index.text import SPOT_FIELDS, text_index
+from spotseeker_server.models import Spot
+from spotseeker_server.org_filters import SearchFilter
+from spotseeker_server.search_backends import ORMSearchBackend
+from spotseeker_server.views.rest_dispatch import RESTException
+from spotseeker_server.views.search import HOURS_KEYS, ITEM_FIELDS
+
+# The search keys that are only read along with another key
+PASSED_KEYS = (
+    "campus",
+    "expand_radius",
+    "distance",
+    "center_latitude",
+    "center_longitude",
+    "limit",
+)
+
+
+class MemorySearchBackend(ORMSearchBackend):
+    def filter_on_request(
+        self, view, get_request, chain, request_meta, api, explain=NO_EXPLAIN
+    ):
+        if not self.can_search(get_request, chain, api):
+            return None
+
+        version = catalog_version()
+        spots = spot_index.current(version)
+        info_index = extended_info_index.current(version)
+        explain.lap("memory.version")
+
+        predicates = chain.predicates(explain)
+        if not self.can_filter(predicates):
+            return None
+        has_valid_search_param = chain.has_valid_search_param
+
+        info = predicates.info
+        found = spots.data.everything
+        either = []
+        ranked = None
+
+        hours, hours_limit_search = view.hours_query(get_request)
+        if hours_limit_search:
+            has_valid_search_param = True
+
+        for key in get_request:
+            if (
+                key.startswith("oauth_")
+                or key in PASSED_KEYS
+                or key in HOURS_KEYS
+                or chain.filters_key(key)
+            ):
+                continue
+
+            values = get_request.getlist(key)
+            if key == "q":
+                if get_request["q"].strip():
+                    ranked = text_index.current(version).search(
+                        get_request["q"]
+                    )
+                    found &= SpotSet.of(ranked)
+                    has_valid_search_param = True
+            elif key == "capacity":
+                try:
+                    capacity = int(get_request["capacity"])
+                except ValueError:
+                    continue
+                found &= spots.with_capacity(capacity)
+                has_valid_search_param = True
+            elif key == "type":
+                found &= spots.of_type(values)
+                has_valid_search_param = True
+            elif key == "building_name":
+                found &= spots.in_building(values)
+                has_valid_search_param = True
+            elif key.startswith("item:extended_info:"):
+                either.append(spots.with_item_info(key[19:], values))
+                has_valid_search_param = True
+            elif key.startswith("item:"):
+                field = ITEM_FIELDS.get(key[5:])
+                if field == "id":
+                    try:
+                        values = [int(value) for value in values]
+                    except ValueError:
+                        # The database would turn these down
+                        continue
+                if field is not None:
+                    either.append(spots.with_item(field, values))
+                has_valid_search_param = True
+            elif key.startswith("extended_info:or_group"):
+                info.has_any([(value, "true") for value in values])
+                has_valid_search_param = True
+            elif key.startswith("extended_info:or"):
+                or_info = ExtendedInfoQuery()
+                or_info.has(key[17:], ["true"])
+                either.append(info_index.matching_spots(or_info))
+                has_valid_search_param = True
+            elif key.startswith("extended_info:"):
+                info.has(key[14:], values)
+                has_valid_search_param = True
+            elif key == "id":
+                try:
+                    found &= SpotSet.of(int(value) for value in values)
+                except ValueError:
+                    # The ORM raises this as it is
+                    return None
+                has_valid_search_param = True
+            elif key in SPOT_FIELDS:
+                found &= SpotSet.of(
+                    text_index.current(version).containing(
+                        key, get_request[key]
+                    )
+                )
+                has_valid_search_param = True
+            else:
+                return None
+
+        found &= self._predicate_spots(predicates, spots, info_index)
+        if hours:
+            found &= SpotSet.of(hours_index.current(version).matching(hours))
+        if either:
+            found &= SpotSet.union(either)
+        explain.lap("memory.filter")
+
+        limit = int(get_request.get("limit", 20))
+        if (
+            "distance" in get_request
+            and "center_longitude" in get_request
+            and "center_latitude" in get_request
+        ):
+            try:
+                lon = get_request["center_longitude"]
+                lat = get_request["center_latitude"]
+                dist = get_request["distance"]
+                top = geod.fwd(lon, lat, 0, dist)
+                right = geod.fwd(lon, lat, 90, dist)
+                bottom = geod.fwd(lon, lat, 180, dist)
+                left = geod.fwd(lon, lat, 270, dist)
+
+                nearby = SpotSet.of(
+                    spatial_index.current(version).within_box(
+                        float("%.8f" % bottom[1]),
+                        float("%.8f" % top[1]),
+                        float("%.8f" % left[0]),
+                        float("%.8f" % right[0]),
+                    )
+                )
+                has_valid_search_param = True
+
+                if "expand_radius" not in get_request or found & nearby:
+                    found &= nearby
+                else:
+                    if "limit" not in get_request or not limit:
+                        limit = 10
+                    nearest = spatial_index.current(version).nearest_matching(
+                        lon,
+                        lat,
+                        limit,
+                        found.filter,
+                        getattr(
+                            settings, "SPOTSEEKER_SEARCH_MAX_DISTANCE", None
+                        ),
+                    )
+                    found = SpotSet.of(pk for pk, dist in nearest)
+            except (TypeError, ValueError, GeodError):
+                # A center or distance that isn't a number is ignored,
+                # as the ORM search ignores it
+                pass
+        elif (
+            "distance" in get_request
+            or "center_longitude" in get_request
+            or "center_latitude" in get_request
+        ):
+            raise RESTException(
+                "Must specify latitude, longitude, and distance", 400
+            )
+        explain.lap("memory.distance")
+
+        if not has_valid_search_param:
+            raise RESTException(
+                "missing required parameters for this type of search", 400
+            )
+
+        found_ids = found.ids()
+        if 0 < limit < len(found_ids):
+            has_center = (
+                "center_latitude" in get_request
+                and "center_longitude" in get_request
+            )
+            center = view.center(get_request)
+            if ranked is not None and not has_center:
+                found_ids = found.filter(ranked)[:limit]
+            elif center is None:
+                raise RESTException(
+                    "missing required parameters for this type of search",
+                    400,
+                )
+            else:
+                found_ids = spatial_index.current(version).nearest(
+                    center[0], center[1], found_ids, limit
+                )
+        explain.lap("memory.limit")
+
+        if limit == 0 and not chain.filters_results():
+            return view.spots_in_order(
+                found_ids, get_request, ranked, version, explain
+            )
+
+        spots = set(
+            Spot.objects.filter(pk__in=found_ids).prefetch_related(
+                "spotextendedinfo_set"
+            )
+        )
+        explain.lap("sql")
+        return view.order_results(spots, get_request, chain, ranked, explain)
+
+    def can_search(self, get_request, chain, api):
+        """False if the search has to be left to the ORM."""
+        if api != "spot":
+            return False
+        for f in chain.filters:
+            if type(f).filter_query is not SearchFilter.filter_query:
+                return False
+        return True
+
+    def can_filter(self, predicates):
+        """False if the predicates are on fields that aren't indexed."""
+        fields = (
+            set(predicates.includes)
+            | set(predicates.excludes)
+            | set(predicates.ranges)
+        )
+        if not fields.issubset(COLUMNS):
+            return False
+        return set(predicates.ranges).issubset(["capacity"])
+
+    def _predicate_spots(self, predicates, spots, info_index):
+        """Returns the SpotSet of spots that meet every predicate."""
+        found = info_index.matching_spots(predicates.info)
+        for field, values in predicates.includes.items():
+            values = set(str(value) for value in values)
+            found &= spots.matching_column(
+                field, lambda value: str(value) in values
+            )
+        for field, values in predicates.excludes.items():
+            if values is None:
+                found &= spots.matching_column(
+                    field, lambda value: value is None
+                )
+            else:
+                values = set(str(value) for value in values)
+                found &= spots.matching_column(
+                    field,
+                    lambda value: value is None or str(value) not in values,
+                )
+        for field, (low, high) in predicates.ranges.items():
+            found &= spots.matching_column(
+                field,
+                lambda value: value is not None
+                and (low is None or value >= low)
+                and (high is None or value <= high),
+            )
+        return found
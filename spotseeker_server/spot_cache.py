@@ -0,0 +1,212 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" The per-process tier of the spot cache.
+
+    Spot.bulk_json_bytes() and bulk_json_data_structure() look for a
+    spot's encoded JSON here first, then in the shared cache, then in
+    its SpotDocument, and only build it if it's in none of them. An
+    entry holds the etag and last_modified of the spot it was built
+    from, and is only used while the spot still has them, so nothing
+    has to be invalidated across processes: a changed spot's entry just
+    stops being used, and is evicted in its turn.
+
+    The cache holds up to SPOTSEEKER_LOCAL_CACHE_SIZE spots (1000 by
+    default; 0 turns it off), and drops the least recently used first.
+    stats() has the hits and misses of each tier, to size it by.
+
+    Entries in the shared tier are made by shared_entry(), which notes
+    when they expire and how long they took to make. is_fresh() lets
+    one request now and then refresh an entry before it expires, more
+    likely the closer it is to expiring and the longer it takes to
+    make, so that a popular spot's entry doesn't expire under every
+    request at once. SPOTSEEKER_EARLY_REFRESH scales how early (1 by
+    default; 0 turns it off).
+
+    Building a spot's document is the expensive miss, so only one
+    request builds each one at a time: lease() takes a short lease on
+    it in the shared cache, and requests that don't get it wait_for()
+    the entry the builder leaves, rather than building it too.
+"""
+
+from collections import OrderedDict
+import math
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+TIERS = ("local", "shared", "document")
+
+# Seconds before the lease on a build is given up, if its request dies
+LEASE_TIMEOUT = 30
+# Seconds between looks in the shared cache while waiting on a build
+POLL_INTERVAL = 0.05
+
+
+class LocalCache(object):
+    """
+    A size-bounded, least recently used map of spot id to the spot's
+    JSON bytes, shared by the threads of the process.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def size(self):
+        """The most spots to hold; 0 turns the cache off."""
+        return getattr(settings, "SPOTSEEKER_LOCAL_CACHE_SIZE", 1000)
+
+    def get_many(self, spots):
+        """
+        Returns a dict of spot id to the JSON bytes of each of the
+        spots with an up to date entry.
+        """
+        found = {}
+        if not self.size():
+            return found
+        with self._lock:
+            for spot in spots:
+                entry = self._entries.get(spot.pk)
+                if entry is not None and entry[:2] == (
+                    spot.etag,
+                    spot.last_modified,
+                ):
+                    self._entries.move_to_end(spot.pk)
+                    found[spot.pk] = entry[2]
+        return found
+
+    def set_many(self, documents):
+        """Stores a list of (spot, JSON bytes)."""
+        size = self.size()
+        if not size:
+            return
+        with self._lock:
+            for spot, document in documents:
+                self._entries[spot.pk] = (
+                    spot.etag,
+                    spot.last_modified,
+                    document,
+                )
+                self._entries.move_to_end(spot.pk)
+            while len(self._entries) > size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+local_cache = LocalCache()
+
+_stats = dict((tier, {"hits": 0, "misses": 0}) for tier in TIERS)
+_stats_lock = threading.Lock()
+
+
+def record(tier, hits, misses):
+    """Counts the hits and misses of a lookup in one of the TIERS."""
+    with _stats_lock:
+        _stats[tier]["hits"] += hits
+        _stats[tier]["misses"] += misses
+
+
+def stats():
+    """
+    Returns the hits and misses of each tier since the process started,
+    and the number of spots in the local tier.
+    """
+    with _stats_lock:
+        counts = dict((tier, dict(_stats[tier])) for tier in TIERS)
+    counts["local"]["size"] = len(local_cache)
+    return counts
+
+
+def reset_stats():
+    with _stats_lock:
+        for tier in TIERS:
+            _stats[tier].update(hits=0, misses=0)
+
+
+def shared_entry(etag, value, delta):
+    """
+    The shared cache entry for a spot's value at etag, which took delta
+    seconds to make.
+    """
+    timeout = cache.default_timeout
+    expires = None if timeout is None else time.time() + timeout
+    return (etag, value, expires, delta)
+
+
+def is_current(entry, etag):
+    """Whether a shared cache entry is for the spot at etag."""
+    return isinstance(entry, tuple) and len(entry) == 4 and entry[0] == etag
+
+
+def is_fresh(entry, etag):
+    """
+    Whether a shared cache entry can be used for the spot at etag,
+    rather than being refreshed early.
+    """
+    if not is_current(entry, etag):
+        return False
+    expires, delta = entry[2:]
+    if expires is None:
+        return True
+    beta = getattr(settings, "SPOTSEEKER_EARLY_REFRESH", 1)
+    # -log(u) for u in (0, 1] is usually small, now and then large
+    early = -delta * beta * math.log(1.0 - random.random())
+    return time.time() + early < expires
+
+
+def _lease_key(spot):
+    return "Spot:%s:%s:build" % (spot.pk, spot.etag)
+
+
+def lease(spots):
+    """
+    Takes the lease on building each of the spots' documents at their
+    current etags. Returns the spots leased, and the spots another
+    request is building.
+    """
+    leased = []
+    building = []
+    for spot in spots:
+        if cache.add(_lease_key(spot), True, LEASE_TIMEOUT):
+            leased.append(spot)
+        else:
+            building.append(spot)
+    return leased, building
+
+
+def release(spots):
+    cache.delete_many([_lease_key(spot) for spot in spots])
+
+
+def wait_for(spots, key):
+    """
+    Waits up to SPOTSEEKER_BUILD_WAIT seconds (1 by default) for the
+    spots' shared cache entries, under key(spot), to be made at their
+    current etags. Returns a dict of spot id to the value of each entry
+    that turned up.
+    """
+    found = {}
+    wait = getattr(settings, "SPOTSEEKER_BUILD_WAIT", 1)
+    deadline = time.monotonic() + wait
+    while spots and time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        cached = cache.get_many([key(spot) for spot in spots])
+        waiting = []
+        for spot in spots:
+            entry = cached.get(key(spot))
+            if is_current(entry, spot.etag):
+                found[spot.pk] = entry[1]
+            else:
+                waiting.append(spot)
+        spots = waiting
+    return found
@@ -55,6 +55,7 @@ class SpotServerTestCase(TestCase):
     def tearDownClass(cls):
         """Clean up all created spots when the test case is done"""
         Spot.objects.all().delete()
+        super(SpotServerTestCase, cls).tearDownClass()
 
     # Defining these as static so they can be used in a setUpClass
     @staticmethod
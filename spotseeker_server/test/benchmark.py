@@ -0,0 +1,48 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from spotseeker_server.benchmark import (
+    SCENARIOS,
+    generate_catalog,
+    run_scenarios,
+)
+from spotseeker_server.models import (
+    Item,
+    Spot,
+    SpotAvailableHours,
+    SpotExtendedInfo,
+)
+
+
+@override_settings(SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok")
+class SearchBenchmarkTest(TestCase):
+    def test_generate_catalog(self):
+        generate_catalog(50, seed=1)
+        self.assertEqual(Spot.objects.count(), 50)
+        self.assertTrue(SpotAvailableHours.objects.exists())
+        self.assertEqual(
+            SpotExtendedInfo.objects.filter(key="campus").count(), 50
+        )
+
+        # The same seed makes the same catalog
+        names = set(Spot.objects.values_list("building_name", flat=True))
+        Spot.objects.all().delete()
+        Item.objects.all().delete()
+        generate_catalog(50, seed=1)
+        self.assertEqual(
+            set(Spot.objects.values_list("building_name", flat=True)), names
+        )
+
+    def test_run_scenarios(self):
+        generate_catalog(50)
+        report = run_scenarios(repeat=2)
+        self.assertEqual(
+            sorted(report), sorted(name for name, params in SCENARIOS)
+        )
+        for name, result in report.items():
+            self.assertEqual(result["status"], 200, name)
+            self.assertTrue(result["p50_ms"] <= result["p99_ms"])
+            self.assertTrue(result["queries"] > 0)
@@ -0,0 +1,235 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from os.path import abspath, dirname
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils.http import http_date
+import mock
+
+from spotseeker_server.models import Spot
+from spotseeker_server.views.rest_dispatch import JSONResponse, RESTDispatch
+
+TEST_ROOT = abspath(dirname(__file__))
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_SPOT_FORM="spotseeker_server.default_forms.spot."
+    "DefaultSpotForm",
+)
+class ConditionalGETTest(TestCase):
+    """GET and HEAD honor If-None-Match and If-Modified-Since."""
+
+    def setUp(self):
+        self.spots = [
+            Spot.objects.create(
+                name="Spot %s" % i,
+                capacity=i,
+                latitude=55,
+                longitude=30,
+                building_name="Building %s" % i,
+            )
+            for i in range(3)
+        ]
+        self.url = "/api/v1/spot/%s" % self.spots[0].pk
+
+    def assertNotModified(self, url, params=None, **headers):
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        response = self.client.get(
+            url, params or {}, HTTP_IF_NONE_MATCH=etag, **headers
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        return etag
+
+    def test_spot(self):
+        etag = self.assertNotModified(self.url)
+        self.assertEqual(etag, self.spots[0].etag)
+
+        # Any of a list, and weak or quoted forms of it
+        for if_none_match in ('"other", %s' % etag, 'W/"%s"' % etag, "*"):
+            response = self.client.get(
+                self.url, HTTP_IF_NONE_MATCH=if_none_match
+            )
+            self.assertEqual(response.status_code, 304)
+
+        self.spots[0].name = "Renamed"
+        self.spots[0].save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_if_modified_since(self):
+        response = self.client.get(self.url)
+        last_modified = response["Last-Modified"]
+
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=last_modified
+        )
+        self.assertEqual(response.status_code, 304)
+
+        earlier = self.spots[0].last_modified.timestamp() - 60
+        response = self.client.get(
+            self.url, HTTP_IF_MODIFIED_SINCE=http_date(earlier)
+        )
+        self.assertEqual(response.status_code, 200)
+
+        # If-None-Match wins over If-Modified-Since
+        response = self.client.get(
+            self.url,
+            HTTP_IF_NONE_MATCH='"other"',
+            HTTP_IF_MODIFIED_SINCE=last_modified,
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_if_match_is_ignored(self):
+        response = self.client.get(self.url, HTTP_IF_MATCH='"other"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_head(self):
+        get = self.client.get(self.url)
+        with mock.patch.object(Spot, "json_data_structure") as serialize:
+            response = self.client.head(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"")
+        self.assertEqual(response["ETag"], get["ETag"])
+        self.assertEqual(response["Content-Type"], get["Content-Type"])
+        # Answered from the etag, without serializing the spot
+        self.assertFalse(serialize.called)
+        self.assertNotIn("Content-Length", response)
+
+        response = self.client.head(
+            self.url, HTTP_IF_NONE_MATCH=get["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_head_search(self):
+        params = {"capacity": "1", "limit": "2"}
+        get = self.client.get("/api/v1/spot", params)
+        with mock.patch.object(Spot, "bulk_json_bytes") as serialize:
+            response = self.client.head("/api/v1/spot", params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], get["ETag"])
+        self.assertFalse(serialize.called)
+
+    def test_head_skips_streamed_body(self):
+        response = self.client.head("/api/v1/spot/all")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"")
+        self.assertIn("ETag", response)
+        self.assertNotIn("Content-Length", response)
+
+    def test_head_built_body(self):
+        """A body built for a HEAD is dropped, keeping its headers."""
+        get = JSONResponse({"name": "Spot"})
+        get.set_cookie("session", "value")
+        head = RESTDispatch()._without_body(get)
+        self.assertEqual(head.content, b"")
+        self.assertEqual(int(head["Content-Length"]), len(get.content))
+        self.assertEqual(head.cookies["session"].value, "value")
+
+    def test_all_spots(self):
+        etag = self.assertNotModified("/api/v1/spot/all")
+        ndjson = self.client.get(
+            "/api/v1/spot/all", HTTP_ACCEPT="application/x-ndjson"
+        )
+        self.assertNotEqual(ndjson["ETag"], etag)
+        self.assertIn("Accept", ndjson["Vary"])
+
+        self.spots[1].capacity = 10
+        self.spots[1].save()
+        response = self.client.get(
+            "/api/v1/spot/all", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_search(self):
+        params = {"capacity": "1", "limit": "2"}
+        etag = self.assertNotModified("/api/v1/spot", params)
+
+        # A different set of spots found is a different list
+        response = self.client.get(
+            "/api/v1/spot",
+            {"capacity": "2", "limit": "2"},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.spots[2].name = "Renamed"
+        self.spots[2].save()
+        response = self.client.get(
+            "/api/v1/spot", params, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_unbounded_search(self):
+        self.assertNotModified("/api/v1/spot", {"capacity": "0", "limit": "0"})
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "conditional_get_test",
+            }
+        }
+    )
+    def test_cached_search(self):
+        cache.clear()
+        params = {"capacity": "0", "limit": "0"}
+        etag = self.client.get("/api/v1/spot", params)["ETag"]
+
+        # The results come from the cache now, and so do their etags
+        response = self.client.get(
+            "/api/v1/spot", params, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_buildings_schema_facets(self):
+        self.assertNotModified("/api/v1/buildings")
+        self.assertNotModified("/api/v1/schema")
+        self.assertNotModified("/api/v1/spot/facets", {"capacity": "1"})
+
+    def test_image_and_thumbnail(self):
+        directory = tempfile.mkdtemp()
+        try:
+            with self.settings(MEDIA_ROOT=directory):
+                with open("%s/resources/test_gif.gif" % TEST_ROOT, "rb") as f:
+                    image = self.spots[0].spotimage_set.create(
+                        image=SimpleUploadedFile(
+                            "test_gif.gif", f.read(), "image/gif"
+                        ),
+                    )
+                url = "%s/image/%s" % (self.url, image.pk)
+
+                self.assertEqual(self.assertNotModified(url), image.etag)
+                etag = self.assertNotModified(url + "/thumb/10x10")
+                self.assertNotEqual(etag, image.etag)
+
+                with mock.patch(
+                    "spotseeker_server.views.thumbnail.Image.open"
+                ) as resize:
+                    response = self.client.head(url + "/thumb/10x10")
+                self.assertEqual(response["ETag"], etag)
+                self.assertFalse(resize.called)
+                response = self.client.head(url)
+                self.assertEqual(
+                    int(response["Content-Length"]), image.image.size
+                )
+
+                response = self.client.get(
+                    url + "/thumb/20x20", HTTP_IF_NONE_MATCH=etag
+                )
+                self.assertEqual(response.status_code, 200)
+        finally:
+            shutil.rmtree(directory)
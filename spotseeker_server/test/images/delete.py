@@ -223,7 +223,7 @@ class SpotImageDELETETest(TestCase):
             etag = response["ETag"]
 
             intermediate_img = SpotImage.objects.get(pk=self.gif.pk)
-            intermediate_img.name = "This interferes w/ the DELETE"
+            intermediate_img.description = "This interferes w/ the DELETE"
             intermediate_img.save()
 
             response = c.delete(self.gif_url, If_Match=etag)
@@ -237,7 +237,7 @@ class SpotImageDELETETest(TestCase):
             etag = response["ETag"]
 
             intermediate_img = SpotImage.objects.get(pk=self.jpeg.pk)
-            intermediate_img.name = "This interferes w/ the DELETE"
+            intermediate_img.description = "This interferes w/ the DELETE"
             intermediate_img.save()
 
             response = c.delete(self.jpeg_url, If_Match=etag)
@@ -251,7 +251,7 @@ class SpotImageDELETETest(TestCase):
             etag = response["ETag"]
 
             intermediate_img = SpotImage.objects.get(pk=self.png.pk)
-            intermediate_img.name = "This interferes w/ the DELETE"
+            intermediate_img.description = "This interferes w/ the DELETE"
             intermediate_img.save()
 
             response = c.delete(self.png_url, If_Match=etag)
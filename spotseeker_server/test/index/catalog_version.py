@@ -0,0 +1,55 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.test import TestCase
+from django.test.utils import override_settings
+from mock import patch
+
+from spotseeker_server import index
+from spotseeker_server.index import catalog_version
+from spotseeker_server.models import Spot
+
+LOCMEM_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "catalog_version_test",
+    }
+}
+
+
+@patch("spotseeker_server.index._checked", (None, None))
+class CatalogVersionTest(TestCase):
+    def setUp(self):
+        Spot.objects.create(name="Odegaard")
+
+    def test_without_a_shared_cache(self):
+        """Without a generation, the table is checked every time."""
+        catalog_version()
+        with self.assertNumQueries(1):
+            catalog_version()
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_generation(self):
+        version = catalog_version()
+        with self.assertNumQueries(0):
+            self.assertEqual(catalog_version(), version)
+
+        # A write moves the generation on, without a check of the table
+        Spot.objects.create(name="Suzzallo")
+        with self.assertNumQueries(0):
+            self.assertNotEqual(catalog_version(), version)
+
+    @override_settings(CACHES=LOCMEM_CACHE)
+    def test_check_interval(self):
+        """Writes around the models are picked up by the next check."""
+        version = catalog_version()
+        Spot.objects.bulk_create([Spot(name="Suzzallo")])
+        self.assertEqual(catalog_version(), version)
+
+        checked_at, signature = index._checked
+        index._checked = (checked_at - 60, signature)
+        self.assertNotEqual(catalog_version(), version)
+
+        with self.settings(SPOTSEEKER_CATALOG_CHECK_INTERVAL=0):
+            with self.assertNumQueries(1):
+                catalog_version()
@@ -0,0 +1,125 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.test import TestCase
+
+from spotseeker_server.index.extended_info import (
+    ExtendedInfoQuery,
+    extended_info_index,
+)
+from spotseeker_server.models import Spot, SpotExtendedInfo
+
+
+class ExtendedInfoIndexTest(TestCase):
+    def setUp(self):
+        self.quiet = Spot.objects.create(name="Quiet")
+        self.loud = Spot.objects.create(name="Loud")
+        self.techloan = Spot.objects.create(name="Techloan")
+        self.bare = Spot.objects.create(name="No extended info")
+
+        for spot, key, value in (
+            (self.quiet, "noise_level", "Quiet"),
+            (self.quiet, "has_whiteboards", "true"),
+            (self.loud, "noise_level", "variable"),
+            (self.loud, "has_outlets", "true"),
+            (self.techloan, "app_type", "tech"),
+            (self.techloan, "has_outlets", "true"),
+        ):
+            SpotExtendedInfo.objects.create(spot=spot, key=key, value=value)
+
+    def matching(self, info):
+        return set(extended_info_index.current().matching(info))
+
+    def test_has(self):
+        info = ExtendedInfoQuery()
+        info.has("has_outlets", ["true"])
+        self.assertEqual(
+            self.matching(info), set([self.loud.pk, self.techloan.pk])
+        )
+
+        info.has("noise_level", ["variable", "silent"])
+        self.assertEqual(self.matching(info), set([self.loud.pk]))
+
+        # Keys and values match ignoring case, as the database does
+        info = ExtendedInfoQuery()
+        info.has("Noise_Level", ["quiet"])
+        self.assertEqual(self.matching(info), set([self.quiet.pk]))
+
+    def test_has_any(self):
+        info = ExtendedInfoQuery()
+        info.has_any([("has_whiteboards", "true"), ("app_type", "tech")])
+        self.assertEqual(
+            self.matching(info), set([self.quiet.pk, self.techloan.pk])
+        )
+
+    def test_lacks(self):
+        info = ExtendedInfoQuery()
+        info.lacks("app_type")
+        self.assertEqual(
+            self.matching(info),
+            set([self.quiet.pk, self.loud.pk, self.bare.pk]),
+        )
+
+        info.lacks("noise_level", ["quiet", "silent"])
+        self.assertEqual(
+            self.matching(info), set([self.loud.pk, self.bare.pk])
+        )
+
+    def test_filter_queryset(self):
+        query = Spot.objects.all()
+
+        info = ExtendedInfoQuery()
+        info.lacks("app_type")
+        self.assertEqual(
+            set(extended_info_index.current().filter(query, info)),
+            set([self.quiet, self.loud, self.bare]),
+        )
+
+        info = ExtendedInfoQuery()
+        info.has("app_type", ["tech"])
+        self.assertEqual(
+            list(extended_info_index.current().filter(query, info)),
+            [self.techloan],
+        )
+
+    def test_rebuilt_after_change(self):
+        info = ExtendedInfoQuery()
+        info.has("has_whiteboards", ["true"])
+        self.assertEqual(self.matching(info), set([self.quiet.pk]))
+
+        SpotExtendedInfo.objects.create(
+            spot=self.bare, key="has_whiteboards", value="true"
+        )
+        self.assertEqual(
+            self.matching(info), set([self.quiet.pk, self.bare.pk])
+        )
+
+        SpotExtendedInfo.objects.filter(spot=self.quiet).delete()
+        self.assertEqual(self.matching(info), set([self.bare.pk]))
+
+    def test_between(self):
+        SpotExtendedInfo.objects.create(
+            spot=self.quiet, key="num_computers", value="4"
+        )
+        SpotExtendedInfo.objects.create(
+            spot=self.loud, key="num_computers", value="12"
+        )
+        SpotExtendedInfo.objects.create(
+            spot=self.bare, key="num_computers", value="many"
+        )
+
+        info = ExtendedInfoQuery()
+        info.between("num_computers", 5)
+        self.assertEqual(self.matching(info), set([self.loud.pk]))
+
+        info = ExtendedInfoQuery()
+        info.between("num_computers", 0, 10)
+        self.assertEqual(self.matching(info), set([self.quiet.pk]))
+
+    def test_conditions_not_repeated(self):
+        info = ExtendedInfoQuery()
+        info.lacks("app_type")
+        info.has("noise_level", ["variable", "Quiet"])
+        info.lacks("app_type")
+        info.has("noise_level", ["Quiet", "variable"])
+        self.assertEqual(len(info.conditions), 2)
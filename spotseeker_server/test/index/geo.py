@@ -0,0 +1,154 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from decimal import Decimal
+
+from django.test import TestCase
+from django.test.client import Client
+from django.test.utils import override_settings
+import simplejson as json
+
+from spotseeker_server.index.geo import spatial_index
+from spotseeker_server.models import Spot
+
+
+@override_settings(SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok")
+class SpatialIndexTest(TestCase):
+    def setUp(self):
+        # 10m and 100m north of the center, and one in another hemisphere
+        self.near = Spot.objects.create(
+            name="Near",
+            latitude=Decimal("30.0000898315"),
+            longitude=Decimal("-40.0"),
+        )
+        self.far = Spot.objects.create(
+            name="Far",
+            latitude=Decimal("30.0008983153"),
+            longitude=Decimal("-40.0"),
+        )
+        self.elsewhere = Spot.objects.create(
+            name="Elsewhere",
+            latitude=Decimal("-30.0"),
+            longitude=Decimal("40.0"),
+        )
+        self.nowhere = Spot.objects.create(name="No location")
+
+    def test_within_box(self):
+        index = spatial_index.current()
+        found = index.within_box(29.999, 30.0005, -40.001, -39.999)
+        self.assertEqual(found, [self.near.pk])
+
+        found = index.within_box(29.999, 30.001, -40.001, -39.999)
+        self.assertEqual(set(found), set([self.near.pk, self.far.pk]))
+
+    def test_large_box(self):
+        index = spatial_index.current()
+        found = index.within_box(-90, 90, -180, 180)
+        self.assertEqual(
+            set(found), set([self.near.pk, self.far.pk, self.elsewhere.pk])
+        )
+
+    def test_antimeridian_box_is_empty(self):
+        index = spatial_index.current()
+        self.assertEqual(index.within_box(-90, 90, 179, -179), [])
+
+    def test_nearest(self):
+        index = spatial_index.current()
+        spot_ids = [
+            self.nowhere.pk,
+            self.elsewhere.pk,
+            self.far.pk,
+            self.near.pk,
+        ]
+        self.assertEqual(
+            index.nearest(-40, 30, spot_ids, 4),
+            [self.near.pk, self.far.pk, self.elsewhere.pk, self.nowhere.pk],
+        )
+        self.assertEqual(
+            index.nearest(-40, 30, spot_ids, 1), [self.near.pk]
+        )
+
+    def test_rebuilt_after_move(self):
+        index = spatial_index.current()
+        self.assertEqual(
+            index.within_box(-31, -29, 39, 41), [self.elsewhere.pk]
+        )
+
+        self.elsewhere.latitude = Decimal("30.0")
+        self.elsewhere.longitude = Decimal("-40.0")
+        self.elsewhere.save()
+
+        index = spatial_index.current()
+        self.assertEqual(index.within_box(-31, -29, 39, 41), [])
+
+        response = Client().get(
+            "/api/v1/spot",
+            {
+                "center_latitude": 30,
+                "center_longitude": -40,
+                "distance": 12,
+            },
+        )
+        spot_ids = set(spot["id"] for spot in json.loads(response.content))
+        self.assertEqual(spot_ids, set([self.near.pk, self.elsewhere.pk]))
+
+    def test_rebuilt_after_delete(self):
+        index = spatial_index.current()
+        self.near.delete()
+
+        index = spatial_index.current()
+        found = index.within_box(29.999, 30.001, -40.001, -39.999)
+        self.assertEqual(found, [self.far.pk])
+
+    def test_distances(self):
+        index = spatial_index.current()
+        dists = index.distances(
+            -40, 30, [self.near.pk, self.far.pk, self.nowhere.pk]
+        )
+        self.assertEqual(set(dists), set([self.near.pk, self.far.pk]))
+        self.assertAlmostEqual(dists[self.near.pk], 10, delta=1)
+        self.assertAlmostEqual(dists[self.far.pk], 100, delta=1)
+        self.assertEqual(index.distances(-40, 30, [self.nowhere.pk]), {})
+
+    def test_nearest_matching(self):
+        index = spatial_index.current()
+        everything = index.nearest_matching(-40, 30, 10, lambda ids: ids)
+        self.assertEqual(
+            [pk for pk, dist in everything],
+            [self.near.pk, self.far.pk, self.elsewhere.pk],
+        )
+        self.assertAlmostEqual(everything[0][1], 10, delta=1)
+        self.assertAlmostEqual(everything[1][1], 100, delta=1)
+
+        # Only the spots accept() takes count
+        found = index.nearest_matching(
+            -40, 30, 1, lambda ids: [pk for pk in ids if pk != self.near.pk]
+        )
+        self.assertEqual([pk for pk, dist in found], [self.far.pk])
+
+    def test_nearest_matching_max_distance(self):
+        index = spatial_index.current()
+        found = index.nearest_matching(
+            -40, 30, 10, lambda ids: ids, max_distance=50
+        )
+        self.assertEqual([pk for pk, dist in found], [self.near.pk])
+
+        found = index.nearest_matching(
+            40, -29.9, 10, lambda ids: ids, max_distance=5000
+        )
+        self.assertEqual(found, [])
+
+    def test_nearest_matching_stops_early(self):
+        index = spatial_index.current()
+        candidates = []
+
+        def accept(ids):
+            candidates.extend(ids)
+            return ids
+
+        found = index.nearest_matching(-40, 30, 2, accept)
+        self.assertEqual(
+            [pk for pk, dist in found], [self.near.pk, self.far.pk]
+        )
+        # The other hemisphere was never looked at
+        self.assertNotIn(self.elsewhere.pk, candidates)
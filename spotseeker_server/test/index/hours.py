@@ -0,0 +1,93 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import time
+
+from django.test import TestCase
+
+from spotseeker_server.index.hours import HoursQuery, hours_index
+from spotseeker_server.models import Spot, SpotAvailableHours
+
+
+class HoursIndexTest(TestCase):
+    def setUp(self):
+        self.day_spot = Spot.objects.create(name="Open during the day")
+        self.night_spot = Spot.objects.create(name="Open overnight")
+        self.closed_spot = Spot.objects.create(name="No hours")
+
+        SpotAvailableHours.objects.create(
+            spot=self.day_spot, day="m", start_time="09:00", end_time="17:00"
+        )
+        SpotAvailableHours.objects.create(
+            spot=self.night_spot,
+            day="m",
+            start_time="20:00",
+            end_time="23:59:59",
+        )
+        SpotAvailableHours.objects.create(
+            spot=self.night_spot, day="t", start_time="00:00", end_time="06:00"
+        )
+
+    def matching(self, hours):
+        return set(hours_index.current().matching(hours))
+
+    def test_open_now(self):
+        hours = HoursQuery()
+        hours.open_now("m", time(12, 0, 30))
+        self.assertEqual(self.matching(hours), set([self.day_spot.pk]))
+
+        # Not open yet at exactly the opening minute
+        hours = HoursQuery()
+        hours.open_now("m", time(9, 0))
+        self.assertEqual(self.matching(hours), set())
+
+        hours = HoursQuery()
+        hours.open_now("m", time(23, 59, 30))
+        self.assertEqual(self.matching(hours), set([self.night_spot.pk]))
+
+    def test_open_at(self):
+        hours = HoursQuery()
+        hours.open_at("m", "09:00")
+        self.assertEqual(self.matching(hours), set([self.day_spot.pk]))
+
+        hours = HoursQuery()
+        hours.open_at("m", "17:00")
+        self.assertEqual(self.matching(hours), set())
+
+    def test_open_between_across_midnight(self):
+        hours = HoursQuery()
+        hours.open_between("m", "21:00", "23:59")
+        hours.open_between("t", "00:00", "05:00")
+        self.assertEqual(self.matching(hours), set([self.night_spot.pk]))
+
+        hours.open_between("t", "00:00", "07:00")
+        self.assertEqual(self.matching(hours), set())
+
+    def test_open_near(self):
+        hours = HoursQuery()
+        hours.open_near([("m", "16:00", "m", "18:00")])
+        self.assertEqual(self.matching(hours), set([self.day_spot.pk]))
+
+        hours = HoursQuery()
+        hours.open_near([("m", "22:00", "t", "01:00")])
+        self.assertEqual(self.matching(hours), set([self.night_spot.pk]))
+
+        hours = HoursQuery()
+        hours.open_near([("w", "10:00", "w", "11:00")])
+        self.assertEqual(self.matching(hours), set())
+
+    def test_rebuilt_on_save(self):
+        hours = HoursQuery()
+        hours.open_at("w", "10:00")
+        self.assertEqual(self.matching(hours), set())
+
+        SpotAvailableHours.objects.create(
+            spot=self.closed_spot,
+            day="w",
+            start_time="08:00",
+            end_time="12:00",
+        )
+        self.assertEqual(self.matching(hours), set([self.closed_spot.pk]))
+
+        SpotAvailableHours.objects.filter(spot=self.closed_spot).delete()
+        self.assertEqual(self.matching(hours), set())
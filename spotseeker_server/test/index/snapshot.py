@@ -0,0 +1,198 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from array import array
+from datetime import time
+from decimal import Decimal
+import os
+import pickle
+import shutil
+import tempfile
+
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from spotseeker_server.index import catalog_version, snapshot
+from spotseeker_server.index.extended_info import ExtendedInfoIndex
+from spotseeker_server.index.geo import SpatialIndex
+from spotseeker_server.index.hours import HoursIndex
+from spotseeker_server.index.spot_set import SpotSet
+from spotseeker_server.index.spots import SpotIndex
+from spotseeker_server.index.text import TextIndex
+from spotseeker_server.models import (
+    Spot,
+    SpotAvailableHours,
+    SpotExtendedInfo,
+    SpotType,
+)
+
+LOCMEM_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "index_snapshot_test",
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class IndexSnapshotTest(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        spot = Spot.objects.create(
+            name="Odegaard",
+            building_name="OUGL",
+            capacity=20,
+            latitude=Decimal("47.656"),
+            longitude=Decimal("-122.310"),
+        )
+        spot.spottypes.add(SpotType.objects.create(name="study_area"))
+        SpotExtendedInfo.objects.create(
+            spot=spot, key="has_outlets", value="true"
+        )
+        SpotAvailableHours.objects.create(
+            spot=spot, day="m", start_time=time(8), end_time=time(17)
+        )
+        self.spot = spot
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def snapshots(self):
+        return sorted(os.listdir(self.directory))
+
+    def test_off_by_default(self):
+        index = ExtendedInfoIndex()
+        index.current()
+        self.assertIsNone(snapshot.snapshot_path(index, catalog_version()))
+        self.assertEqual(self.snapshots(), [])
+
+    def test_off_without_a_shared_cache(self):
+        with self.settings(SPOTSEEKER_INDEX_SNAPSHOT_DIR=self.directory):
+            index = ExtendedInfoIndex()
+            self.assertIsNone(
+                snapshot.snapshot_path(index, (1, None, 1, None))
+            )
+
+    def test_shared(self):
+        with self.settings(SPOTSEEKER_INDEX_SNAPSHOT_DIR=self.directory):
+            version = catalog_version()
+            first = ExtendedInfoIndex().current(version)
+            self.assertEqual(len(self.snapshots()), 1)
+
+            # Another worker loads it without asking the database
+            with self.assertNumQueries(0):
+                second = ExtendedInfoIndex().current(version)
+            self.assertEqual(second.data, first.data)
+
+    def test_every_index(self):
+        with self.settings(SPOTSEEKER_INDEX_SNAPSHOT_DIR=self.directory):
+            version = catalog_version()
+            for index_class in (
+                ExtendedInfoIndex,
+                HoursIndex,
+                SpatialIndex,
+                SpotIndex,
+                TextIndex,
+            ):
+                built = index_class().current(version)
+                with self.assertNumQueries(0):
+                    loaded = index_class().current(version)
+                self.assertEqual(loaded.data, built.data)
+            self.assertEqual(len(self.snapshots()), 5)
+
+            # The bulk of each is read in place
+            for index_class, arrays in (
+                (HoursIndex, (0, 1)),
+                (SpatialIndex, (0, 1, 2, 3)),
+                (TextIndex, (0, 1, 2)),
+            ):
+                loaded = index_class().current(version)
+                for i in arrays:
+                    self.assertIsInstance(loaded.data[i], memoryview)
+            spots = SpotIndex().current(version).data
+            columns = [codes for distinct, codes in spots.columns.values()]
+            for column in columns + [spots.ids, spots.capacity_ids]:
+                self.assertIsInstance(column, memoryview)
+
+    def test_new_version(self):
+        with self.settings(SPOTSEEKER_INDEX_SNAPSHOT_DIR=self.directory):
+            index = ExtendedInfoIndex().current()
+            old = self.snapshots()
+
+            SpotExtendedInfo.objects.create(
+                spot=self.spot, key="has_whiteboards", value="true"
+            )
+            index.current()
+            new = self.snapshots()
+
+            # The old version was replaced
+            self.assertEqual(len(new), 1)
+            self.assertNotEqual(new, old)
+            self.assertIn("has_whiteboards", index.data[1])
+            published = snapshot.load(os.path.join(self.directory, new[0]))
+            self.assertEqual(published, index.data)
+
+    def test_older_generation(self):
+        """A worker behind on the generation leaves newer snapshots."""
+        with self.settings(SPOTSEEKER_INDEX_SNAPSHOT_DIR=self.directory):
+            old = catalog_version()
+            SpotExtendedInfo.objects.create(
+                spot=self.spot, key="has_whiteboards", value="true"
+            )
+            new = catalog_version()
+            newer = ExtendedInfoIndex().current(new)
+            ExtendedInfoIndex().current(old)
+
+            self.assertEqual(len(self.snapshots()), 2)
+            self.assertEqual(
+                snapshot.load(snapshot.snapshot_path(newer, new)),
+                newer.data,
+            )
+
+            # Both are removed once a newer one is published
+            SpotExtendedInfo.objects.create(
+                spot=self.spot, key="has_printing", value="true"
+            )
+            ExtendedInfoIndex().current(catalog_version())
+            self.assertEqual(len(self.snapshots()), 1)
+
+    def test_unreadable_snapshot(self):
+        with self.settings(SPOTSEEKER_INDEX_SNAPSHOT_DIR=self.directory):
+            version = catalog_version()
+            index = ExtendedInfoIndex()
+            path = snapshot.snapshot_path(index, version)
+            with open(path, "wb") as f:
+                f.write(b"not a snapshot")
+
+            with self.assertLogs(snapshot.logger, "WARNING"):
+                index.current(version)
+            self.assertIn("has_outlets", index.data[1])
+            # The bad snapshot was replaced by a good one
+            self.assertEqual(snapshot.load(path), index.data)
+
+    def test_ids_read_in_place(self):
+        path = os.path.join(self.directory, "Test-0" + snapshot.SUFFIX)
+        data = {
+            "sparse": SpotSet.of([3, 70, 100000]),
+            "dense": SpotSet.of(range(1, 50)),
+            "text": ("spot", 1.5, None, True, set([(1, 2)])),
+            "floats": array("d", [47.656, -122.31]),
+            "bytes": array("B", b"\x00\xff"),
+        }
+        snapshot.publish(path, data)
+        loaded = snapshot.load(path)
+        self.assertEqual(loaded, data)
+        self.assertIsInstance(loaded["sparse"]._ids, memoryview)
+        self.assertIsInstance(loaded["floats"], memoryview)
+        self.assertEqual(loaded["floats"].format, "d")
+
+    def test_no_pickles(self):
+        path = os.path.join(self.directory, "Test-0" + snapshot.SUFFIX)
+        with open(path, "wb") as f:
+            pickle.dump({"has_outlets": {}}, f)
+        with self.assertLogs(snapshot.logger, "WARNING"):
+            self.assertIsNone(snapshot.load(path))
+
+        # Nor anything else that isn't plain data
+        with self.assertLogs(snapshot.logger, "WARNING"):
+            snapshot.publish(path, {"spot": self.spot})
@@ -0,0 +1,60 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest import TestCase
+
+from spotseeker_server.index.spot_set import EMPTY, SpotSet
+
+
+class SpotSetTest(TestCase):
+    def setUp(self):
+        # A few ids far apart, and a run of most of the ids up to 100
+        self.sparse = SpotSet.of([100000, 3, 70, 3])
+        self.dense = SpotSet.of(i for i in range(100) if i % 3)
+
+    def test_storage(self):
+        self.assertIsNone(self.sparse._bits)
+        self.assertEqual(self.sparse._ids.itemsize * len(self.sparse), 12)
+        self.assertIsNone(self.dense._ids)
+        self.assertIsNone(SpotSet.of([-1, 2])._bits)
+
+    def test_contents(self):
+        self.assertEqual(self.sparse.ids(), [3, 70, 100000])
+        self.assertEqual(len(self.dense), 66)
+        self.assertIn(70, self.sparse)
+        self.assertNotIn(71, self.sparse)
+        self.assertIn(1, self.dense)
+        self.assertNotIn(3, self.dense)
+        self.assertNotIn(-1, self.dense)
+        self.assertFalse(EMPTY)
+        self.assertEqual(SpotSet.of([]), EMPTY)
+
+    def test_filter(self):
+        ids = [100000, 71, 70, 1, 3, -5, 500]
+        self.assertEqual(self.sparse.filter(ids), [100000, 70, 3])
+        self.assertEqual(self.dense.filter(ids), [71, 70, 1])
+
+    def test_operators(self):
+        both = set(self.sparse) & set(self.dense)
+        either = set(self.sparse) | set(self.dense)
+        for first, second in (
+            (self.sparse, self.dense),
+            (self.dense, self.sparse),
+            (self.sparse, SpotSet.of([3, 4])),
+            (self.dense, SpotSet.of(range(50))),
+        ):
+            self.assertEqual(
+                (first & second).ids(), sorted(set(first) & set(second))
+            )
+            self.assertEqual(
+                (first | second).ids(), sorted(set(first) | set(second))
+            )
+            self.assertEqual(
+                (first - second).ids(), sorted(set(first) - set(second))
+            )
+        self.assertEqual((self.sparse & self.dense).ids(), sorted(both))
+        self.assertEqual(
+            SpotSet.union([self.sparse, self.dense, EMPTY]).ids(),
+            sorted(either),
+        )
+        self.assertEqual(SpotSet.union([]), EMPTY)
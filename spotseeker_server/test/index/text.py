@@ -0,0 +1,66 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.test import TestCase
+
+from spotseeker_server.index.text import text_index
+from spotseeker_server.models import Spot, SpotExtendedInfo
+
+
+class TextIndexTest(TestCase):
+    def setUp(self):
+        self.ougl = Spot.objects.create(
+            name="Odegaard Undergraduate Library",
+            building_name="Odegaard Library (OUG)",
+            room_number="220",
+        )
+        self.suzzallo = Spot.objects.create(
+            name="Suzzallo Reading Room",
+            building_name="Suzzallo Library (SUZ)",
+            room_number="300",
+        )
+        self.cafe = Spot.objects.create(
+            name="Cafe Ave", building_name="Husky Union Building (HUB)"
+        )
+        SpotExtendedInfo.objects.create(
+            spot=self.cafe,
+            key="location_description",
+            value="Next to the library entrance",
+        )
+
+    def test_containing(self):
+        index = text_index.current()
+        for field, value in (
+            ("name", "LIBRARY"),
+            ("name", "ry"),
+            ("building_name", "(hub)"),
+            ("room_number", "20"),
+            ("name", ""),
+            ("name", "nowhere"),
+        ):
+            expected = Spot.objects.filter(
+                **{"%s__icontains" % field: value}
+            ).values_list("pk", flat=True)
+            self.assertEqual(
+                set(index.containing(field, value)), set(expected)
+            )
+
+    def test_search_ranked(self):
+        index = text_index.current()
+        # A match at the start of the name beats one in the building name,
+        # which beats one in the location description
+        self.assertEqual(
+            index.search("Library"),
+            [self.ougl.pk, self.suzzallo.pk, self.cafe.pk],
+        )
+        self.assertEqual(index.search("suz"), [self.suzzallo.pk])
+
+        # Every word has to match
+        self.assertEqual(index.search("library reading"), [self.suzzallo.pk])
+        self.assertEqual(index.search("library pizza"), [])
+        self.assertEqual(index.search("  "), [])
+
+    def test_rebuilt_after_change(self):
+        self.cafe.name = "Pizza Place"
+        self.cafe.save()
+        self.assertEqual(text_index.current().search("pizza"), [self.cafe.pk])
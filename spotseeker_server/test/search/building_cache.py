@@ -0,0 +1,82 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.client import Client
+from django.test.utils import override_settings
+import mock
+import simplejson as json
+
+from spotseeker_server.models import Spot, SpotExtendedInfo
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    },
+)
+class BuildingListCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        for name, building, campus in (
+            ("Spot 1", "Building B", "seattle"),
+            ("Spot 2", "Building A", "seattle"),
+            ("Spot 3", "Building A", "bothell"),
+        ):
+            spot = Spot.objects.create(name=name, building_name=building)
+            SpotExtendedInfo.objects.create(
+                spot=spot, key="campus", value=campus
+            )
+
+    def get_buildings(self, params=None, **kwargs):
+        return Client().get("/api/v1/buildings", params or {}, **kwargs)
+
+    def test_cached_until_catalog_changes(self):
+        response = self.get_buildings()
+        self.assertEqual(
+            json.loads(response.content), ["Building A", "Building B"]
+        )
+
+        response = self.get_buildings({"campus": "bothell"})
+        with self.assertNumQueries(0):
+            self.get_buildings()
+            response = self.get_buildings({"campus": "bothell"})
+        self.assertEqual(json.loads(response.content), ["Building A"])
+
+        Spot.objects.create(name="Spot 4", building_name="Building C")
+        response = self.get_buildings()
+        self.assertEqual(
+            json.loads(response.content),
+            ["Building A", "Building B", "Building C"],
+        )
+
+    def test_etag(self):
+        response = self.get_buildings({"campus": "seattle"})
+        etag = response["ETag"]
+
+        response = self.get_buildings(
+            {"campus": "seattle"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        response = self.get_buildings(
+            {"campus": "bothell"}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_cache_timeout(self):
+        with mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+            with self.settings(SPOTSEEKER_SEARCH_CACHE_TIMEOUT=30):
+                self.get_buildings()
+        self.assertEqual(cache_set.call_args[0][2], 30)
+
+        with self.settings(SPOTSEEKER_SEARCH_CACHE_TIMEOUT=0):
+            self.get_buildings()
+            with self.assertNumQueries(1):
+                self.get_buildings()
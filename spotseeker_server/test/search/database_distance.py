@@ -0,0 +1,82 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from decimal import Decimal
+
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+from mock import patch
+
+from spotseeker_server.models import Spot
+from spotseeker_server.org_filters import SearchFilterChain
+from spotseeker_server.test.search.distance import SpotSearchDistanceTest
+from spotseeker_server.test.search.nearest import NearestSearchTest
+from spotseeker_server.views.search import SearchView
+
+
+@override_settings(SPOTSEEKER_SPATIAL_INDEX=False)
+class DatabaseDistanceSearchTest(SpotSearchDistanceTest):
+    """The distance searches, without the spatial index."""
+
+
+@override_settings(SPOTSEEKER_SPATIAL_INDEX=False)
+class DatabaseNearestSearchTest(NearestSearchTest):
+    """The expand_radius searches, without the spatial index."""
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_SPATIAL_INDEX=False,
+)
+class NearestInDatabaseTest(TestCase):
+    def setUp(self):
+        # North and east of (30, -40), 100m apart
+        self.spots = []
+        for i in range(1, 7):
+            offset = Decimal("0.0009") * i
+            if i % 2:
+                latitude, longitude = Decimal("30") + offset, Decimal("-40")
+            else:
+                # A degree of longitude is shorter than one of latitude
+                latitude = Decimal("30")
+                longitude = Decimal("-40") + offset * Decimal("1.1547")
+            self.spots.append(
+                Spot.objects.create(
+                    name="Spot %s" % i, latitude=latitude, longitude=longitude
+                )
+            )
+        Spot.objects.create(name="No location")
+
+    def test_order(self):
+        nearest = SearchView().nearest_in_database(
+            Spot.objects.all(), -40, 30, 4
+        )
+        self.assertEqual(nearest, [spot.pk for spot in self.spots[:4]])
+
+    def test_max_distance(self):
+        nearest = SearchView().nearest_in_database(
+            Spot.objects.all(), -40, 30, 4, max_distance=250
+        )
+        self.assertEqual(nearest, [spot.pk for spot in self.spots[:2]])
+
+    def test_only_limit_loaded(self):
+        request = RequestFactory().get(
+            "/api/v1/spot",
+            {
+                "center_latitude": 30,
+                "center_longitude": -40,
+                "distance": 1000,
+                "limit": 2,
+            },
+        )
+        # Without any filters another test may have loaded
+        with patch.object(SearchFilterChain, "filters", []):
+            chain = SearchFilterChain(request)
+        with self.assertNumQueries(3):
+            # The ordered ids, the spots and their extended info
+            spots = SearchView().filter_on_request(
+                request.GET, chain, request.META, "spot"
+            )
+        self.assertEqual(
+            [spot.pk for spot in spots], [spot.pk for spot in self.spots[:2]]
+        )
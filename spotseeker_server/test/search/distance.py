@@ -54,6 +54,24 @@ class SpotSearchDistanceTest(TestCase):
             response.content.decode(), "[]", "Should return no matches"
         )
 
+    @override_settings(SPOTSEEKER_SPOT_SEARCH_FORM="django.forms.Form")
+    def test_invalid_center_over_limit(self):
+        """There's no telling which spots are nearest a bad center."""
+        for i in range(3):
+            models.Spot.objects.create(name="Spot %s" % i, capacity=10)
+        # A form that lets the bad latitude through to the search
+        response = Client().get(
+            "/api/v1/spot",
+            {
+                "center_latitude": "bad_data",
+                "center_longitude": -40,
+                "distance": 10,
+                "capacity": 5,
+                "limit": 2,
+            },
+        )
+        self.assertEqual(response.status_code, 400)
+
     def test_invalid_height(self):
         c = Client()
         response = c.get(
@@ -559,7 +577,7 @@ class SpotSearchDistanceTest(TestCase):
         self.assertEquals(
             response["Content-Type"], "application/json", "Has the json header"
         )
-        spots = json.loads(response.content)
+        spots = json.loads(b"".join(response.streaming_content))
         self.assertEquals(len(spots), 12, "Returns 12 spots with a limit of 0")
         spot_ids = {
             inner_left.pk: 1,
@@ -650,7 +668,7 @@ class SpotSearchDistanceTest(TestCase):
         self.assertEquals(
             response["Content-Type"], "application/json", "Has the json header"
         )
-        spots = json.loads(response.content)
+        spots = json.loads(b"".join(response.streaming_content))
         self.assertEquals(
             len(spots), 112, "Returns 112 spots with a limit of 0"
         )
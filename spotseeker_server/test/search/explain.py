@@ -0,0 +1,114 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.db import connection
+from django.test import TestCase
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from mock import patch
+import simplejson as json
+
+from spotseeker_server.models import Spot
+
+LOCMEM_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "search_explain_test",
+    }
+}
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_AUTH_ADMINS=["demo_user"],
+)
+class SearchExplainTest(TestCase):
+    def setUp(self):
+        self.spots = [
+            Spot.objects.create(name="Spot %s" % i, capacity=10)
+            for i in range(3)
+        ]
+
+    def test_explain(self):
+        response = Client().get(
+            "/api/v1/spot", {"capacity": 5, "_explain": 1}
+        )
+        self.assertEqual(response.status_code, 200)
+        explain = json.loads(response.content)
+
+        self.assertEqual(
+            sorted(explain["spot_ids"]), [spot.pk for spot in self.spots]
+        )
+        names = [stage["name"] for stage in explain["stages"]]
+        for name in ("form", "build_query", "limit", "sql", "serialize"):
+            self.assertIn(name, names)
+
+        self.assertEqual(
+            explain["query_count"],
+            sum(stage["query_count"] for stage in explain["stages"]),
+        )
+        sql = [stage for stage in explain["stages"] if stage["name"] == "sql"]
+        self.assertTrue(sql[0]["query_count"] > 0)
+        self.assertIn("SELECT", sql[0]["queries"][0])
+
+        for tier in ("local", "shared", "document"):
+            self.assertIn("hits", explain["spot_cache"][tier])
+
+    def test_explicit_only(self):
+        """Only _explain=1 or true explains; anything else searches."""
+        for value in ("0", "false", ""):
+            response = Client().get(
+                "/api/v1/spot", {"capacity": 5, "_explain": value}
+            )
+            self.assertEqual(response.status_code, 200, value)
+            spots = json.loads(response.content)
+            self.assertEqual(
+                sorted(spot["id"] for spot in spots),
+                [spot.pk for spot in self.spots],
+            )
+
+        response = Client().get(
+            "/api/v1/spot", {"capacity": 5, "_explain": "True"}
+        )
+        self.assertIn("stages", json.loads(response.content))
+
+    def version_checks(self):
+        """The number of times a search checks the spot table."""
+        with CaptureQueriesContext(connection) as queries:
+            response = Client().get(
+                "/api/v1/spot",
+                {
+                    "q": "spot",
+                    "name": "Spot",
+                    "extended_info:has_outlets": "true",
+                    "extended_info:or:has_whiteboards": "true",
+                    "open_now": "1",
+                },
+            )
+        self.assertEqual(response.status_code, 200)
+        return len(
+            [q for q in queries if 'MAX("spotseeker_server_spot"' in q["sql"]]
+        )
+
+    def test_one_version_check(self):
+        """A search checks the catalog version once for all its indexes."""
+        self.spots[0].spotextendedinfo_set.create(
+            key="has_outlets", value="true"
+        )
+        self.assertEqual(self.version_checks(), 1)
+
+    @override_settings(
+        CACHES=LOCMEM_CACHE, SPOTSEEKER_SEARCH_CACHE_TIMEOUT=0
+    )
+    @patch("spotseeker_server.index._checked", (None, None))
+    def test_generation_only(self):
+        """With a shared generation, the table is checked now and then."""
+        self.assertEqual(self.version_checks(), 1)
+        self.assertEqual(self.version_checks(), 0)
+
+    def test_admin_only(self):
+        with self.settings(SPOTSEEKER_AUTH_ADMINS=["someone_else"]):
+            response = Client().get(
+                "/api/v1/spot", {"capacity": 5, "_explain": 1}
+            )
+        self.assertEqual(response.status_code, 401)
@@ -0,0 +1,75 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.client import Client
+from django.test.utils import override_settings
+import simplejson as json
+
+from spotseeker_server.models import Spot, SpotExtendedInfo, SpotType
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_SPOT_FORM="spotseeker_server.org_forms.uw_spot.UWSpotForm",
+)
+class SpotFacetsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        study_room = SpotType.objects.create(name="study_room")
+        cafe = SpotType.objects.create(name="cafe")
+
+        for i, (building, spot_type, noise) in enumerate(
+            (
+                ("Suzzallo", study_room, "quiet"),
+                ("Suzzallo", study_room, "silent"),
+                ("Odegaard", study_room, "quiet"),
+                ("Odegaard", cafe, "variable"),
+            )
+        ):
+            spot = Spot.objects.create(
+                name="Spot %s" % i, building_name=building, capacity=i + 1
+            )
+            spot.spottypes.add(spot_type)
+            SpotExtendedInfo.objects.create(
+                spot=spot, key="noise_level", value=noise
+            )
+            SpotExtendedInfo.objects.create(
+                spot=spot, key="location_description", value="Room %s" % i
+            )
+
+    def get_facets(self, params):
+        response = Client().get("/api/v1/spot/facets", params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def test_facets(self):
+        facets = self.get_facets({"capacity": 1})
+        self.assertEqual(facets["count"], 4)
+        self.assertEqual(facets["type"], {"study_room": 3, "cafe": 1})
+        self.assertEqual(
+            facets["building_name"], {"Suzzallo": 2, "Odegaard": 2}
+        )
+        self.assertEqual(
+            facets["extended_info"]["noise_level"],
+            {"quiet": 2, "silent": 1, "variable": 1},
+        )
+        # Only keys with a fixed set of values are counted
+        self.assertNotIn("location_description", facets["extended_info"])
+
+    def test_facets_of_filtered_search(self):
+        facets = self.get_facets({"type": "study_room", "capacity": 2})
+        self.assertEqual(facets["count"], 2)
+        self.assertEqual(facets["type"], {"study_room": 2})
+        self.assertEqual(
+            facets["building_name"], {"Suzzallo": 1, "Odegaard": 1}
+        )
+        self.assertEqual(
+            facets["extended_info"]["noise_level"],
+            {"quiet": 1, "silent": 1},
+        )
+
+    def test_facets_ignore_limit(self):
+        facets = self.get_facets({"capacity": 1, "limit": 2})
+        self.assertEqual(facets["count"], 4)
@@ -14,62 +14,62 @@ from spotseeker_server import models
 @override_settings(SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok")
 class SpotSearchFieldTest(SpotServerTestCase):
     @classmethod
-    def setUpClass(self):
+    def setUpTestData(cls):
         # .new_spot() is from spotseeker_server.test.SpotServerTestCase
         # (__init__.py)
-        self.spot1 = self.new_spot("This is a searchable Name - OUGL")
+        cls.spot1 = cls.new_spot("This is a searchable Name - OUGL")
 
-        self.spot2 = self.new_spot("This OUGL is an alternative spot")
+        cls.spot2 = cls.new_spot("This OUGL is an alternative spot")
 
-        self.spot3 = self.new_spot("3rd spot")
+        cls.spot3 = cls.new_spot("3rd spot")
 
-        self.spot4 = self.new_spot("OUGL - 3rd spot in the site")
+        cls.spot4 = cls.new_spot("OUGL - 3rd spot in the site")
 
-        self.spot5 = self.new_spot("Has whiteboards")
-        self.add_ei_to_spot(self.spot5, has_whiteboards=True)
+        cls.spot5 = cls.new_spot("Has whiteboards")
+        cls.add_ei_to_spot(cls.spot5, has_whiteboards=True)
 
-        self.spot6 = self.new_spot("Has no whiteboards")
-        self.add_ei_to_spot(self.spot6, has_whiteboards=False)
+        cls.spot6 = cls.new_spot("Has no whiteboards")
+        cls.add_ei_to_spot(cls.spot6, has_whiteboards=False)
 
-        self.spot7 = self.new_spot(
+        cls.spot7 = cls.new_spot(
             "Text search for the title - Odegaard "
             "Undergraduate Library and Learning Commons"
         )
-        self.add_ei_to_spot(self.spot7, has_whiteboards=True)
+        cls.add_ei_to_spot(cls.spot7, has_whiteboards=True)
 
-        self.natural = self.new_spot("Has field value: natural")
-        self.add_ei_to_spot(self.natural, lightingmultifieldtest="natural")
+        cls.natural = cls.new_spot("Has field value: natural")
+        cls.add_ei_to_spot(cls.natural, lightingmultifieldtest="natural")
 
-        self.artificial = self.new_spot("Has field value: artificial")
-        self.add_ei_to_spot(
-            self.artificial, lightingmultifieldtest="artificial"
+        cls.artificial = cls.new_spot("Has field value: artificial")
+        cls.add_ei_to_spot(
+            cls.artificial, lightingmultifieldtest="artificial"
         )
 
-        self.other = self.new_spot("Has field value: other")
-        self.add_ei_to_spot(self.other, lightingmultifieldtest="other")
+        cls.other = cls.new_spot("Has field value: other")
+        cls.add_ei_to_spot(cls.other, lightingmultifieldtest="other")
 
         # It doesn't actually have a field value
-        self.darkness = self.new_spot("Has field value: darkness")
+        cls.darkness = cls.new_spot("Has field value: darkness")
 
-        self.american_food_spot = self.new_spot("American Food")
-        self.add_ei_to_spot(
-            self.american_food_spot,
+        cls.american_food_spot = cls.new_spot("American Food")
+        cls.add_ei_to_spot(
+            cls.american_food_spot,
             s_cuisine_american="true",
             app_type="food",
             s_payment_husky="true",
         )
 
-        self.bbq_food_spot = self.new_spot("BBQ")
-        self.add_ei_to_spot(
-            self.bbq_food_spot,
+        cls.bbq_food_spot = cls.new_spot("BBQ")
+        cls.add_ei_to_spot(
+            cls.bbq_food_spot,
             s_cuisine_bbq="true",
             s_payment_cash="true",
             app_type="food",
         )
 
-        self.food_court_spot = self.new_spot("Food Court")
-        self.add_ei_to_spot(
-            self.food_court_spot,
+        cls.food_court_spot = cls.new_spot("Food Court")
+        cls.add_ei_to_spot(
+            cls.food_court_spot,
             s_cuisine_american="true",
             s_cuisine_bbq="true",
             app_type="food",
@@ -77,16 +77,16 @@ class SpotSearchFieldTest(SpotServerTestCase):
             s_payment_cash="true",
         )
 
-        self.chinese_food_spot = self.new_spot("Chinese Food")
-        self.add_ei_to_spot(
-            self.chinese_food_spot,
+        cls.chinese_food_spot = cls.new_spot("Chinese Food")
+        cls.add_ei_to_spot(
+            cls.chinese_food_spot,
             s_cuisine_chinese="true",
             app_type="food",
             s_payment_cash="true",
         )
 
-        self.study_spot = self.new_spot("Study Here!")
-        self.add_ei_to_spot(self.study_spot, has_whiteboards="true")
+        cls.study_spot = cls.new_spot("Study Here!")
+        cls.add_ei_to_spot(cls.study_spot, has_whiteboards="true")
 
         cafe_type = SpotType.objects.get_or_create(name="cafe_testing")[0]
         open_type = SpotType.objects.get_or_create(name="open_testing")[0]
@@ -94,32 +94,32 @@ class SpotSearchFieldTest(SpotServerTestCase):
             name="never_used_testing"
         )[0]
 
-        self.spot8 = self.new_spot("Spot8 is a cafe for multi type test")
-        self.spot8.spottypes.add(cafe_type)
+        cls.spot8 = cls.new_spot("Spot8 is a cafe for multi type test")
+        cls.spot8.spottypes.add(cafe_type)
 
-        self.spot9 = self.new_spot(
+        cls.spot9 = cls.new_spot(
             "Spot 9 is an Open space for multi type " "test"
         )
-        self.spot9.spottypes.add(open_type)
+        cls.spot9.spottypes.add(open_type)
 
-        self.spot10 = self.new_spot(
+        cls.spot10 = cls.new_spot(
             "Spot 10 is an Open cafe for " "multi type test"
         )
-        self.spot10.spottypes.add(cafe_type)
-        self.spot10.spottypes.add(open_type)
+        cls.spot10.spottypes.add(cafe_type)
+        cls.spot10.spottypes.add(open_type)
 
-        self.spot11 = self.new_spot("Spot 11 should never get returned")
-        self.spot11.spottypes.add(never_used_type)
+        cls.spot11 = cls.new_spot("Spot 11 should never get returned")
+        cls.spot11.spottypes.add(never_used_type)
 
-        self.spot12 = self.new_spot("Room A403", building_name="Building A")
+        cls.spot12 = cls.new_spot("Room A403", building_name="Building A")
 
-        self.spot13 = self.new_spot("Room A589", building_name="Building A")
+        cls.spot13 = cls.new_spot("Room A589", building_name="Building A")
 
-        self.spot14 = self.new_spot("Room B328", building_name="Building B")
+        cls.spot14 = cls.new_spot("Room B328", building_name="Building B")
 
-        self.spot15 = self.new_spot("Room B943", building_name="Building B")
+        cls.spot15 = cls.new_spot("Room B943", building_name="Building B")
 
-        self.spot16 = self.new_spot("Room C483", building_name="Building C")
+        cls.spot16 = cls.new_spot("Room C483", building_name="Building C")
 
     def test_fields(self):
         response = self.client.get("/api/v1/spot", {"name": "OUGL"})
@@ -139,9 +139,15 @@ class SpotSearchFieldTest(SpotServerTestCase):
 
         self.assertJsonHeader(response)
         spots = json.loads(response.content)
-        expected = [self.spot5, self.spot7]
+        # "True" and "true" alike, as the database's collation matches
+        expected = [self.spot5, self.spot7, self.study_spot]
         self.assertSpotsToJson(expected, spots)
 
+        response = self.client.get(
+            "/api/v1/spot", {"extended_info:HAS_WHITEBOARDS": "TRUE"}
+        )
+        self.assertSpotsToJson(expected, json.loads(response.content))
+
         response = self.client.get(
             "/api/v1/spot",
             {"extended_info:has_whiteboards": True, "name": "odegaard under"},
@@ -0,0 +1,61 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.client import Client
+from django.test.utils import override_settings
+import simplejson as json
+
+from spotseeker_server.models import Spot
+
+
+@override_settings(SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok")
+class FreeTextSearchTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.spots = [
+            Spot.objects.create(name="Study room", building_name="Library"),
+            Spot.objects.create(name="Library study area"),
+            Spot.objects.create(name="Cafe", building_name="Student Center"),
+        ]
+
+    def search(self, params):
+        response = Client().get("/api/v1/spot", params)
+        self.assertEqual(response.status_code, 200)
+        return [spot["id"] for spot in json.loads(response.content)]
+
+    def test_ranked(self):
+        self.assertEqual(
+            self.search({"q": "library"}),
+            [self.spots[1].pk, self.spots[0].pk],
+        )
+        self.assertEqual(
+            self.search({"q": "stud"}),
+            [self.spots[0].pk, self.spots[1].pk, self.spots[2].pk],
+        )
+
+    def test_limit(self):
+        # Without a location, the best matches fill the limit
+        self.assertEqual(
+            self.search({"q": "stud", "limit": 2}),
+            [self.spots[0].pk, self.spots[1].pk],
+        )
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            }
+        }
+    )
+    def test_cached_order(self):
+        first = self.search({"q": "stud"})
+        self.assertEqual(self.search({"q": "stud"}), first)
+
+    def test_combined_filters(self):
+        self.assertEqual(
+            self.search({"q": "stud", "building_name": "Library"}),
+            [self.spots[0].pk],
+        )
+        self.assertEqual(self.search({"name": "AREA"}), [self.spots[1].pk])
@@ -0,0 +1,75 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import re
+
+from django.db import connection
+from django.test import TestCase
+from django.test.client import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from mock import patch
+import simplejson as json
+
+from spotseeker_server.models import Spot
+
+# An IN list of more than two ids
+LONG_IN_LIST = re.compile(r"IN \(\d+, \d+, \d+")
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_STREAM_CHUNK_SIZE=2,
+)
+class SearchIndexIdsTest(TestCase):
+    """The ids the indexes find aren't handed back to the database."""
+
+    def setUp(self):
+        self.spots = [
+            Spot.objects.create(name="Spot %s" % i, capacity=10 + i)
+            for i in range(4)
+        ]
+        for spot in self.spots:
+            spot.spotextendedinfo_set.create(key="has_outlets", value="true")
+
+    def search(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = Client().get("/api/v1/spot", params)
+            self.assertEqual(response.status_code, 200)
+            if response.streaming:
+                spots = json.loads(b"".join(response.streaming_content))
+            else:
+                spots = json.loads(response.content)
+        return sorted(spot["id"] for spot in spots), queries
+
+    def test_index_only(self):
+        """Only the spots returned are read if the indexes find them all."""
+        params = {"q": "spot", "extended_info:has_outlets": "true"}
+        self.search(params)
+
+        spot_ids, queries = self.search(dict(params, limit=2))
+        self.assertEqual(len(spot_ids), 2)
+        for query in queries:
+            self.assertNotRegex(query["sql"], LONG_IN_LIST)
+
+    def test_unbounded(self):
+        spot_ids, queries = self.search({"name": "Spot", "limit": 0})
+        self.assertEqual(spot_ids, [spot.pk for spot in self.spots])
+        # The spots are read a chunk at a time as they're sent
+        for query in queries:
+            self.assertNotRegex(query["sql"], LONG_IN_LIST)
+
+    @patch("spotseeker_server.views.search.IN_LIST_LIMIT", 2)
+    def test_intersected_with_the_database(self):
+        """Past IN_LIST_LIMIT, the database's own ids are intersected."""
+        spot_ids, queries = self.search(
+            {"name": "Spot", "capacity": 11, "limit": 0}
+        )
+        self.assertEqual(spot_ids, [spot.pk for spot in self.spots[1:]])
+        for query in queries:
+            self.assertNotRegex(query["sql"], LONG_IN_LIST)
+
+        # A short list is given to the database
+        spot_ids, queries = self.search(
+            {"name": "Spot 3", "capacity": 11, "limit": 0}
+        )
+        self.assertEqual(spot_ids, [self.spots[3].pk])
@@ -0,0 +1,320 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+""" The search tests, run again against the memory search backend, and a
+    differential test of both backends over a generated catalog.
+"""
+
+import functools
+
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+import mock
+
+from spotseeker_server.benchmark import (
+    CENTER_LATITUDE,
+    CENTER_LONGITUDE,
+    SCENARIOS,
+    generate_catalog,
+)
+from spotseeker_server.org_filters import SearchFilterChain
+from spotseeker_server.search_backends.memory import MemorySearchBackend
+from spotseeker_server.test.hours.hours_range import HoursRangeTest
+from spotseeker_server.test.hours.open_at import SpotHoursOpenAtTest
+from spotseeker_server.test.hours.open_now import SpotHoursOpenNowTest
+from spotseeker_server.test.hours.open_now_location import (
+    SpotHoursOpenNowLocationTest,
+)
+from spotseeker_server.test.hours.open_now_location_attributes import (
+    SpotHoursOpenNowLocationAttributesTest,
+)
+from spotseeker_server.test.hours.open_until import SpotHoursOpenUntilTest
+from spotseeker_server.test.search.capacity import SpotSearchCapacityTest
+from spotseeker_server.test.search.distance import SpotSearchDistanceTest
+from spotseeker_server.test.search.distance_fields import (
+    SpotSearchDistanceFieldTest,
+)
+from spotseeker_server.test.search.facets import SpotFacetsTest
+from spotseeker_server.test.search.fields import SpotSearchFieldTest
+from spotseeker_server.test.search.free_text import FreeTextSearchTest
+from spotseeker_server.test.search.item import SpotSearchItemTest
+from spotseeker_server.test.search.limit import SpotSearchLimitTest
+from spotseeker_server.test.search.nearest import NearestSearchTest
+from spotseeker_server.test.search.noise_level import NoiseLevelTestCase
+from spotseeker_server.test.search.time import SpotSearchTimeTest
+from spotseeker_server.test.search.uw_noise_level import UWNoiseLevelTestCase
+from spotseeker_server.test.uw_spot.uw_search import UWSearchTest
+from spotseeker_server.views.search import SearchView
+
+MEMORY_BACKEND = "spotseeker_server.search_backends.memory.MemorySearchBackend"
+
+
+def memory_backend(*left_to_orm):
+    """
+    Runs a search test case again against the memory backend. A test
+    fails if the backend left any of its searches to the ORM, unless
+    it's one of left_to_orm, whose searches use keys that aren't
+    indexed.
+    """
+
+    def decorate(cls):
+        for name in dir(cls):
+            if name.startswith("test") and name not in left_to_orm:
+                setattr(cls, name, _answered(getattr(cls, name)))
+        return override_settings(SPOTSEEKER_SEARCH_BACKEND=MEMORY_BACKEND)(
+            cls
+        )
+
+    return decorate
+
+
+def _answered(test):
+    """Wraps test to fail if the memory backend left a search to the ORM."""
+    search = MemorySearchBackend.filter_on_request
+
+    @functools.wraps(test)
+    def run(self):
+        left = []
+
+        def recorded(backend, view, get_request, *args, **kwargs):
+            spots = search(backend, view, get_request, *args, **kwargs)
+            if spots is None:
+                left.append(get_request.dict())
+            return spots
+
+        with mock.patch.object(
+            MemorySearchBackend, "filter_on_request", recorded
+        ):
+            test(self)
+        self.assertEqual(left, [], "Searches left to the ORM")
+
+    return run
+
+
+@memory_backend()
+class MemoryCapacityTest(SpotSearchCapacityTest):
+    pass
+
+
+@memory_backend("test_invalid_height")
+class MemoryDistanceTest(SpotSearchDistanceTest):
+    pass
+
+
+@memory_backend()
+class MemoryDistanceFieldTest(SpotSearchDistanceFieldTest):
+    pass
+
+
+@memory_backend()
+class MemoryFacetsTest(SpotFacetsTest):
+    pass
+
+
+@memory_backend("test_only_invalid_field", "test_some_invalid_field")
+class MemoryFieldTest(SpotSearchFieldTest):
+    pass
+
+
+@memory_backend()
+class MemoryFreeTextTest(FreeTextSearchTest):
+    pass
+
+
+@memory_backend("test_invalid_item_key")
+class MemoryItemTest(SpotSearchItemTest):
+    pass
+
+
+@memory_backend()
+class MemoryLimitTest(SpotSearchLimitTest):
+    pass
+
+
+@memory_backend()
+class MemoryHoursRangeTest(HoursRangeTest):
+    pass
+
+
+@memory_backend()
+class MemoryNearestTest(NearestSearchTest):
+    pass
+
+
+@memory_backend()
+class MemoryNoiseLevelTest(NoiseLevelTestCase):
+    pass
+
+
+@memory_backend()
+class MemoryOpenAtTest(SpotHoursOpenAtTest):
+    pass
+
+
+@memory_backend()
+class MemoryOpenNowTest(SpotHoursOpenNowTest):
+    pass
+
+
+@memory_backend()
+class MemoryOpenNowLocationTest(SpotHoursOpenNowLocationTest):
+    pass
+
+
+@memory_backend()
+class MemoryOpenNowLocationAttributesTest(
+    SpotHoursOpenNowLocationAttributesTest
+):
+    pass
+
+
+@memory_backend()
+class MemoryOpenUntilTest(SpotHoursOpenUntilTest):
+    pass
+
+
+@memory_backend()
+class MemoryTimeTest(SpotSearchTimeTest):
+    pass
+
+
+@memory_backend()
+class MemoryUWNoiseLevelTest(UWNoiseLevelTestCase):
+    pass
+
+
+@memory_backend()
+class MemoryUWSearchTest(UWSearchTest):
+    pass
+
+
+# Searches beyond the benchmark's, for keys it doesn't cover
+SEARCHES = [
+    {"capacity": 20, "limit": 0},
+    {"capacity": "twenty", "type": "cafe", "limit": 0},
+    {"type": ["cafe", "lounge"], "limit": 0},
+    {"building_name": "Building 3 (B003)", "room_number": "1", "limit": 0},
+    {"item:name": "Item 1", "item:subcategory": "Tripod", "limit": 0},
+    {"item:id": ["1", "2", "x"], "limit": 0},
+    {"extended_info:or:has_outlets": "true", "limit": 0},
+    {"extended_info:noise_level": ["quiet", "moderate"], "limit": 0},
+    {"id": ["1", "2", "3", "400"]},
+    {"name": "Space 1", "limit": 0},
+    {"q": "space", "limit": 5},
+    {
+        "q": "b003",
+        "center_latitude": CENTER_LATITUDE,
+        "center_longitude": CENTER_LONGITUDE,
+        "distance": 300,
+        "limit": 5,
+    },
+    {
+        "center_latitude": CENTER_LATITUDE,
+        "center_longitude": CENTER_LONGITUDE,
+        "distance": 200,
+        "limit": 7,
+    },
+    {
+        "center_latitude": CENTER_LATITUDE + 0.05,
+        "center_longitude": CENTER_LONGITUDE,
+        "distance": 10,
+        "expand_radius": 1,
+        "limit": 3,
+        "extended_info:has_whiteboards": "true",
+    },
+    {
+        "center_latitude": CENTER_LATITUDE,
+        "center_longitude": CENTER_LONGITUDE,
+        "distance": 1000,
+        "open_at": "Sunday,10:00",
+        "limit": 0,
+    },
+]
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_SEARCH_FILTERS=(
+        "spotseeker_server.org_filters.uw_search.Filter",
+    ),
+)
+class MemoryBackendDifferentialTest(TestCase):
+    """Both backends find the same spots, in the same order."""
+
+    @classmethod
+    def setUpTestData(cls):
+        generate_catalog(400, seed=3, buildings=20)
+
+    def setUp(self):
+        SearchFilterChain._load_filters()
+
+    def search(self, params):
+        """Returns the ids the ORM and the memory backend found."""
+        request = RequestFactory().get("/api/v1/spot", params)
+        view = SearchView()
+        orm = view.filter_on_request(
+            request.GET, SearchFilterChain(request), request.META, "spot"
+        )
+        memory = MemorySearchBackend().filter_on_request(
+            view, request.GET, SearchFilterChain(request), request.META, "spot"
+        )
+        self.assertIsNotNone(memory, params)
+        orm = [spot.pk for spot in orm]
+        memory = [spot.pk for spot in memory]
+        if "q" not in params and "center_latitude" not in params:
+            # Neither is in any order
+            orm.sort()
+            memory.sort()
+        return orm, memory
+
+    def test_scenarios(self):
+        for name, params in SCENARIOS:
+            orm, memory = self.search(params)
+            self.assertEqual(orm, memory, name)
+
+    def test_searches(self):
+        found = 0
+        for params in SEARCHES:
+            orm, memory = self.search(params)
+            self.assertEqual(orm, memory, params)
+            found += len(orm)
+        self.assertTrue(found)
+
+    def test_left_to_orm(self):
+        request = RequestFactory().get(
+            "/api/v1/spot", {"manager": "someone"}
+        )
+        self.assertIsNone(
+            MemorySearchBackend().filter_on_request(
+                SearchView(),
+                request.GET,
+                SearchFilterChain(request),
+                request.META,
+                "spot",
+            )
+        )
+
+    def test_errors(self):
+        for params in (
+            {"distance": 100},
+            {"capacity": 1, "limit": 1},
+        ):
+            request = RequestFactory().get("/api/v1/spot", params)
+            with self.assertRaises(Exception) as orm:
+                SearchView().filter_on_request(
+                    request.GET,
+                    SearchFilterChain(request),
+                    request.META,
+                    "spot",
+                )
+            with self.assertRaises(Exception) as memory:
+                MemorySearchBackend().filter_on_request(
+                    SearchView(),
+                    request.GET,
+                    SearchFilterChain(request),
+                    request.META,
+                    "spot",
+                )
+            self.assertEqual(
+                orm.exception.status_code, memory.exception.status_code
+            )
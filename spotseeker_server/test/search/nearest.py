@@ -0,0 +1,110 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.client import Client
+from django.test.utils import override_settings
+import simplejson as json
+
+from spotseeker_server.models import Spot, SpotType
+
+
+@override_settings(SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok")
+class NearestSearchTest(TestCase):
+    """Tests the expand_radius search and the distance of each result."""
+
+    def setUp(self):
+        self.study_room = SpotType.objects.create(name="study_room")
+        # Due north of (30, -40); 0.0009 degrees is about 100m
+        self.spots = []
+        for i in range(1, 15):
+            spot = Spot.objects.create(
+                name="Spot %s" % i,
+                latitude=Decimal("30") + Decimal("0.0009") * i * i,
+                longitude=Decimal("-40"),
+            )
+            if i % 2 == 0:
+                spot.spottypes.add(self.study_room)
+            self.spots.append(spot)
+
+    def search(self, params):
+        search = {
+            "center_latitude": 30,
+            "center_longitude": -40,
+            "distance": 10,
+            "expand_radius": 1,
+        }
+        search.update(params)
+        response = Client().get("/api/v1/spot", search)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(response.content)
+
+    def test_expands_to_nearest_ten(self):
+        spots = self.search({})
+        self.assertEqual(
+            [spot["id"] for spot in spots],
+            [spot.pk for spot in self.spots[:10]],
+        )
+        dists = [spot["distance_m"] for spot in spots]
+        self.assertEqual(dists, sorted(dists))
+        self.assertAlmostEqual(dists[0], 100, delta=1)
+
+    def test_limit(self):
+        spots = self.search({"limit": 3})
+        self.assertEqual(
+            [spot["id"] for spot in spots],
+            [spot.pk for spot in self.spots[:3]],
+        )
+
+    def test_other_filters(self):
+        spots = self.search({"type": "study_room", "limit": 4})
+        self.assertEqual(
+            [spot["id"] for spot in spots],
+            [self.spots[i].pk for i in (1, 3, 5, 7)],
+        )
+
+    def test_max_distance(self):
+        with self.settings(SPOTSEEKER_SEARCH_MAX_DISTANCE=2000):
+            spots = self.search({})
+        # Spot 4 is 1600m away, and spot 5 2500m
+        self.assertEqual(
+            [spot["id"] for spot in spots],
+            [spot.pk for spot in self.spots[:4]],
+        )
+
+    def test_box_results_in_order(self):
+        response = Client().get(
+            "/api/v1/spot",
+            {"center_latitude": 30, "center_longitude": -40, "distance": 3000},
+        )
+        spots = json.loads(response.content)
+        self.assertEqual(
+            [spot["id"] for spot in spots],
+            [spot.pk for spot in self.spots[:5]],
+        )
+        self.assertTrue(all("distance_m" in spot for spot in spots))
+
+    def test_no_distance_without_center(self):
+        response = Client().get("/api/v1/spot", {"type": "study_room"})
+        for spot in json.loads(response.content):
+            self.assertNotIn("distance_m", spot)
+
+    def test_cached_results_in_order(self):
+        locmem = {
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            }
+        }
+        with self.settings(CACHES=locmem):
+            cache.clear()
+            first = self.search({"limit": 5})
+            second = self.search({"limit": 5})
+            cache.clear()
+        self.assertEqual(first, second)
+        self.assertEqual(
+            [spot["id"] for spot in second],
+            [spot.pk for spot in self.spots[:5]],
+        )
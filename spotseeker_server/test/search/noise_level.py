@@ -20,16 +20,12 @@ def spot_with_noise_level(name, noise_level):
 class NoiseLevelTestCase(TestCase):
 
     @classmethod
-    def setUpClass(cls):
+    def setUpTestData(cls):
         cls.silent_spot = spot_with_noise_level('Silent Spot', 'silent')
         cls.quiet_spot = spot_with_noise_level('Quiet Spot', 'quiet')
         cls.moderate_spot = spot_with_noise_level('Moderate', 'moderate')
         cls.variable_spot = spot_with_noise_level('Var Spot', 'variable')
 
-    @classmethod
-    def tearDownClass(cls):
-        Spot.objects.all().delete()
-
     def get_spots_for_noise_levels(self, levels):
         """Do a search for spots with particular noise levels"""
         c = self.client
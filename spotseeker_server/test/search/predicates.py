@@ -0,0 +1,84 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from django.test import RequestFactory, TestCase
+from django.test.utils import override_settings
+
+from spotseeker_server.models import Spot, SpotExtendedInfo
+from spotseeker_server.org_filters import (
+    SearchFilter,
+    SearchFilterChain,
+    SearchPredicates,
+)
+from spotseeker_server.views.search import SearchView
+
+
+class NoTechFilter(SearchFilter):
+    def add_predicates(self, predicates):
+        self.has_valid_search_param = True
+        predicates.exclude("extended_info:app_type")
+
+
+class RoomyFilter(SearchFilter):
+    def add_predicates(self, predicates):
+        predicates.exclude("extended_info:app_type")
+        predicates.range("capacity", minimum=10)
+
+
+@override_settings(SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok")
+class SearchPredicatesTest(TestCase):
+    def setUp(self):
+        self.small = Spot.objects.create(name="Small", capacity=4)
+        self.large = Spot.objects.create(name="Large", capacity=40)
+        self.huge = Spot.objects.create(name="Huge", capacity=400)
+        self.tech = Spot.objects.create(name="Tech", capacity=20)
+        SpotExtendedInfo.objects.create(
+            spot=self.tech, key="app_type", value="tech"
+        )
+        SpotExtendedInfo.objects.create(
+            spot=self.large, key="has_outlets", value="true"
+        )
+
+    def filter(self, predicates):
+        return set(predicates.filter(Spot.objects.all()))
+
+    def test_include(self):
+        predicates = SearchPredicates()
+        predicates.include("name", ["Small", "Large", "Tech"])
+        predicates.include("name", ["Large", "Tech", "Huge"])
+        self.assertEqual(self.filter(predicates), set([self.large, self.tech]))
+
+        predicates.include("extended_info:has_outlets", ["true"])
+        self.assertEqual(self.filter(predicates), set([self.large]))
+
+    def test_exclude(self):
+        predicates = SearchPredicates()
+        predicates.exclude("name", ["Small"])
+        predicates.exclude("name", ["Huge"])
+        predicates.exclude("extended_info:app_type")
+        self.assertEqual(self.filter(predicates), set([self.large]))
+
+    def test_range(self):
+        predicates = SearchPredicates()
+        predicates.range("capacity", minimum=10)
+        predicates.range("capacity", maximum=100)
+        predicates.range("capacity", minimum=5, maximum=1000)
+        self.assertEqual(predicates.ranges, {"capacity": (10, 100)})
+        self.assertEqual(self.filter(predicates), set([self.large, self.tech]))
+
+    def test_chain_merges_filters(self):
+        request = RequestFactory().get("/api/v1/spot", {"limit": 0})
+        chain = SearchFilterChain(request)
+        chain.filters = [NoTechFilter(request), RoomyFilter(request)]
+
+        predicates = chain.predicates()
+        self.assertTrue(chain.has_valid_search_param)
+        # Both filters left out techloan spots; that's checked once
+        self.assertEqual(len(predicates.info.conditions), 1)
+
+        chain = SearchFilterChain(request)
+        chain.filters = [NoTechFilter(request), RoomyFilter(request)]
+        spots = SearchView().filter_on_request(
+            request.GET, chain, request.META, "spot"
+        )
+        self.assertEqual(set(spots), set([self.large, self.huge]))
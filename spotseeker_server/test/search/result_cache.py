@@ -0,0 +1,141 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import datetime
+
+from django.core.cache import cache
+from django.db import transaction
+from django.http import QueryDict
+from django.test import TestCase, TransactionTestCase
+from django.test.client import Client
+from django.test.utils import override_settings
+import mock
+import simplejson as json
+
+from spotseeker_server import catalog
+from spotseeker_server.models import Spot
+from spotseeker_server.views.search import SearchView
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    },
+)
+class SearchResultCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.spot = Spot.objects.create(name="Cached", capacity=10)
+
+    def search(self, params):
+        response = Client().get("/api/v1/spot", params)
+        return [spot["id"] for spot in json.loads(response.content)]
+
+    def test_cache_key_normalized(self):
+        view = SearchView()
+        key = view.results_cache_key(
+            QueryDict("type=b&capacity=1&type=a&oauth_nonce=123")
+        )
+        self.assertEqual(
+            key, view.results_cache_key(QueryDict("capacity=1&type=a&type=b"))
+        )
+        self.assertNotEqual(
+            key, view.results_cache_key(QueryDict("capacity=2&type=a&type=b"))
+        )
+
+    def test_fuzzy_hours_order_kept(self):
+        view = SearchView()
+        key = view.results_cache_key(
+            QueryDict(
+                "fuzzy_hours_start=Monday,10:00&fuzzy_hours_end=Monday,11:00"
+                "&fuzzy_hours_start=Tuesday,10:00"
+                "&fuzzy_hours_end=Tuesday,11:00"
+            )
+        )
+        other_key = view.results_cache_key(
+            QueryDict(
+                "fuzzy_hours_start=Tuesday,10:00&fuzzy_hours_end=Monday,11:00"
+                "&fuzzy_hours_start=Monday,10:00"
+                "&fuzzy_hours_end=Tuesday,11:00"
+            )
+        )
+        self.assertNotEqual(key, other_key)
+
+    def test_results_cached(self):
+        self.assertEqual(self.search({"capacity": 5}), [self.spot.pk])
+
+        with mock.patch.object(SearchView, "filter_on_request") as search:
+            self.assertEqual(self.search({"capacity": 5}), [self.spot.pk])
+            self.assertFalse(search.called)
+
+    def test_catalog_change_invalidates(self):
+        generation = catalog.generation()
+        self.assertEqual(self.search({"capacity": 5}), [self.spot.pk])
+
+        other = Spot.objects.create(name="Also big", capacity=20)
+        self.assertNotEqual(generation, catalog.generation())
+        self.assertEqual(
+            set(self.search({"capacity": 5})), set([self.spot.pk, other.pk])
+        )
+
+        self.spot.capacity = 1
+        self.spot.save()
+        self.assertEqual(self.search({"capacity": 5}), [other.pk])
+
+    @override_settings(SPOTSEEKER_SEARCH_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        self.assertIsNone(
+            SearchView().results_cache_key(QueryDict("capacity=5"))
+        )
+
+    @mock.patch("spotseeker_server.views.search.SearchView.get_datetime")
+    def test_open_now_timeout(self, datetime_mock):
+        datetime_mock.return_value = ("w", datetime(16, 2, 3, 9, 0, 45).time())
+        view = SearchView()
+        self.assertEqual(
+            view.results_cache_timeout(QueryDict("open_now=true")), 15
+        )
+        self.assertEqual(
+            view.results_cache_timeout(QueryDict("capacity=5")), 300
+        )
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "committed_generation_test",
+        }
+    },
+)
+class CommittedGenerationTest(TransactionTestCase):
+    """Writes in a transaction move the generation on as they commit."""
+
+    def setUp(self):
+        cache.clear()
+
+    def test_results_cached_before_commit(self):
+        view = SearchView()
+        with transaction.atomic():
+            spot = Spot.objects.create(name="New", capacity=10)
+            # Another worker searches the rows from before the write
+            cache.set(view.results_cache_key(QueryDict("capacity=5")), [])
+            generation = catalog.generation()
+
+        self.assertNotEqual(generation, catalog.generation())
+        response = Client().get("/api/v1/spot", {"capacity": 5})
+        self.assertEqual(
+            [spot["id"] for spot in json.loads(response.content)], [spot.pk]
+        )
+
+    def test_rolled_back(self):
+        generation = catalog.generation()
+        with self.assertRaises(ValueError):
+            with transaction.atomic():
+                Spot.objects.create(name="Gone", capacity=10)
+                raise ValueError()
+        self.assertNotEqual(generation, catalog.generation())
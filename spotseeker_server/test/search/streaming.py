@@ -0,0 +1,114 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.client import Client, RequestFactory
+from django.test.utils import override_settings
+from mock import patch
+import simplejson as json
+
+from spotseeker_server.logger.oauth import LogMiddleware
+from spotseeker_server.models import Spot
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_STREAM_CHUNK_SIZE=2,
+)
+class StreamingResponseTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.spots = [
+            Spot.objects.create(name="Streamed %s" % i, capacity=10)
+            for i in range(5)
+        ]
+
+    def test_all_spots(self):
+        response = Client().get("/api/v1/spot/all")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        spots = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            sorted(spot["id"] for spot in spots),
+            sorted(spot.pk for spot in self.spots),
+        )
+
+    def test_all_spots_ndjson(self):
+        response = Client().get(
+            "/api/v1/spot/all", HTTP_ACCEPT="application/x-ndjson"
+        )
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(
+            sorted(json.loads(line)["id"] for line in lines),
+            sorted(spot.pk for spot in self.spots),
+        )
+
+    def test_empty_catalog(self):
+        Spot.objects.all().delete()
+        response = Client().get("/api/v1/spot/all")
+        self.assertEqual(b"".join(response.streaming_content), b"[]")
+
+    def test_unlimited_search(self):
+        response = Client().get("/api/v1/spot", {"capacity": 5, "limit": 0})
+        self.assertTrue(response.streaming)
+        spots = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(spots), 5)
+
+        # The default limit still answers in one piece
+        response = Client().get("/api/v1/spot", {"capacity": 5})
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(json.loads(response.content)), 5)
+
+    def test_unlimited_search_in_chunks(self):
+        """The spots are loaded a chunk at a time, not all up front."""
+        in_bulk = Spot.objects.in_bulk
+        with patch.object(
+            Spot.objects, "in_bulk", side_effect=in_bulk
+        ) as loads:
+            response = Client().get(
+                "/api/v1/spot", {"capacity": 5, "limit": 0}
+            )
+            self.assertEqual(loads.call_count, 0)
+            spots = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            [len(call[0][0]) for call in loads.call_args_list], [2, 2, 1]
+        )
+        self.assertEqual(
+            [spot["id"] for spot in spots], [spot.pk for spot in self.spots]
+        )
+
+    def test_unlimited_search_nearest_first(self):
+        for i, spot in enumerate(reversed(self.spots)):
+            spot.latitude = Decimal("47.65%s" % i)
+            spot.longitude = Decimal("-122.31")
+            spot.save()
+        for indexed in (True, False):
+            with self.settings(SPOTSEEKER_SPATIAL_INDEX=indexed):
+                response = Client().get(
+                    "/api/v1/spot",
+                    {
+                        "center_latitude": "47.65",
+                        "center_longitude": "-122.31",
+                        "distance": 1000,
+                        "limit": 0,
+                    },
+                )
+            spots = json.loads(b"".join(response.streaming_content))
+            self.assertEqual(
+                [spot["id"] for spot in spots],
+                [spot.pk for spot in reversed(self.spots)],
+            )
+            self.assertEqual(spots[0]["distance_m"], 0)
+
+    def test_log_middleware_leaves_stream(self):
+        request = RequestFactory().get("/api/v1/spot/all")
+        response = Client().get("/api/v1/spot/all")
+        response = LogMiddleware(None).process_response(request, response)
+        spots = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(spots), 5)
@@ -0,0 +1,158 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.test.utils import override_settings
+import simplejson as json
+
+from spotseeker_server import spot_cache
+from spotseeker_server.models import Spot, SpotDocument
+from spotseeker_server.spot_cache import local_cache
+
+
+@override_settings(SPOTSEEKER_LOCAL_CACHE_SIZE=10)
+class LocalSpotCacheTest(TestCase):
+    """The per-process tier in front of the shared spot cache."""
+
+    def setUp(self):
+        local_cache.clear()
+        spot_cache.reset_stats()
+        self.spots = [
+            Spot.objects.create(name="Spot %s" % i) for i in range(3)
+        ]
+
+    def tearDown(self):
+        local_cache.clear()
+
+    def reload(self):
+        return list(Spot.objects.filter(pk__in=[s.pk for s in self.spots]))
+
+    def test_bulk_json_bytes(self):
+        fragments = Spot.bulk_json_bytes(self.spots)
+        self.assertEqual(len(local_cache), 3)
+
+        # Served from the process, without the shared cache or database
+        spots = self.reload()
+        with self.assertNumQueries(0):
+            self.assertEqual(Spot.bulk_json_bytes(spots), fragments)
+
+        stats = spot_cache.stats()
+        self.assertEqual(stats["local"], {"hits": 3, "misses": 3, "size": 3})
+        self.assertEqual(stats["shared"], {"hits": 0, "misses": 3})
+        self.assertEqual(stats["document"], {"hits": 0, "misses": 3})
+
+    def test_json_data_structure(self):
+        spot_json = self.spots[0].json_data_structure()
+        spot = Spot.objects.get(pk=self.spots[0].pk)
+        with self.assertNumQueries(0):
+            cached_json = spot.json_data_structure()
+        self.assertEqual(cached_json, spot_json)
+
+        # Each caller gets its own copy
+        cached_json["name"] = "Changed"
+        self.assertEqual(spot.json_data_structure()["name"], "Spot 0")
+
+    def test_changed_spot(self):
+        Spot.bulk_json_bytes(self.spots)
+        self.spots[0].name = "Renamed"
+        self.spots[0].save()
+
+        # The old entry doesn't match the new etag
+        fragments = Spot.bulk_json_bytes(self.reload())
+        self.assertEqual(json.loads(fragments[0])["name"], "Renamed")
+        self.assertEqual(spot_cache.stats()["local"]["hits"], 2)
+
+    def test_save_document(self):
+        self.spots[0].save_document()
+        with self.assertNumQueries(1):
+            spot = Spot.objects.get(pk=self.spots[0].pk)
+            spot.json_data_structure()
+
+    def test_least_recently_used(self):
+        with self.settings(SPOTSEEKER_LOCAL_CACHE_SIZE=2):
+            Spot.bulk_json_bytes(self.spots[:2])
+            Spot.bulk_json_bytes(self.spots[:1])
+            Spot.bulk_json_bytes(self.spots[2:])
+            self.assertEqual(len(local_cache), 2)
+            self.assertEqual(
+                set(local_cache.get_many(self.spots)),
+                set([self.spots[0].pk, self.spots[2].pk]),
+            )
+
+    def test_disabled(self):
+        with self.settings(SPOTSEEKER_LOCAL_CACHE_SIZE=0):
+            Spot.bulk_json_bytes(self.spots)
+            self.assertEqual(len(local_cache), 0)
+            Spot.bulk_json_bytes(self.spots)
+        self.assertEqual(spot_cache.stats()["local"]["hits"], 0)
+
+
+@override_settings(
+    CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "shared_spot_cache_test",
+        }
+    },
+    SPOTSEEKER_LOCAL_CACHE_SIZE=0,
+)
+class SharedSpotCacheTest(TestCase):
+    """Early refresh and single builds in the shared tier."""
+
+    def setUp(self):
+        cache.clear()
+        self.spot = Spot.objects.create(name="Popular")
+
+    def test_early_refresh(self):
+        etag = self.spot.etag
+        entry = spot_cache.shared_entry(etag, b"{}", 0.01)
+        self.assertTrue(spot_cache.is_fresh(entry, etag))
+        self.assertFalse(spot_cache.is_fresh(entry, "other"))
+        self.assertFalse(spot_cache.is_fresh({"etag": etag}, etag))
+
+        # Slow to make, and about to expire
+        entry = (etag, b"{}", time.time() + 0.01, 1000)
+        self.assertFalse(spot_cache.is_fresh(entry, etag))
+        with self.settings(SPOTSEEKER_EARLY_REFRESH=0):
+            self.assertTrue(spot_cache.is_fresh(entry, etag))
+        self.assertTrue(spot_cache.is_fresh(entry[:2] + (None, 1000), etag))
+
+    def test_lease(self):
+        self.assertEqual(spot_cache.lease([self.spot]), ([self.spot], []))
+        self.assertEqual(spot_cache.lease([self.spot]), ([], [self.spot]))
+        spot_cache.release([self.spot])
+        self.assertEqual(spot_cache.lease([self.spot]), ([self.spot], []))
+
+    def test_single_build(self):
+        Spot.bulk_json_bytes([self.spot])
+        self.assertEqual(SpotDocument.objects.count(), 1)
+        # The lease is given back
+        self.assertEqual(spot_cache.lease([self.spot]), ([self.spot], []))
+
+    def test_waits_for_build(self):
+        # Another request is building the spot
+        spot_cache.lease([self.spot])
+        entry = spot_cache.shared_entry(self.spot.etag, b'{"id": 0}', 0)
+        built = threading.Timer(
+            0.1,
+            cache.set,
+            [self.spot.json_bytes_cache_key(), entry],
+        )
+        built.start()
+        try:
+            fragments = Spot.bulk_json_bytes([self.spot])
+        finally:
+            built.join()
+        self.assertEqual(fragments, [b'{"id": 0}'])
+        self.assertFalse(SpotDocument.objects.exists())
+
+    @override_settings(SPOTSEEKER_BUILD_WAIT=0.1)
+    def test_stops_waiting(self):
+        spot_cache.lease([self.spot])
+        spot_json = self.spot.json_data_structure()
+        self.assertEqual(spot_json["name"], "Popular")
+        self.assertEqual(SpotDocument.objects.count(), 1)
@@ -3,9 +3,13 @@
 
 from django.test import TestCase, override_settings
 from django.core.cache import cache
-from spotseeker_server.models import Spot
+import simplejson as json
+from spotseeker_server import spot_cache
+from spotseeker_server.models import Item, Spot, SpotAvailableHours, SpotType
 
 
+# The shared and document tiers, without the per-process one in front
+@override_settings(SPOTSEEKER_LOCAL_CACHE_SIZE=0)
 class SpotCacheTest(TestCase):
 
     @override_settings(CACHES={
@@ -21,12 +25,21 @@ class SpotCacheTest(TestCase):
         # Assert that a cache entry is created when we call
         # json_data_structure()
         js = spot.json_data_structure()
-        cached_js = cache.get(spot.json_cache_key())
+        cached_etag, cached_js = cache.get(spot.json_cache_key())[:2]
+        self.assertEqual(cached_etag, spot.etag)
         self.assertEqual(js, cached_js)
 
-        # Assert that saving the spot removes the cache entry
+        # Assert that saving the spot unchanged keeps its etag, and
+        # the cache entry
+        etag = spot.etag
         spot.save()
-        self.assertNotIn(spot_id, cache)
+        self.assertEqual(spot.etag, etag)
+        self.assertEqual(cache.get(spot.json_cache_key())[1], js)
+
+        # Assert that changing the spot removes the cache entry
+        spot.name = 'bar'
+        spot.save()
+        self.assertIsNone(cache.get(spot.json_cache_key()))
 
         # Assert that the spot now has a new etag
         new_js = spot.json_data_structure()
@@ -34,9 +47,92 @@ class SpotCacheTest(TestCase):
         self.assertEqual(new_js['etag'], spot.etag)
 
         # Assert the new cache entry reflects the updated etag
-        new_cached_js = cache.get(spot.json_cache_key())
+        new_cached_js = cache.get(spot.json_cache_key())[1]
         self.assertEqual(new_js, new_cached_js)
 
         # Assert that deleting the spot removes the cache entry
         spot.delete()
         self.assertNotIn(spot_id, cache)
+
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    })
+    def test_bulk_json_data_structure(self):
+        cache.clear()
+        spot_type = SpotType.objects.create(name='study_room')
+        spots = []
+        for i in range(5):
+            spot = Spot.objects.create(name='Spot %s' % i)
+            spot.spottypes.add(spot_type)
+            spot.spotextendedinfo_set.create(key='has_outlets', value='true')
+            SpotAvailableHours.objects.create(
+                spot=spot, day='m', start_time='10:00', end_time='12:00')
+            SpotAvailableHours.objects.create(
+                spot=spot, day='m', start_time='08:00', end_time='09:00')
+            item = Item.objects.create(name='Item %s' % i, spot=spot)
+            item.itemextendedinfo_set.create(key='i_has_lens', value='true')
+            spots.append(spot)
+        spots = list(Spot.objects.filter(pk__in=[s.pk for s in spots]))
+
+        # One query per prefetched relation, regardless of the number
+        # of spots, along with reading their documents and then saving
+        # them (a savepoint, a delete and an insert)
+        with self.assertNumQueries(len(Spot.JSON_PREFETCH) + 6):
+            bulk_js = Spot.bulk_json_data_structure(spots)
+
+        # Once the cache is gone, the documents are read in one query
+        cache.clear()
+        with self.assertNumQueries(1):
+            self.assertEqual(Spot.bulk_json_data_structure(spots), bulk_js)
+
+        cache.clear()
+        self.assertEqual(bulk_js, [spot.json_data_structure()
+                                   for spot in spots])
+        self.assertEqual(bulk_js[0]['available_hours']['monday'],
+                         [['08:00', '09:00'], ['10:00', '12:00']])
+
+        # Everything is cached now
+        spots = list(Spot.objects.filter(pk__in=[s.pk for s in spots]))
+        with self.assertNumQueries(0):
+            self.assertEqual(Spot.bulk_json_data_structure(spots), bulk_js)
+
+        # A stale entry gets rebuilt
+        spots[0].name = 'Renamed'
+        spots[0].save()
+        cache.set(spots[0].json_cache_key(), spot_cache.shared_entry(
+            bulk_js[0]['etag'], bulk_js[0], 0))
+        new_js = Spot.bulk_json_data_structure(spots)
+        self.assertEqual(new_js[0]['name'], 'Renamed')
+        self.assertEqual(new_js[1:], bulk_js[1:])
+
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    })
+    def test_bulk_json_bytes(self):
+        cache.clear()
+        spots = [Spot.objects.create(name='Spot %s' % i) for i in range(3)]
+
+        fragments = Spot.bulk_json_bytes(spots)
+        self.assertEqual([json.loads(fragment) for fragment in fragments],
+                         Spot.bulk_json_data_structure(spots))
+
+        # The encoded fragments are cached alongside the etag
+        etag, encoded = cache.get(spots[0].json_bytes_cache_key())[:2]
+        self.assertEqual(etag, spots[0].etag)
+        self.assertEqual(encoded, fragments[0])
+        with self.assertNumQueries(0):
+            self.assertEqual(Spot.bulk_json_bytes(spots), fragments)
+
+        # Saving the spot drops both entries, and the new etag is used
+        spots[0].name = 'Renamed'
+        spots[0].save()
+        self.assertIsNone(cache.get(spots[0].json_bytes_cache_key()))
+        self.assertIsNone(cache.get(spots[0].json_cache_key()))
+        new_fragments = Spot.bulk_json_bytes(spots)
+        self.assertEqual(json.loads(new_fragments[0])['name'], 'Renamed')
+        self.assertEqual(json.loads(new_fragments[0])['etag'], spots[0].etag)
+        self.assertEqual(new_fragments[1:], fragments[1:])
@@ -0,0 +1,158 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.test.utils import override_settings
+from django.utils import timezone
+import simplejson as json
+
+from spotseeker_server.models import Spot, SpotTombstone
+from spotseeker_server.views.spot_changes import sync_token, token_time
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_CHANGES_OVERLAP=0,
+)
+class SpotChangesTest(TestCase):
+    def setUp(self):
+        self.spots = [
+            Spot.objects.create(name="Spot %s" % i) for i in range(3)
+        ]
+
+    def changes(self, since=None):
+        params = {}
+        if since is not None:
+            params["since"] = since
+        response = self.client.get("/api/v1/spot/changes", params)
+        self.assertEqual(response.status_code, 200)
+        return json.loads(b"".join(response.streaming_content))
+
+    def test_token(self):
+        now = timezone.now()
+        self.assertEqual(token_time(sync_token(now)), now)
+
+    def test_first_sync(self):
+        changes = self.changes()
+        self.assertEqual(
+            [spot["id"] for spot in changes["spots"]],
+            [spot.pk for spot in self.spots],
+        )
+        self.assertEqual(
+            changes["spots"][0], self.spots[0].json_data_structure()
+        )
+        self.assertEqual(changes["deleted"], [])
+
+    def test_changes(self):
+        token = self.changes()["token"]
+        self.assertEqual(self.changes(token)["spots"], [])
+
+        self.spots[0].name = "Renamed"
+        self.spots[0].save()
+        deleted = self.spots[1].pk
+        self.spots[1].delete()
+        new = Spot.objects.create(name="New")
+
+        changes = self.changes(token)
+        self.assertEqual(
+            [spot["id"] for spot in changes["spots"]],
+            [self.spots[0].pk, new.pk],
+        )
+        self.assertEqual(changes["spots"][0]["name"], "Renamed")
+        self.assertEqual(changes["deleted"], [deleted])
+
+        # Nothing more since
+        changes = self.changes(changes["token"])
+        self.assertEqual(changes["spots"], [])
+        self.assertEqual(changes["deleted"], [])
+
+    def test_unchanged_save(self):
+        token = self.changes()["token"]
+        Spot.objects.get(pk=self.spots[0].pk).save()
+        self.assertEqual(self.changes(token)["spots"], [])
+
+    def test_overlap(self):
+        token = self.changes()["token"]
+        with self.settings(SPOTSEEKER_CHANGES_OVERLAP=60):
+            self.assertEqual(len(self.changes(token)["spots"]), 3)
+
+    def test_tombstone(self):
+        spot_id = self.spots[2].pk
+        self.spots[2].delete()
+        self.assertEqual(
+            list(SpotTombstone.objects.values_list("spot_id", flat=True)),
+            [spot_id],
+        )
+
+    def test_queryset_delete(self):
+        token = self.changes()["token"]
+        spot_ids = [spot.pk for spot in self.spots[:2]]
+        Spot.objects.filter(pk__in=spot_ids).delete()
+        self.assertEqual(
+            sorted(SpotTombstone.objects.values_list("spot_id", flat=True)),
+            spot_ids,
+        )
+        self.assertEqual(self.changes(token)["deleted"], spot_ids)
+
+    def test_invalid_token(self):
+        for since in ("yesterday", "9" * 40):
+            response = self.client.get(
+                "/api/v1/spot/changes", {"since": since}
+            )
+            self.assertEqual(response.status_code, 400)
+
+    def test_expired_token(self):
+        token = sync_token(timezone.now() - timedelta(days=2))
+        with self.settings(SPOTSEEKER_TOMBSTONE_RETENTION=24 * 60 * 60):
+            response = self.client.get(
+                "/api/v1/spot/changes", {"since": token}
+            )
+            self.assertEqual(response.status_code, 410)
+
+        # Unless the tombstones are kept forever
+        with self.settings(SPOTSEEKER_TOMBSTONE_RETENTION=None):
+            self.assertEqual(len(self.changes(token)["spots"]), 3)
+
+    def test_pruned(self):
+        """Tombstones past the retention go with the next delete."""
+        self.spots[0].delete()
+        SpotTombstone.objects.update(
+            deleted=timezone.now() - timedelta(days=31)
+        )
+        spot_id = self.spots[1].pk
+        self.spots[1].delete()
+        self.assertEqual(
+            list(SpotTombstone.objects.values_list("spot_id", flat=True)),
+            [spot_id],
+        )
+
+    def test_etag(self):
+        response = self.client.get("/api/v1/spot/changes")
+        etag = response["ETag"]
+        token = json.loads(b"".join(response.streaming_content))["token"]
+
+        response = self.client.get(
+            "/api/v1/spot/changes", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+        # Each change to the spots or deletion is a new etag
+        self.spots[0].name = "Renamed"
+        self.spots[0].save()
+        response = self.client.get(
+            "/api/v1/spot/changes", HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+        response = self.client.get("/api/v1/spot/changes", {"since": token})
+        etag = response["ETag"]
+        self.spots[1].delete()
+        response = self.client.get(
+            "/api/v1/spot/changes",
+            {"since": token},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,190 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from os.path import abspath, dirname
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase
+from django.test.utils import override_settings
+import simplejson as json
+
+from spotseeker_server.models import (
+    Item,
+    ItemExtendedInfo,
+    Spot,
+    SpotAvailableHours,
+    SpotDocument,
+    SpotExtendedInfo,
+    SpotType,
+)
+from spotseeker_server.test import utils_test
+
+TEST_ROOT = abspath(dirname(__file__))
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_SPOT_FORM="spotseeker_server.default_forms.spot."
+    "DefaultSpotForm",
+    SPOTSEEKER_SPOTEXTENDEDINFO_FORM="spotseeker_server.default_forms.spot."
+    "DefaultSpotExtendedInfoForm",
+    SPOTSEEKER_AUTH_ADMINS=("demo_user",),
+    SPOTSEEKER_LOCAL_CACHE_SIZE=0,
+)
+class SpotDocumentTest(TestCase):
+    def setUp(self):
+        self.spot = Spot.objects.create(name="Documented")
+        self.url = "/api/v1/spot/%s" % self.spot.pk
+
+    def document(self):
+        document = SpotDocument.objects.get(spot=self.spot)
+        return document.etag, json.loads(document.document)
+
+    def test_read_builds_document(self):
+        self.assertFalse(SpotDocument.objects.exists())
+        spot_json = self.spot.json_data_structure()
+
+        etag, document = self.document()
+        self.assertEqual(etag, self.spot.etag)
+        self.assertEqual(document, json.loads(json.dumps(spot_json)))
+
+        # A read is one query now
+        with self.assertNumQueries(1):
+            self.assertEqual(self.spot.json_data_structure(), spot_json)
+
+    def test_out_of_date_document(self):
+        self.spot.json_data_structure()
+        self.spot.name = "Renamed"
+        self.spot.save()
+
+        self.assertEqual(self.spot.json_data_structure()["name"], "Renamed")
+        etag, document = self.document()
+        self.assertEqual(etag, self.spot.etag)
+        self.assertEqual(document["name"], "Renamed")
+
+    def test_put_writes_document(self):
+        response = self.client.get(self.url)
+        response = self.client.put(
+            self.url,
+            json.dumps(utils_test.get_spot("Put", 10)),
+            content_type="application/json",
+            If_Match=response["ETag"],
+        )
+        self.assertEqual(response.status_code, 200)
+
+        etag, document = self.document()
+        self.assertEqual(etag, response["ETag"])
+        self.assertEqual(document, json.loads(response.content))
+        self.assertEqual(document["name"], "Put")
+
+    def test_post_writes_document(self):
+        response = self.client.post(
+            "/api/v1/spot/",
+            json.dumps(utils_test.get_spot("Posted", 10)),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+        spot = Spot.objects.get(name="Posted")
+        document = SpotDocument.objects.get(spot=spot)
+        self.assertEqual(document.etag, response["ETag"])
+
+    def test_image_writes_document(self):
+        directory = tempfile.mkdtemp()
+        try:
+            with self.settings(MEDIA_ROOT=directory):
+                self.spot.json_data_structure()
+                spot_etag = self.spot.etag
+                with open("%s/resources/test_gif.gif" % TEST_ROOT, "rb") as f:
+                    image = self.spot.spotimage_set.create(
+                        description="A GIF",
+                        image=SimpleUploadedFile(
+                            "test_gif.gif", f.read(), "image/gif"
+                        ),
+                    )
+
+                # The spot's etag covers the image, and so does its
+                # document
+                etag, document = self.document()
+                self.assertNotEqual(etag, spot_etag)
+                self.assertEqual(etag, Spot.objects.get(pk=self.spot.pk).etag)
+                self.assertEqual(
+                    [image["description"] for image in document["images"]],
+                    ["A GIF"],
+                )
+
+                image.delete()
+                etag, document = self.document()
+                self.assertEqual(document["images"], [])
+        finally:
+            shutil.rmtree(directory)
+
+    def read(self):
+        """The spot's document as a fresh request would read it."""
+        cache.clear()
+        spot = Spot.objects.get(pk=self.spot.pk)
+        return spot.etag, spot.json_data_structure()
+
+    def test_related_writes(self):
+        item = Item.objects.create(name="Camera", spot=self.spot)
+        etag, spot_json = self.read()
+        self.assertEqual(spot_json["items"][0]["name"], "Camera")
+
+        # Writes that never go through the spot still change its
+        # document
+        item.name = "Renamed camera"
+        item.save()
+        ItemExtendedInfo.objects.create(
+            item=item, key="i_has_lens", value="true"
+        )
+        self.spot.spottypes.add(SpotType.objects.create(name="study_room"))
+        new_etag, spot_json = self.read()
+        self.assertNotEqual(new_etag, etag)
+        self.assertEqual(spot_json["etag"], new_etag)
+        self.assertEqual(spot_json["items"][0]["name"], "Renamed camera")
+        self.assertEqual(
+            spot_json["items"][0]["extended_info"], {"i_has_lens": "true"}
+        )
+        self.assertEqual(spot_json["type"], ["study_room"])
+
+        SpotType.objects.get(name="study_room").spots.clear()
+        item.delete()
+        etag, spot_json = self.read()
+        self.assertEqual(spot_json["type"], [])
+        self.assertEqual(spot_json["items"], [])
+
+    def test_related_deletes(self):
+        self.spot.spotextendedinfo_set.create(key="has_outlets", value="true")
+        SpotAvailableHours.objects.create(
+            spot=self.spot, day="m", start_time="08:00", end_time="12:00"
+        )
+        etag, spot_json = self.read()
+        self.assertEqual(spot_json["available_hours"]["monday"], [
+            ["08:00", "12:00"]
+        ])
+
+        # As the admin deletes them
+        SpotExtendedInfo.objects.filter(spot=self.spot).delete()
+        SpotAvailableHours.objects.get(spot=self.spot).delete()
+        new_etag, spot_json = self.read()
+        self.assertNotEqual(new_etag, etag)
+        self.assertEqual(spot_json["extended_info"], {})
+        self.assertEqual(spot_json["available_hours"]["monday"], [])
+
+    def test_moved_item(self):
+        other = Spot.objects.create(name="Other")
+        item = Item.objects.create(name="Camera", spot=self.spot)
+        etag = Spot.objects.get(pk=self.spot.pk).etag
+
+        item.spot = other
+        item.save()
+        self.assertNotEqual(Spot.objects.get(pk=self.spot.pk).etag, etag)
+        self.assertEqual(self.read()[1]["items"], [])
+
+    def test_deleted_with_spot(self):
+        self.spot.json_data_structure()
+        self.spot.delete()
+        self.assertFalse(SpotDocument.objects.exists())
@@ -0,0 +1,227 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from os.path import abspath, dirname
+import shutil
+import tempfile
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.test.utils import override_settings
+import simplejson as json
+
+from spotseeker_server.models import (
+    Item,
+    ItemExtendedInfo,
+    Spot,
+    SpotExtendedInfo,
+    SpotImage,
+    SpotType,
+)
+from spotseeker_server.test import utils_test
+
+TEST_ROOT = abspath(dirname(__file__))
+
+
+@override_settings(
+    SPOTSEEKER_AUTH_MODULE="spotseeker_server.auth.all_ok",
+    SPOTSEEKER_SPOT_FORM="spotseeker_server.default_forms.spot."
+    "DefaultSpotForm",
+    SPOTSEEKER_SPOTEXTENDEDINFO_FORM="spotseeker_server.default_forms.spot."
+    "DefaultSpotExtendedInfoForm",
+    SPOTSEEKER_AUTH_ADMINS=("demo_user",),
+    SPOTSEEKER_CHANGES_OVERLAP=0,
+)
+class SpotETagTest(TestCase):
+    """Spot and image etags are hashes of their content."""
+
+    def setUp(self):
+        self.spot = Spot.objects.create(name="Hashed")
+        SpotType.objects.create(name="study_room")
+        SpotType.objects.create(name="cafe")
+        self.url = "/api/v1/spot/%s" % self.spot.pk
+
+    def put(self, spot_json):
+        response = self.client.put(
+            self.url,
+            json.dumps(spot_json),
+            content_type="application/json",
+            If_Match=Spot.objects.get(pk=self.spot.pk).etag,
+        )
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_content_etag(self):
+        etag = self.spot.etag
+        self.assertEqual(etag, self.spot.content_etag())
+        self.assertEqual(Spot.objects.get(pk=self.spot.pk).etag, etag)
+
+        self.spot.spotextendedinfo_set.create(key="has_outlets", value="true")
+        spot = Spot.objects.get(pk=self.spot.pk)
+        self.assertNotEqual(spot.etag, etag)
+        self.assertEqual(spot.etag, spot.content_etag())
+
+    def test_unchanged_save(self):
+        spot = Spot.objects.get(pk=self.spot.pk)
+        spot.latitude = "47.6"
+        spot.save()
+        etag = spot.etag
+
+        # However the same value is given
+        spot = Spot.objects.get(pk=self.spot.pk)
+        spot.latitude = 47.6
+        with CaptureQueriesContext(connection) as queries:
+            spot.save()
+        self.assertEqual(spot.etag, etag)
+        self.assertFalse(
+            [q for q in queries if not q["sql"].startswith("SELECT")]
+        )
+
+    def test_unchanged_put(self):
+        spot_json = utils_test.get_spot("Put", 10)
+        spot_json["extended_info"] = {"has_outlets": "true"}
+        spot_json["type"] = ["study_room"]
+        spot_json["available_hours"] = {
+            "monday": [["08:00", "12:00"], ["13:00", "17:00"]],
+            "tuesday": [["08:00", "17:00"]],
+        }
+        etag = self.put(spot_json)["ETag"]
+        last_modified = Spot.objects.get(pk=self.spot.pk).last_modified
+
+        response = self.put(spot_json)
+        self.assertEqual(response["ETag"], etag)
+        spot = Spot.objects.get(pk=self.spot.pk)
+        self.assertEqual(spot.etag, etag)
+        self.assertEqual(spot.last_modified, last_modified)
+
+        spot_json["available_hours"]["tuesday"] = [["09:00", "17:00"]]
+        response = self.put(spot_json)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(
+            json.loads(response.content)["etag"], response["ETag"]
+        )
+
+    def test_types(self):
+        spot_json = utils_test.get_spot("Put", 10)
+        etag = self.put(spot_json)["ETag"]
+
+        # Types are saved after the spot is
+        spot_json["type"] = ["cafe"]
+        response = self.put(spot_json)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(
+            response["ETag"], Spot.objects.get(pk=self.spot.pk).content_etag()
+        )
+
+    def test_images(self):
+        directory = tempfile.mkdtemp()
+        try:
+            with self.settings(MEDIA_ROOT=directory):
+                with open("%s/resources/test_gif.gif" % TEST_ROOT, "rb") as f:
+                    content = f.read()
+
+                etag = self.spot.etag
+                images = [
+                    self.spot.spotimage_set.create(
+                        description="A GIF",
+                        image=SimpleUploadedFile(
+                            "test_gif.gif", content, "image/gif"
+                        ),
+                    )
+                    for i in range(2)
+                ]
+                # The same image has the same etag
+                self.assertEqual(images[0].etag, images[1].etag)
+                spot = Spot.objects.get(pk=self.spot.pk)
+                self.assertNotEqual(spot.etag, etag)
+
+                image = SpotImage.objects.get(pk=images[0].pk)
+                image.save()
+                self.assertEqual(image.etag, images[0].etag)
+                self.assertEqual(Spot.objects.get(pk=spot.pk).etag, spot.etag)
+
+                image.description = "Another GIF"
+                image.save()
+                self.assertNotEqual(image.etag, images[0].etag)
+                self.assertNotEqual(
+                    Spot.objects.get(pk=spot.pk).etag, spot.etag
+                )
+        finally:
+            shutil.rmtree(directory)
+
+    def test_related_writes(self):
+        """Rows written without the spot view still move its etag on."""
+        response = self.client.get(self.url)
+        etag = response["ETag"]
+        token = json.loads(
+            b"".join(self.client.get("/api/v1/spot/changes").streaming_content)
+        )["token"]
+
+        item = Item.objects.create(name="Camera", spot=self.spot)
+        ItemExtendedInfo.objects.create(item=item, key="i_has_lens", value="1")
+        SpotExtendedInfo.objects.create(
+            spot=Spot.objects.get(pk=self.spot.pk),
+            key="has_outlets",
+            value="1",
+        )
+        self.spot.spottypes.add(SpotType.objects.get(name="cafe"))
+
+        spot = Spot.objects.get(pk=self.spot.pk)
+        self.assertNotEqual(spot.etag, etag)
+        self.assertEqual(spot.etag, spot.content_etag())
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["ETag"], spot.etag)
+        changes = json.loads(
+            b"".join(
+                self.client.get(
+                    "/api/v1/spot/changes", {"since": token}
+                ).streaming_content
+            )
+        )
+        self.assertEqual(
+            [changed["id"] for changed in changes["spots"]], [self.spot.pk]
+        )
+
+    def test_put_refreshes_once(self):
+        spot_json = utils_test.get_spot("Put", 10)
+        spot_json["extended_info"] = dict(
+            ("key_%s" % i, "value") for i in range(10)
+        )
+        with CaptureQueriesContext(connection) as queries:
+            self.put(spot_json)
+        # Not once per extended info row
+        etag_updates = [
+            q for q in queries
+            if q["sql"].startswith('UPDATE "spotseeker_server_spot"')
+        ]
+        self.assertTrue(len(etag_updates) <= 2)
+
+    def test_put_reads_related_rows_once(self):
+        """The etag and the document come from one read of each table."""
+        spot_json = utils_test.get_spot("Put", 10)
+        spot_json["extended_info"] = {"has_outlets": "true"}
+        with CaptureQueriesContext(connection) as queries:
+            self.put(spot_json)
+        image_reads = [
+            q for q in queries
+            if q["sql"].startswith("SELECT")
+            and 'FROM "spotseeker_server_spotimage"' in q["sql"]
+        ]
+        self.assertEqual(len(image_reads), 1)
+
+        spot = Spot.objects.get(pk=self.spot.pk)
+        self.assertEqual(spot.etag, spot.content_etag())
+
+    def test_new_spot(self):
+        """A new spot's etag is found without reading any related rows."""
+        with CaptureQueriesContext(connection) as queries:
+            spot = Spot.objects.create(name="New")
+        self.assertEqual(
+            [q["sql"].split()[0] for q in queries], ["INSERT", "UPDATE"]
+        )
+        self.assertEqual(spot.etag, spot.content_etag())
+        self.assertEqual(Spot.objects.get(pk=spot.pk).etag, spot.etag)
@@ -40,6 +40,45 @@ from spotseeker_server.test.search.view_methods import (
 from spotseeker_server.test.search.noise_level import NoiseLevelTestCase
 from spotseeker_server.test.search.uw_noise_level import UWNoiseLevelTestCase
 from spotseeker_server.test.search.time import SpotSearchTimeTest
+from spotseeker_server.test.search.result_cache import (
+    CommittedGenerationTest,
+    SearchResultCacheTest,
+)
+from spotseeker_server.test.search.streaming import StreamingResponseTest
+from spotseeker_server.test.search.facets import SpotFacetsTest
+from spotseeker_server.test.search.free_text import FreeTextSearchTest
+from spotseeker_server.test.search.building_cache import BuildingListCacheTest
+from spotseeker_server.test.search.explain import SearchExplainTest
+from spotseeker_server.test.search.nearest import NearestSearchTest
+from spotseeker_server.test.search.predicates import SearchPredicatesTest
+from spotseeker_server.test.search.index_ids import SearchIndexIdsTest
+from spotseeker_server.test.search.database_distance import (
+    DatabaseDistanceSearchTest,
+    DatabaseNearestSearchTest,
+    NearestInDatabaseTest,
+)
+from spotseeker_server.test.search.memory_backend import (
+    MemoryBackendDifferentialTest,
+    MemoryCapacityTest,
+    MemoryDistanceFieldTest,
+    MemoryDistanceTest,
+    MemoryFacetsTest,
+    MemoryFieldTest,
+    MemoryFreeTextTest,
+    MemoryHoursRangeTest,
+    MemoryItemTest,
+    MemoryLimitTest,
+    MemoryNearestTest,
+    MemoryNoiseLevelTest,
+    MemoryOpenAtTest,
+    MemoryOpenNowLocationAttributesTest,
+    MemoryOpenNowLocationTest,
+    MemoryOpenNowTest,
+    MemoryOpenUntilTest,
+    MemoryTimeTest,
+    MemoryUWNoiseLevelTest,
+    MemoryUWSearchTest,
+)
 from spotseeker_server.test.hours.model import SpotHoursModelTest
 from spotseeker_server.test.hours.get import SpotHoursGETTest
 from spotseeker_server.test.hours.put import SpotHoursPUTTest
@@ -66,9 +105,25 @@ from spotseeker_server.test.uw_spot.schema import UWSpotSchemaTest
 from spotseeker_server.test.uw_spot.uw_search import UWSearchTest
 from spotseeker_server.test.item.form import ItemFormsTest
 from spotseeker_server.test.spot_caching import SpotCacheTest
+from spotseeker_server.test.spot_document import SpotDocumentTest
+from spotseeker_server.test.spot_etag import SpotETagTest
+from spotseeker_server.test.conditional_get import ConditionalGETTest
+from spotseeker_server.test.spot_changes import SpotChangesTest
+from spotseeker_server.test.spot_cache import (
+    LocalSpotCacheTest,
+    SharedSpotCacheTest,
+)
+from spotseeker_server.test.benchmark import SearchBenchmarkTest
 from spotseeker_server.test.item.image_delete import ItemImageDELETETest
 from spotseeker_server.test.item.image_get import ItemImageGETTest
 from spotseeker_server.test.item.image_post import ItemImagePOSTTest
 from spotseeker_server.test.item.image_put import ItemImagePUTTest
 from spotseeker_server.test.item.image_thumbnail import ItemImageThumbTest
 from spotseeker_server.test.techloan.sync_techloan import SyncTechloanTest
+from spotseeker_server.test.index.geo import SpatialIndexTest
+from spotseeker_server.test.index.hours import HoursIndexTest
+from spotseeker_server.test.index.extended_info import ExtendedInfoIndexTest
+from spotseeker_server.test.index.text import TextIndexTest
+from spotseeker_server.test.index.snapshot import IndexSnapshotTest
+from spotseeker_server.test.index.catalog_version import CatalogVersionTest
+from spotseeker_server.test.index.spot_set import SpotSetTest
@@ -19,6 +19,8 @@ from spotseeker_server.views.image import ImageView
 from spotseeker_server.views.thumbnail import ThumbnailView
 from spotseeker_server.views.null import NullView
 from spotseeker_server.views.all_spots import AllSpotsView
+from spotseeker_server.views.spot_changes import SpotChangesView
+from spotseeker_server.views.facets import FacetsView
 from spotseeker_server.views.schema_gen import SchemaGenView
 from spotseeker_server.views.person import PersonView
 from spotseeker_server.views.item_image import ItemImageView
@@ -34,6 +36,16 @@ urlpatterns = [
     ),
     url(r"v1/spot/?$", csrf_exempt(SearchView().run), name="spot-search"),
     url(r"v1/spot/all$", csrf_exempt(AllSpotsView().run), name="spots"),
+    url(
+        r"v1/spot/changes$",
+        csrf_exempt(SpotChangesView().run),
+        name="spot-changes",
+    ),
+    url(
+        r"v1/spot/facets$",
+        csrf_exempt(FacetsView().run),
+        name="spot-facets",
+    ),
     url(
         r"v1/buildings/?$",
         csrf_exempt(BuildingListView().run),
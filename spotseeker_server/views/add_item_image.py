@@ -9,6 +9,7 @@
 
 from spotseeker_server.views.rest_dispatch import RESTDispatch, RESTException
 from spotseeker_server.models import ItemImage, Item
+from django.db import transaction
 from django.http import HttpResponse
 from spotseeker_server.require_auth import *
 from PIL import Image
@@ -21,6 +22,7 @@ class AddItemImageView(RESTDispatch):
 
     @user_auth_required
     @admin_auth_required
+    @transaction.atomic
     def POST(self, request, item_id):
         item = Item.objects.get(pk=item_id)
 
@@ -47,7 +49,7 @@ class AddItemImageView(RESTDispatch):
                 args["display_index"] = 0
 
         image = item.itemimage_set.create(**args)
-        item.spot.save()
+        item.spot.save_document()
 
         response = HttpResponse(status=201)
         response["Location"] = image.rest_url()
@@ -7,7 +7,14 @@
     sbutler1@illinois.edu: adapt to the new RESTDispatch framework.
 """
 
-from spotseeker_server.views.rest_dispatch import RESTDispatch, JSONResponse
+from django.utils.cache import patch_vary_headers
+
+from spotseeker_server.views.rest_dispatch import (
+    RESTDispatch,
+    JSONStreamResponse,
+    collection_etag,
+    wants_ndjson,
+)
 from spotseeker_server.models import Spot
 from spotseeker_server.require_auth import app_auth_required
 
@@ -15,5 +22,15 @@ from spotseeker_server.require_auth import app_auth_required
 class AllSpotsView(RESTDispatch):
     @app_auth_required
     def GET(self, request):
-        spots = [spot.json_data_structure() for spot in Spot.objects.all()]
-        return JSONResponse(spots)
+        spots = Spot.objects.order_by("pk")
+        ndjson = wants_ndjson(request)
+        etag = collection_etag(spots.values_list("etag", flat=True), ndjson)
+        response = self.not_modified(request, etag)
+        if response is None:
+            # Streamed a chunk at a time, so memory use doesn't grow
+            # with the size of the catalog
+            chunks = Spot.stream_json_bytes(spots.iterator())
+            response = JSONStreamResponse(chunks, ndjson=ndjson)
+            response["ETag"] = etag
+        patch_vary_headers(response, ["Accept"])
+        return response
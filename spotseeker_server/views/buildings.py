@@ -8,27 +8,82 @@
         remove needless use of regex.
 """
 
-from spotseeker_server.views.rest_dispatch import RESTDispatch, JSONResponse
+import hashlib
+
+from spotseeker_server.views.rest_dispatch import (
+    RESTDispatch,
+    JSONResponse,
+    response_etag,
+)
 from spotseeker_server.require_auth import *
 from spotseeker_server.models import Spot
 from spotseeker_server.org_filters import SearchFilterChain
 from spotseeker_server.views.search import SearchView
+from spotseeker_server import catalog
+from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponse
 from django.core.exceptions import FieldError
 
 
 class BuildingListView(RESTDispatch):
     """Performs actions on the list of buildings, at /api/v1/buildings.
-    GET returns 200 with a list of buildings.
+    GET returns 200 with a list of buildings, or 304 if it matches the
+    request's If-None-Match.
     """
 
     @app_auth_required
     def GET(self, request):
+        get_request = request.GET
+        params = [key for key in get_request if not key.startswith("oauth_")]
+        if params == [] or (
+            params == ["campus"] and len(get_request.getlist("campus")) == 1
+        ):
+            campus = get_request.get("campus")
+            buildings = self.campus_buildings(request, campus)
+        else:
+            buildings = self.search_buildings(request)
+
+        response = JSONResponse(buildings)
+        response["ETag"] = response_etag(response)
+        return response
+
+    def campus_buildings(self, request, campus=None):
+        """
+        The buildings on a campus, or on every campus if campus is None.
+        The list is cached like search results, for up to
+        SPOTSEEKER_SEARCH_CACHE_TIMEOUT or until the catalog changes, so
+        the apps fetching it on launch don't each search the catalog.
+        """
+        timeout = getattr(settings, "SPOTSEEKER_SEARCH_CACHE_TIMEOUT", 300)
+        generation = catalog.generation() if timeout else None
+        key = None
+        if generation is not None:
+            key = "spotseeker:buildings:%s:%s" % (
+                generation,
+                hashlib.sha1(str(campus).encode("utf-8")).hexdigest(),
+            )
+            buildings = cache.get(key)
+            if buildings is not None:
+                return buildings
+
+        if campus is None:
+            buildings = sorted(
+                Spot.objects.values_list("building_name", flat=True).distinct()
+            )
+        else:
+            buildings = self.search_buildings(request)
+
+        if key is not None:
+            cache.set(key, buildings, timeout)
+        return buildings
+
+    def search_buildings(self, request):
+        """The buildings of the spots found by the request's search."""
         chain = SearchFilterChain(request)
         search_view = SearchView()
         spots = SearchView.filter_on_request(
             search_view, request.GET, chain, request.META, "buildings"
         )
 
-        buildings = sorted(set([s.building_name for s in spots]))
-        return JSONResponse(buildings)
+        return sorted(set([s.building_name for s in spots]))
@@ -0,0 +1,70 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import Counter
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Count
+
+from spotseeker_server.forms.spot import SpotForm
+from spotseeker_server.index.extended_info import extended_info_index
+from spotseeker_server.models import Spot
+from spotseeker_server.require_auth import *
+from spotseeker_server.views.rest_dispatch import (
+    JSONResponse,
+    RESTDispatch,
+    collection_etag,
+)
+from spotseeker_server.views.search import SearchView
+
+
+class FacetsView(RESTDispatch):
+    """Counts the spots a search finds, at /api/v1/spot/facets.
+    GET takes the same parameters as a search, and returns 200 with the
+    number of spots found of each type, in each building, and with each
+    value of the extended info that has a fixed set of values.
+    """
+
+    @app_auth_required
+    def GET(self, request):
+        # The facets are counted over every spot the search finds
+        get_request = request.GET.copy()
+        get_request["limit"] = "0"
+        spots = list(SearchView().search(request, get_request))
+        spot_ids = [spot.pk for spot in spots]
+
+        types = (
+            Spot.spottypes.through.objects.filter(spot_id__in=spot_ids)
+            .values_list("spottype__name")
+            .annotate(count=Count("spot_id"))
+        )
+        buildings = Counter(spot.building_name for spot in spots)
+
+        response = JSONResponse(
+            {
+                "count": len(spot_ids),
+                "type": dict(types),
+                "building_name": dict(buildings),
+                "extended_info": extended_info_index.current().counts(
+                    spot_ids, self.facet_keys()
+                ),
+            }
+        )
+        # The counts only change along with the spots counted
+        response["ETag"] = collection_etag(spot.etag for spot in spots)
+        return response
+
+    def facet_keys(self):
+        """
+        The extended info keys the spot form only accepts a list of
+        values for.
+        """
+        try:
+            validated_ei = SpotForm.implementation().validated_extended_info
+        except ImproperlyConfigured:
+            return []
+        return [
+            key
+            for key, values in validated_ei.items()
+            if isinstance(values, list)
+        ]
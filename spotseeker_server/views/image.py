@@ -11,6 +11,7 @@ import time
 from spotseeker_server.views.rest_dispatch import (
     RESTDispatch,
     RESTException,
+    HeadResponse,
     JSONResponse,
 )
 from django.http import HttpResponse
@@ -39,8 +40,17 @@ class ImageView(RESTDispatch):
                 "Image Spot ID doesn't match spot id in url", 404
             )
 
-        response = HttpResponse(FileWrapper(img.image))
+        last_modified = img.modification_date.timestamp()
+        response = self.not_modified(request, img.etag, last_modified)
+        if response is not None:
+            return response
+
+        if request.method == "HEAD":
+            response = HeadResponse()
+        else:
+            response = HttpResponse(FileWrapper(img.image))
         response["ETag"] = img.etag
+        response["Last-Modified"] = http_date(last_modified)
 
         # 7 day timeout?
         response["Expires"] = http_date(time.time() + 60 * 60 * 24 * 7)
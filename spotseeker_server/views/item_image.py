@@ -11,8 +11,10 @@ import time
 from spotseeker_server.views.rest_dispatch import (
     RESTDispatch,
     RESTException,
+    HeadResponse,
     JSONResponse,
 )
+from django.db import transaction
 from django.http import HttpResponse
 from django.utils.http import http_date
 from wsgiref.util import FileWrapper
@@ -39,8 +41,17 @@ class ItemImageView(RESTDispatch):
                 "Image Spot ID doesn't match item id in url", 404
             )
 
-        response = HttpResponse(FileWrapper(img.image))
+        last_modified = img.modification_date.timestamp()
+        response = self.not_modified(request, img.etag, last_modified)
+        if response is not None:
+            return response
+
+        if request.method == "HEAD":
+            response = HeadResponse()
+        else:
+            response = HttpResponse(FileWrapper(img.image))
         response["ETag"] = img.etag
+        response["Last-Modified"] = http_date(last_modified)
 
         # 7 day timeout?
         response["Expires"] = http_date(time.time() + 60 * 60 * 24 * 7)
@@ -50,6 +61,7 @@ class ItemImageView(RESTDispatch):
 
     @user_auth_required
     @admin_auth_required
+    @transaction.atomic
     def PUT(self, request, item_id, image_id):
         img = ItemImage.objects.get(pk=image_id)
         item = img.item
@@ -72,12 +84,13 @@ class ItemImageView(RESTDispatch):
         if "display_index" in request.META["files"]:
             img.display_index = request.META["files"]["display_index"]
         img.save()
-        item.spot.save()
+        item.spot.save_document()
 
         return self.GET(request, item_id, image_id)
 
     @user_auth_required
     @admin_auth_required
+    @transaction.atomic
     def DELETE(self, request, item_id, image_id):
         img = ItemImage.objects.get(pk=image_id)
         item = img.item
@@ -88,6 +101,6 @@ class ItemImageView(RESTDispatch):
             )
 
         img.delete()
-        item.spot.save()
+        item.spot.save_document()
 
         return HttpResponse(status=200)
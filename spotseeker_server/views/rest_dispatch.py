@@ -14,7 +14,13 @@
 from django.contrib.auth.models import User
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.conf import settings
-from django.http import HttpResponse
+from django.http import (
+    HttpResponse,
+    HttpResponseNotModified,
+    StreamingHttpResponse,
+)
+from django.utils.http import http_date, parse_http_date_safe
+import hashlib
 import simplejson as json
 import traceback
 
@@ -40,6 +46,132 @@ class JSONResponse(HttpResponse):
         super(JSONResponse, self).__init__(content, *args, **kwargs)
 
 
+class JSONListResponse(HttpResponse):
+    """
+    A JSONResponse for a list whose items are already encoded, as the
+    JSON bytes of each item. The fragments are joined as they are,
+    unless pretty printing is on.
+    """
+
+    def __init__(self, fragments, *args, **kwargs):
+        debug = getattr(settings, "DEBUG", False)
+        pretty_print = getattr(settings, "JSON_PRETTY_PRINT", False)
+        if debug and pretty_print:
+            content = json.dumps(
+                [json.loads(fragment) for fragment in fragments],
+                sort_keys=True,
+                indent=4 * " ",
+            )
+        else:
+            content = b"[" + b",".join(fragments) + b"]"
+
+        if not kwargs.get("content_type", None):
+            kwargs["content_type"] = "application/json"
+
+        super(JSONListResponse, self).__init__(content, *args, **kwargs)
+
+
+class JSONStreamResponse(StreamingHttpResponse):
+    """
+    Streams a JSON list as it is encoded. Takes an iterable of chunks,
+    each a list of already encoded items, and sends them as one JSON
+    array, or as one item per line (NDJSON) if ndjson is True.
+    Nothing is pretty printed.
+
+    With envelope, a (members, key) pair, the array is sent inside a
+    JSON object instead: the members of the dict members, then the
+    array as the value of key.
+    """
+
+    def __init__(self, chunks, ndjson=False, envelope=None, *args, **kwargs):
+        if not kwargs.get("content_type", None):
+            if ndjson:
+                kwargs["content_type"] = NDJSON_CONTENT_TYPE
+            else:
+                kwargs["content_type"] = "application/json"
+
+        if ndjson:
+            content = self._ndjson(chunks)
+        elif envelope is not None:
+            content = self._json_object(chunks, *envelope)
+        else:
+            content = self._json_array(chunks)
+        super(JSONStreamResponse, self).__init__(content, *args, **kwargs)
+
+    @classmethod
+    def _json_object(cls, chunks, members, key):
+        head = json.dumps(members)[:-1]
+        if members:
+            head += ", "
+        yield (head + json.dumps(key) + ": ").encode("utf-8")
+        for chunk in cls._json_array(chunks):
+            yield chunk
+        yield b"}"
+
+    @staticmethod
+    def _json_array(chunks):
+        yield b"["
+        separator = b""
+        for fragments in chunks:
+            if fragments:
+                yield separator + b",".join(fragments)
+                separator = b","
+        yield b"]"
+
+    @staticmethod
+    def _ndjson(chunks):
+        for fragments in chunks:
+            if fragments:
+                yield b"\n".join(fragments) + b"\n"
+
+
+class HeadResponse(StreamingHttpResponse):
+    """
+    The response to a HEAD request: headers, and no body. A view that
+    has the headers of its GET response before building the body, like
+    its ETag, can return one of these for a HEAD instead; run() sends it
+    as it is. It streams its empty body, so that Content-Length isn't
+    set to 0 on the way out; the length of a body that isn't built
+    isn't known.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(HeadResponse, self).__init__((), *args, **kwargs)
+
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+def wants_ndjson(request):
+    """True if the client asked for newline delimited JSON."""
+    return NDJSON_CONTENT_TYPE in request.META.get("HTTP_ACCEPT", "")
+
+
+def collection_etag(etags, *variant):
+    """
+    Returns the ETag of a list of resources, from the etags of its
+    members, in order, and anything else the list's representation
+    depends on, like its content type.
+    """
+    digest = hashlib.sha1()
+    for part in list(variant) + list(etags):
+        digest.update(("%s\n" % part).encode("utf-8"))
+    return '"%s"' % digest.hexdigest()
+
+
+def response_etag(response):
+    """Returns an ETag that's a hash of a response's content."""
+    return '"%s"' % hashlib.sha1(response.content).hexdigest()
+
+
+def _opaque_tag(etag):
+    """An etag without its quotes or W/ prefix, to compare it weakly."""
+    etag = etag.strip()
+    if etag.startswith("W/"):
+        etag = etag[2:]
+    return etag.strip('"')
+
+
 class RESTException(Exception):
     """
     Can be thrown inside RESTful methods. Accepts a specific
@@ -69,7 +201,7 @@ class RESTDispatch:
         method = request.META["REQUEST_METHOD"]
 
         try:
-            if "GET" == method and hasattr(self, "GET"):
+            if method in ("GET", "HEAD") and hasattr(self, "GET"):
                 response = self.GET(*args, **named_args)
             elif "POST" == method and hasattr(self, "POST"):
                 response = self.POST(*args, **named_args)
@@ -101,8 +233,86 @@ class RESTDispatch:
             json_values = self.json_error(e)
             response = JSONResponse(json_values, status=500)
 
+        if method in ("GET", "HEAD") and response.status_code == 200:
+            not_modified = self.not_modified(
+                request,
+                response.get("ETag"),
+                parse_http_date_safe(response.get("Last-Modified")),
+            )
+            if not_modified is not None:
+                for header in ("Cache-Control", "Expires", "Vary"):
+                    if header in response:
+                        not_modified[header] = response[header]
+                response.close()
+                response = not_modified
+
+        if method == "HEAD":
+            response = self._without_body(response)
+
+        return response
+
+    def not_modified(self, request, etag=None, last_modified=None):
+        """
+        Returns a 304 response if the client already has the etag, by
+        the request's If-None-Match, or, without one, if its
+        If-Modified-Since isn't before last_modified (a timestamp).
+        Returns None otherwise. run() checks the ETag and Last-Modified
+        of every GET response; a view whose body is costly to build can
+        call this first, to skip building it, and return a HeadResponse
+        for a HEAD.
+        """
+        if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+        if if_none_match is not None:
+            matched = etag is not None and (
+                if_none_match.strip() == "*"
+                or _opaque_tag(etag)
+                in [_opaque_tag(tag) for tag in if_none_match.split(",")]
+            )
+        else:
+            since = parse_http_date_safe(
+                request.META.get("HTTP_IF_MODIFIED_SINCE")
+            )
+            matched = (
+                since is not None
+                and last_modified is not None
+                and int(last_modified) <= since
+            )
+        if not matched:
+            return None
+
+        response = HttpResponseNotModified()
+        if etag is not None:
+            response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
         return response
 
+    def _without_body(self, response):
+        """
+        The response to a HEAD request: the headers of the response to
+        the GET, without its body. A streamed body is never generated,
+        but any other body has already been built by the view, unless
+        it returned a HeadResponse; for those, HEAD only saves sending
+        the body, and keeps its Content-Length.
+        """
+        if isinstance(response, HeadResponse):
+            return response
+        if response.streaming:
+            head = HeadResponse(status=response.status_code)
+        else:
+            head = HttpResponse(status=response.status_code)
+        for header, value in response.items():
+            head[header] = value
+        head.cookies = response.cookies
+        if (
+            not response.streaming
+            and response.status_code != 304
+            and "Content-Length" not in head
+        ):
+            head["Content-Length"] = len(response.content)
+        response.close()
+        return head
+
     def json_error(self, ex):
         json_values = {"error": str(ex)}
 
@@ -15,7 +15,11 @@ from django.http import HttpResponse
 from spotseeker_server.forms.spot import SpotForm
 from spotseeker_server.models import *
 from spotseeker_server.require_auth import *
-from spotseeker_server.views.rest_dispatch import JSONResponse, RESTDispatch
+from spotseeker_server.views.rest_dispatch import (
+    JSONResponse,
+    RESTDispatch,
+    response_etag,
+)
 
 
 class SchemaGenView(RESTDispatch):
@@ -124,7 +128,9 @@ class SchemaGenView(RESTDispatch):
             if org_form_exists:
                 schema["extended_info"][key] = validated_ei.get(key, "unicode")
 
-        return JSONResponse(schema)
+        response = JSONResponse(schema)
+        response["ETag"] = response_etag(response)
+        return response
 
 
 def is_auto_field(field):
@@ -14,25 +14,148 @@ from __future__ import print_function
 from spotseeker_server.views.rest_dispatch import (
     RESTDispatch,
     RESTException,
+    HeadResponse,
+    JSONListResponse,
     JSONResponse,
+    JSONStreamResponse,
+    collection_etag,
+    wants_ndjson,
 )
 from spotseeker_server.forms.spot_search import SpotSearchForm
 from spotseeker_server.views.spot import SpotView
 from spotseeker_server.org_filters import SearchFilterChain
+from spotseeker_server.search_backends import SearchBackend
+from spotseeker_server import catalog, spot_cache
+from spotseeker_server.explain import NO_EXPLAIN, Explain
 from django.conf import settings
+from django.core.cache import cache
 from django.http import HttpResponse, HttpResponseBadRequest
-from django.db.models import Q
+from django.utils.cache import patch_vary_headers
+from django.db.models import (
+    DecimalField,
+    Exists,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    OuterRef,
+    Q,
+    Value,
+)
 from django.utils.datastructures import MultiValueDictKeyError
 from spotseeker_server.require_auth import *
-from spotseeker_server.models import Spot, SpotType
-from pyproj import Geod
+from spotseeker_server.models import (
+    Item,
+    ItemExtendedInfo,
+    Spot,
+    SpotType,
+)
+from spotseeker_server.index import CatalogVersion
+from spotseeker_server.index.extended_info import (
+    ExtendedInfoQuery,
+    extended_info_index,
+)
+from spotseeker_server.index.geo import geod, spatial_index
+from spotseeker_server.index.hours import HoursQuery, hours_index
+from spotseeker_server.index.spot_set import SpotSet
+from spotseeker_server.index.text import SPOT_FIELDS, text_index
 from decimal import *
 from time import *
 from datetime import datetime
+import hashlib
+from math import cos, radians
 import pytz
+import simplejson as json
 import sys
 
 
+# The search keys that set the hours a spot has to be open
+HOURS_KEYS = (
+    "open_now",
+    "open_at",
+    "open_until",
+    "fuzzy_hours_start",
+    "fuzzy_hours_end",
+)
+
+# The values of _explain that ask for a search's profile
+EXPLAIN_VALUES = ("1", "true")
+
+# The most ids the indexes found that a search gives the database in one
+# list; it reads the ids that meet its own conditions instead of more
+IN_LIST_LIMIT = 1000
+
+# The item: search keys, and the Item fields they match
+ITEM_FIELDS = {
+    "id": "id",
+    "name": "name",
+    "category": "item_category",
+    "subcategory": "item_subcategory",
+}
+
+
+class SpotsInOrder(object):
+    """
+    The spots with the given ids, in the same order, loaded
+    SPOTSEEKER_STREAM_CHUNK_SIZE at a time as they're iterated over.
+    Ids of spots that no longer exist are skipped.
+    """
+
+    def __init__(self, spot_ids):
+        self.spot_ids = spot_ids
+        self.chunk_size = getattr(
+            settings, "SPOTSEEKER_STREAM_CHUNK_SIZE", 200
+        )
+
+    def chunks(self):
+        """Yields the ids, SPOTSEEKER_STREAM_CHUNK_SIZE at a time."""
+        for start in range(0, len(self.spot_ids), self.chunk_size):
+            yield self.spot_ids[start:start + self.chunk_size]
+
+    def __iter__(self):
+        for chunk in self.chunks():
+            spots = Spot.objects.in_bulk(chunk)
+            for pk in chunk:
+                if pk in spots:
+                    yield spots[pk]
+
+    def etags(self):
+        """The etags of the spots, in order, without loading them."""
+        etags = {}
+        for chunk in self.chunks():
+            etags.update(
+                Spot.objects.filter(pk__in=chunk).values_list("pk", "etag")
+            )
+        return [etags[pk] for pk in self.spot_ids if pk in etags]
+
+
+def _narrow(found, spot_set):
+    """
+    The spots in both found and spot_set; found is None until an index
+    has narrowed the search down.
+    """
+    if found is None:
+        return spot_set
+    return found & spot_set
+
+
+def _restricted(query, found):
+    """The query, limited to the spots in found unless it's None."""
+    if found is None:
+        return query
+    return query.filter(pk__in=found.ids())
+
+
+def _exists(query, subquery):
+    """
+    Returns the query annotated with whether the subquery, correlated on
+    OuterRef("pk"), finds a row for each spot, and a Q that holds for
+    the spots it does. Django 1.11 can only filter on an Exists through
+    an annotation.
+    """
+    name = "_exists_%s" % len(query.query.annotations)
+    return query.annotate(**{name: Exists(subquery)}), Q(**{name: True})
+
+
 class SearchView(RESTDispatch):
     """Handles searching for Spots with particular attributes
     based on a query string.
@@ -45,20 +168,301 @@ class SearchView(RESTDispatch):
 
     @app_auth_required
     def GET(self, request):
+        get_request = request.GET
+        if "_explain" in get_request:
+            if get_request["_explain"].lower() in EXPLAIN_VALUES:
+                return self.explain(request)
+            get_request = get_request.copy()
+            del get_request["_explain"]
+
+        spots = self.search(request, get_request)
+        center = self.center(get_request)
+
+        if self.is_unbounded(get_request):
+            ndjson = wants_ndjson(request)
+            etag = self.results_etag(spots, ndjson)
+            response = self.not_modified(request, etag)
+            if response is None:
+                # There's no limit on the number of spots, so send them
+                # as they are serialized rather than all at once.
+                chunks = self.stream_json_bytes(spots, center)
+                response = JSONStreamResponse(chunks, ndjson=ndjson)
+                response["ETag"] = etag
+            patch_vary_headers(response, ["Accept"])
+            return response
+
+        spots = list(spots)
+        etag = self.results_etag(spots)
+        response = self.not_modified(request, etag)
+        if response is None:
+            if request.method == "HEAD":
+                response = HeadResponse(content_type="application/json")
+            else:
+                fragments = Spot.bulk_json_bytes(spots)
+                if center is not None:
+                    fragments = self.add_distances(fragments, spots, center)
+                response = JSONListResponse(fragments)
+            response["ETag"] = etag
+        return response
+
+    def results_etag(self, spots, *variant):
+        """
+        The ETag of a search's results, from the etags of the spots
+        found. Their distances from the center, if any, only change
+        along with their etags.
+        """
+        if isinstance(spots, SpotsInOrder):
+            etags = spots.etags()
+        else:
+            etags = [spot.etag for spot in spots]
+        return collection_etag(etags, *variant)
+
+    def stream_json_bytes(self, spots, center):
+        """Spot.stream_json_bytes(), with distances if there's a center."""
+        if center is None:
+            for chunk in Spot.stream_json_bytes(spots):
+                yield chunk
+            return
+
+        chunk_size = getattr(settings, "SPOTSEEKER_STREAM_CHUNK_SIZE", 200)
+        chunk = []
+        for spot in spots:
+            chunk.append(spot)
+            if len(chunk) >= chunk_size:
+                yield self.add_distances(
+                    Spot.bulk_json_bytes(chunk), chunk, center
+                )
+                chunk = []
+        if chunk:
+            yield self.add_distances(
+                Spot.bulk_json_bytes(chunk), chunk, center
+            )
+
+    @user_auth_required
+    @admin_auth_required
+    def explain(self, request):
+        """
+        Runs the search, bypassing the results cache, and returns where
+        the time went instead of the spots, along with the hits and
+        misses of the spot cache's tiers so far in this process.
+        """
+        get_request = request.GET.copy()
+        del get_request["_explain"]
+
+        with Explain() as explain:
+            chain = SearchFilterChain(request)
+            explain.lap("chain")
+            spots = self.filter_on_request(
+                get_request, chain, request.META, "spot", explain
+            )
+            spots = list(spots)
+            Spot.bulk_json_bytes(spots)
+            explain.lap("serialize")
+
+        response = explain.summary()
+        response["spot_ids"] = [spot.pk for spot in spots]
+        response["spot_cache"] = spot_cache.stats()
+        return JSONResponse(response)
+
+    def search(self, request, get_request):
+        """
+        Returns the spots found by a search with the given parameters,
+        from the results cache if they're there. Cached results come
+        back in the same order, as SpotsInOrder if the search is
+        unbounded.
+        """
         chain = SearchFilterChain(request)
+
+        cache_key = self.results_cache_key(get_request)
+        spot_ids = None
+        if cache_key is not None:
+            spot_ids = cache.get(cache_key)
+
+        if spot_ids is not None:
+            spots = SpotsInOrder(spot_ids)
+            if not self.is_unbounded(get_request):
+                spots = list(spots)
+            return spots
+
         spots = self.filter_on_request(
-            request.GET, chain, request.META, "spot"
+            get_request, chain, request.META, "spot"
         )
+        if cache_key is not None:
+            if isinstance(spots, SpotsInOrder):
+                spot_ids = spots.spot_ids
+            else:
+                spot_ids = [spot.pk for spot in spots]
+            cache.set(
+                cache_key,
+                spot_ids,
+                self.results_cache_timeout(get_request),
+            )
+        return spots
 
-        response = []
-        for spot in spots:
-            response.append(spot.json_data_structure())
+    def center(self, get_request):
+        """
+        Returns the (longitude, latitude) of a distance search's center
+        as floats, or None if the search doesn't have a valid one.
+        """
+        if "distance" not in get_request:
+            return None
+        try:
+            longitude = float(get_request["center_longitude"])
+            latitude = float(get_request["center_latitude"])
+        except (KeyError, ValueError):
+            return None
+        if not -90 <= latitude <= 90:
+            return None
+        return longitude, latitude
 
-        return JSONResponse(response)
+    def distances(self, spots, longitude, latitude):
+        """
+        Returns the distance in meters from the point to each of the
+        spots, in order, all in one call to pyproj. Spots without a
+        location are infinitely far away.
+        """
+        return self.location_distances(
+            [(spot.latitude, spot.longitude) for spot in spots],
+            longitude,
+            latitude,
+        )
+
+    def location_distances(self, locations, longitude, latitude):
+        """
+        distances(), for (latitude, longitude) pairs rather than spots.
+        """
+        located = [
+            i
+            for i, (lat, lon) in enumerate(locations)
+            if lat is not None and lon is not None
+        ]
+        dists = [float("inf")] * len(locations)
+        if located:
+            az12, az21, found = geod.inv(
+                [float(locations[i][1]) for i in located],
+                [float(locations[i][0]) for i in located],
+                [longitude] * len(located),
+                [latitude] * len(located),
+            )
+            for i, dist in zip(located, found):
+                dists[i] = dist
+        return dists
+
+    def nearest_in_database(
+        self, query, longitude, latitude, count, max_distance=None
+    ):
+        """
+        Returns the ids of up to count of the located spots in query,
+        nearest to the point first, for when the spatial index is turned
+        off. The database orders the spots by an equirectangular
+        approximation of their distance and returns twice count of them,
+        which are then put in order of their exact distance.
+        """
+        latitude = float(latitude)
+        scale = cos(radians(latitude))
+        north = F("latitude") - Value(
+            Decimal("%.8f" % latitude), output_field=DecimalField()
+        )
+        east = (
+            F("longitude")
+            - Value(
+                Decimal("%.8f" % float(longitude)),
+                output_field=DecimalField(),
+            )
+        ) * Value(Decimal("%.8f" % scale), output_field=DecimalField())
+
+        rows = (
+            query.filter(latitude__isnull=False, longitude__isnull=False)
+            .annotate(
+                _distance=ExpressionWrapper(
+                    north * north + east * east, output_field=FloatField()
+                )
+            )
+            .order_by("_distance")
+            .values_list("pk", "latitude", "longitude")[: count * 2]
+        )
+        rows = list(rows)
+        if not rows:
+            return []
+
+        az12, az21, dists = geod.inv(
+            [float(row[2]) for row in rows],
+            [float(row[1]) for row in rows],
+            [float(longitude)] * len(rows),
+            [latitude] * len(rows),
+        )
+        nearest = sorted(zip(dists, [row[0] for row in rows]))
+        return [
+            pk
+            for dist, pk in nearest[:count]
+            if max_distance is None or dist <= max_distance
+        ]
+
+    def add_distances(self, fragments, spots, center):
+        """
+        Adds each spot's distance_m from the center to its encoded JSON
+        fragment, rather than to the cached json_data_structure().
+        """
+        dists = self.distances(spots, *center)
+        return [
+            fragment[:-1] + b', "distance_m": %.1f}' % dist
+            if dist != float("inf")
+            else fragment
+            for fragment, dist in zip(fragments, dists)
+        ]
+
+    def is_unbounded(self, get_request):
+        """True if the search asks for every matching spot (limit=0)."""
+        try:
+            return int(get_request.get("limit", 20)) == 0
+        except ValueError:
+            return False
+
+    def results_cache_key(self, get_request):
+        """
+        Returns the cache key for the results of a search, or None if
+        search results shouldn't be cached. Searches that differ only in
+        the order of their parameters, or in their oauth_* parameters,
+        share a key. The key includes the catalog generation, so any
+        change to the catalog starts a fresh set of keys.
+
+        Search filters are expected to depend only on the parameters.
+        """
+        timeout = getattr(settings, "SPOTSEEKER_SEARCH_CACHE_TIMEOUT", 300)
+        if not timeout:
+            return None
+
+        generation = catalog.generation()
+        if generation is None:
+            return None
+
+        params = []
+        for key, values in get_request.lists():
+            if key.startswith("oauth_"):
+                continue
+            # The fuzzy_hours_start and _end lists are matched up by
+            # position, so their order counts.
+            if not key.startswith("fuzzy_hours_"):
+                values = sorted(values)
+            params.append((key, values))
+        params.sort()
+
+        digest = hashlib.sha1(json.dumps(params).encode("utf-8"))
+        return "spotseeker:search:%s:%s" % (generation, digest.hexdigest())
+
+    def results_cache_timeout(self, get_request):
+        """
+        How long to keep the results of a search. Results that depend
+        on the current time only last until the end of the minute.
+        """
+        timeout = getattr(settings, "SPOTSEEKER_SEARCH_CACHE_TIMEOUT", 300)
+        if get_request.get("open_now"):
+            today, now = self.get_datetime()
+            timeout = min(timeout, 60 - now.second)
+        return timeout
 
     def distance(self, spot, longitude, latitude):
-        g = Geod(ellps="clrk66")
-        az12, az21, dist = g.inv(
+        az12, az21, dist = geod.inv(
             spot.longitude, spot.latitude, longitude, latitude
         )
         return dist
@@ -84,12 +488,123 @@ class SearchView(RESTDispatch):
         matched_days = starting[: starting.index(until_day) + 1]
         return matched_days
 
-    def filter_on_request(self, get_request, chain, request_meta, api):
+    def hours_query(self, get_request):
+        """
+        Returns an HoursQuery for the open_now, open_at, open_until and
+        fuzzy_hours_* parameters of a search, and whether any of them
+        limits the search.
+        """
+        day_dict = {
+            "Sunday": "su",
+            "Monday": "m",
+            "Tuesday": "t",
+            "Wednesday": "w",
+            "Thursday": "th",
+            "Friday": "f",
+            "Saturday": "sa",
+        }
+        hours = HoursQuery()
+        has_valid_search_param = False
+
+        if "open_now" in get_request:
+            if get_request["open_now"]:
+                today, now = self.get_datetime()
+                hours.open_now(today, now)
+                has_valid_search_param = True
+        if "open_until" in get_request:
+            if get_request["open_until"] and get_request["open_at"]:
+                until_day, until_t = get_request["open_until"].split(",")
+                at_day, at_t = get_request["open_at"].split(",")
+                until_day = day_dict[until_day]
+                at_day = day_dict[at_day]
+
+                if until_day == at_day:
+                    if strptime(until_t, "%H:%M") >= strptime(
+                        at_t, "%H:%M"
+                    ):
+                        hours.open_between(until_day, at_t, until_t)
+                    else:
+                        days_to_test = [
+                            "su",
+                            "m",
+                            "t",
+                            "w",
+                            "th",
+                            "f",
+                            "sa",
+                        ]
+                        days_to_test.remove(at_day)
+
+                        hours.open_between(at_day, at_t, "23:59")
+                        hours.open_between(until_day, "00:00", until_t)
+
+                        for day in days_to_test:
+                            hours.open_between(day, "00:00", "23:59")
+                else:
+                    days_to_test = self.get_days_in_range(
+                        at_day, until_day
+                    )
+                    last_day = days_to_test.pop()
+                    days_to_test.reverse()
+                    first_day = days_to_test.pop()
+
+                    hours.open_between(first_day, at_t, "23:59")
+                    hours.open_between(last_day, "00:00", until_t)
+
+                    for day in days_to_test:
+                        hours.open_between(day, "00:00", "23:59")
+                has_valid_search_param = True
+        if "open_at" in get_request:
+            if get_request["open_at"]:
+                try:
+                    get_request["open_until"]
+                except MultiValueDictKeyError:
+                    day, time = get_request["open_at"].split(",")
+                    day = day_dict[day]
+                    hours.open_at(day, time)
+                    has_valid_search_param = True
+        if "fuzzy_hours_end" in get_request:
+            # fuzzy search requires a start and end
+            if "fuzzy_hours_start" not in get_request.keys():
+                raise RESTException(
+                    "fuzzy_hours_end requires "
+                    "fuzzy_hours_start to be specified",
+                    400,
+                )
+        if "fuzzy_hours_start" in get_request:
+            # fuzzy search requires a start and end
+            starts = get_request.getlist("fuzzy_hours_start")
+            ends = get_request.getlist("fuzzy_hours_end")
+            if "fuzzy_hours_end" not in get_request.keys() or not len(
+                starts
+            ) is len(ends):
+                raise RESTException(
+                    "fuzzy_hours_start requires "
+                    "fuzzy_hours_end to be specified",
+                    400,
+                )
+
+            ranges = []
+            for num, start in enumerate(starts):
+                start_day, start_time = start.split(",")
+                end_day, end_time = ends[num].split(",")
+                start_day = day_dict[start_day]
+                end_day = day_dict[end_day]
+                ranges.append((start_day, start_time, end_day, end_time))
+            hours.open_near(ranges)
+            has_valid_search_param = True
+
+        return hours, has_valid_search_param
+
+    def filter_on_request(
+        self, get_request, chain, request_meta, api, explain=NO_EXPLAIN
+    ):
         form = SpotSearchForm(get_request)
         has_valid_search_param = False
 
         if not form.is_valid():
             return []
+        explain.lap("form")
 
         if not get_request:
             # This is here to continue to allow the building api to request all
@@ -97,30 +612,46 @@ class SearchView(RESTDispatch):
             if api == "buildings":
                 return list(Spot.objects.all())
             return []
+        spots = SearchBackend().filter_on_request(
+            self, get_request, chain, request_meta, api, explain
+        )
+        if spots is not None:
+            return spots
+
         query = Spot.objects.all()
+        # Every index the search uses is checked against one version
+        version = CatalogVersion()
+
+        # The conditions declared by the search filters, to which the
+        # conditions on the extended info are added, so the extended
+        # info index answers all of them at once
+        predicates = chain.predicates(explain)
+        info = predicates.info
 
         # This is here to allow only the building api to continue to be
         # contacted with the key 'campus' instead of 'extended_info:campus'
         if api == "buildings" and "campus" in get_request.keys():
-            query = query.filter(
-                spotextendedinfo__key="campus",
-                spotextendedinfo__value=get_request["campus"],
-            )
+            info.has("campus", [get_request["campus"]])
             has_valid_search_param = True
 
-        day_dict = {
-            "Sunday": "su",
-            "Monday": "m",
-            "Tuesday": "t",
-            "Wednesday": "w",
-            "Thursday": "th",
-            "Friday": "f",
-            "Saturday": "sa",
-        }
-
-        # Q objects we need to chain together for the OR queries
+        # Q objects we need to chain together for the OR queries, and
+        # the spots the extended info index found for the OR queries on
+        # extended info
         or_q_obj = Q()
         or_qs = []
+        or_info = []
+
+        # The spots found by the indexes, intersected as they're used;
+        # the database only checks its own conditions against them
+        found = None
+
+        # Conditions on the available hours, answered by the hours index
+        hours, hours_limit_search = self.hours_query(get_request)
+        if hours_limit_search:
+            has_valid_search_param = True
+
+        # The ids found by a free text search, best match first
+        ranked = None
 
         # Exclude things that get special consideration here, otherwise add a
         # filter for the keys
@@ -143,199 +674,16 @@ class SearchView(RESTDispatch):
                 pass
             elif key == "limit":
                 pass
-            elif key == "open_now":
-                if get_request["open_now"]:
-                    today, now = self.get_datetime()
-                    # Check to see if the request was made in minute
-                    # gap before midnight during which no space is open,
-                    # based on the server.
-                    before_midnight = now.replace(
-                        hour=23, minute=58, second=59, microsecond=999999
-                    )
-                    right_before_midnight = now.replace(
-                        hour=23, minute=59, second=59, microsecond=999999
-                    )
-                    if before_midnight < now and now < right_before_midnight:
-                        # Makes it so that all spaces that are open
-                        # until midnight or overnight will be returned.
-                        now = now.replace(
-                            hour=23, minute=58, second=0, microsecond=0
-                        )
-                    query = query.filter(
-                        spotavailablehours__day__iexact=today,
-                        spotavailablehours__start_time__lt=now,
-                        spotavailablehours__end_time__gt=now,
+            elif key == "q":
+                if get_request["q"].strip():
+                    ranked = text_index.current(version()).search(
+                        get_request["q"]
                     )
+                    found = _narrow(found, SpotSet.of(ranked))
                     has_valid_search_param = True
-            elif key == "open_until":
-                if get_request["open_until"] and get_request["open_at"]:
-                    until_day, until_t = get_request["open_until"].split(",")
-                    at_day, at_t = get_request["open_at"].split(",")
-                    until_day = day_dict[until_day]
-                    at_day = day_dict[at_day]
-
-                    if until_day == at_day:
-                        if strptime(until_t, "%H:%M") >= strptime(
-                            at_t, "%H:%M"
-                        ):
-                            query = query.filter(
-                                spotavailablehours__day__iexact=until_day,
-                                spotavailablehours__start_time__lte=at_t,
-                                spotavailablehours__end_time__gte=until_t,
-                            )
-                        else:
-                            days_to_test = [
-                                "su",
-                                "m",
-                                "t",
-                                "w",
-                                "th",
-                                "f",
-                                "sa",
-                            ]
-                            days_to_test.remove(at_day)
-
-                            query = query.filter(
-                                spotavailablehours__day__iexact=at_day,
-                                spotavailablehours__start_time__lte=at_t,
-                                spotavailablehours__end_time__gte="23:59",
-                            )
-                            t1 = "00:00"
-                            query = query.filter(
-                                spotavailablehours__day__iexact=until_day,
-                                spotavailablehours__start_time__lte=t1,
-                                spotavailablehours__end_time__gte=until_t,
-                            )
-
-                            for day in days_to_test:
-                                t1 = "00:00"
-                                t2 = "23:59"
-                                query = query.filter(
-                                    spotavailablehours__day__iexact=day,
-                                    spotavailablehours__start_time__lte=t1,
-                                    spotavailablehours__end_time__gte=t2,
-                                )
-                    else:
-                        days_to_test = self.get_days_in_range(
-                            at_day, until_day
-                        )
-                        last_day = days_to_test.pop()
-                        days_to_test.reverse()
-                        first_day = days_to_test.pop()
-
-                        query = query.filter(
-                            spotavailablehours__day__iexact=first_day,
-                            spotavailablehours__start_time__lte=at_t,
-                            spotavailablehours__end_time__gte="23:59",
-                        )
-                        query = query.filter(
-                            spotavailablehours__day__iexact=last_day,
-                            spotavailablehours__start_time__lte="00:00",
-                            spotavailablehours__end_time__gte=until_t,
-                        )
-
-                        for day in days_to_test:
-                            early = "00:00"
-                            query = query.filter(
-                                spotavailablehours__day__iexact=day,
-                                spotavailablehours__start_time__lte=early,
-                                spotavailablehours__end_time__gte="23:59",
-                            )
-                    has_valid_search_param = True
-            elif key == "open_at":
-                if get_request["open_at"]:
-                    try:
-                        get_request["open_until"]
-                    except MultiValueDictKeyError:
-                        day, time = get_request["open_at"].split(",")
-                        day = day_dict[day]
-                        query = query.filter(
-                            spotavailablehours__day__iexact=day,
-                            spotavailablehours__start_time__lte=time,
-                            spotavailablehours__end_time__gt=time,
-                        )
-                        has_valid_search_param = True
-            elif key == "fuzzy_hours_end":
-                # fuzzy search requires a start and end
-                if "fuzzy_hours_start" not in get_request.keys():
-                    raise RESTException(
-                        "fuzzy_hours_end requires "
-                        "fuzzy_hours_start to be specified",
-                        400,
-                    )
-            elif key == "fuzzy_hours_start":
-                # fuzzy search requires a start and end
-                starts = get_request.getlist("fuzzy_hours_start")
-                ends = get_request.getlist("fuzzy_hours_end")
-                if "fuzzy_hours_end" not in get_request.keys() or not len(
-                    starts
-                ) is len(ends):
-                    raise RESTException(
-                        "fuzzy_hours_start requires "
-                        "fuzzy_hours_end to be specified",
-                        400,
-                    )
-
-                or_small_q_obj = Q()
-                for num, start in enumerate(starts):
-                    start_day, start_time = start.split(",")
-                    end_day, end_time = ends[num].split(",")
-                    start_day = day_dict[start_day]
-                    end_day = day_dict[end_day]
-
-                    start_range_query = Q(
-                        spotavailablehours__day__iexact=start_day,
-                        spotavailablehours__start_time__gte=start_time,
-                        spotavailablehours__start_time__lt=end_time,
-                    )
-                    end_range_query = Q(
-                        spotavailablehours__day__iexact=end_day,
-                        spotavailablehours__end_time__gt=start_time,
-                        spotavailablehours__end_time__lte=end_time,
-                    )
-                    span_range_query = Q(
-                        spotavailablehours__day__iexact=end_day,
-                        spotavailablehours__start_time__lte=start_time,
-                        spotavailablehours__end_time__gt=end_time,
-                    )
-                    span_midnight_pre_query = Q(
-                        spotavailablehours__day__iexact=start_day,
-                        spotavailablehours__start_time__gte=start_time,
-                        spotavailablehours__start_time__lte="23:59",
-                    )
-                    span_midnight_post_query = Q(
-                        spotavailablehours__day__iexact=end_day,
-                        spotavailablehours__end_time__lt=end_time,
-                        spotavailablehours__end_time__gte="00:00",
-                    )
-                    span_midnight_pre_midnight_end_query = Q(
-                        spotavailablehours__day__iexact=end_day,
-                        spotavailablehours__end_time__gte=start_time,
-                        spotavailablehours__end_time__lte="23:59",
-                    )
-                    span_midnight_next_morning_query = Q(
-                        spotavailablehours__day__iexact=end_day,
-                        spotavailablehours__start_time__lt=end_time,
-                        spotavailablehours__start_time__gte="00:00",
-                    )
-                    if start_day is not end_day:
-                        range_query = (
-                            start_range_query
-                            | end_range_query
-                            | span_midnight_pre_query
-                            | span_midnight_post_query
-                            | span_midnight_pre_midnight_end_query
-                            | span_midnight_next_morning_query
-                        )
-                    else:
-                        range_query = (
-                            start_range_query
-                            | end_range_query
-                            | span_range_query
-                        )
-                    or_small_q_obj |= range_query
-                query = query.filter(or_small_q_obj)
-                has_valid_search_param = True
+            elif key in HOURS_KEYS:
+                # See hours_query()
+                pass
             elif key == "capacity":
                 try:
                     limit = int(get_request["capacity"])
@@ -352,74 +700,71 @@ class SearchView(RESTDispatch):
                     pass
             elif key == "type":
                 type_values = get_request.getlist(key)
-                q_obj = Q()
-                type_qs = [Q(spottypes__name__exact=v) for v in type_values]
-                for type_q in type_qs:
-                    q_obj |= type_q
-                query = query.filter(q_obj).distinct()
+                query, type_q = _exists(
+                    query,
+                    Spot.spottypes.through.objects.filter(
+                        spot_id=OuterRef("pk"), spottype__name__in=type_values
+                    ),
+                )
+                query = query.filter(type_q)
                 has_valid_search_param = True
             elif key == "building_name":
                 building_names = get_request.getlist(key)
-                q_obj = Q()
-                type_qs = [Q(building_name__exact=v) for v in building_names]
-                for type_q in type_qs:
-                    q_obj |= type_q
-                query = query.filter(q_obj).distinct()
+                query = query.filter(building_name__in=building_names)
                 has_valid_search_param = True
             elif key.startswith("item:extended_info:"):
                 try:
-                    for value in get_request.getlist(key):
-                        or_qs.append(
-                            Q(
-                                item__itemextendedinfo__key=key[19:],
-                                item__itemextendedinfo__value=value,
-                            )
-                        )
+                    query, item_q = _exists(
+                        query,
+                        ItemExtendedInfo.objects.filter(
+                            item__spot_id=OuterRef("pk"),
+                            key=key[19:],
+                            value__in=get_request.getlist(key),
+                        ),
+                    )
+                    or_qs.append(item_q)
                     has_valid_search_param = True
                 except Exception as e:
                     pass
             elif key.startswith("item:"):
                 try:
-                    for value in get_request.getlist(key):
-                        if key[5:] == "id":
-                            or_qs.append(Q(item__id=value))
-                        elif key[5:] == "name":
-                            or_qs.append(Q(item__name=value))
-                        elif key[5:] == "category":
-                            or_qs.append(Q(item__item_category=value))
-                        elif key[5:] == "subcategory":
-                            or_qs.append(Q(item__item_subcategory=value))
+                    field = ITEM_FIELDS.get(key[5:])
+                    if field is not None:
+                        lookup = {"%s__in" % field: get_request.getlist(key)}
+                        query, item_q = _exists(
+                            query,
+                            Item.objects.filter(
+                                spot_id=OuterRef("pk"), **lookup
+                            ),
+                        )
+                        or_qs.append(item_q)
                     has_valid_search_param = True
                 except Exception as e:
                     pass
             elif key.startswith("extended_info:or_group"):
                 values = get_request.getlist(key)
-                or_small_q_obj = Q()
-                for value in values:
-                    or_small_q_obj |= Q(
-                        spotextendedinfo__key=value,
-                        spotextendedinfo__value="true",
-                    )
-                query = query.filter(or_small_q_obj)
+                info.has_any([(value, "true") for value in values])
                 has_valid_search_param = True
             elif key.startswith("extended_info:or"):
-                or_qs.append(
-                    Q(
-                        spotextendedinfo__key=key[17:],
-                        spotextendedinfo__value="true",
-                    )
-                )
+                or_query = ExtendedInfoQuery()
+                or_query.has(key[17:], ["true"])
+                info_index = extended_info_index.current(version())
+                or_info.append(info_index.matching_spots(or_query))
                 has_valid_search_param = True
             elif key.startswith("extended_info:"):
-                kwargs = {
-                    "spotextendedinfo__key": key[14:],
-                    "spotextendedinfo__value__in": get_request.getlist(key),
-                }
-                query = query.filter(**kwargs)
+                info.has(key[14:], get_request.getlist(key))
                 has_valid_search_param = True
             elif key == "id":
                 query = query.filter(id__in=get_request.getlist(key))
                 has_valid_search_param = True
+            elif key in SPOT_FIELDS:
+                # The same as the icontains filter below, without a scan
+                # of the whole table
+                containing = text_index.current(version()).containing(
+                    key, get_request[key]
+                )
+                found = _narrow(found, SpotSet.of(containing))
+                has_valid_search_param = True
             else:
                 try:
                     kwargs = {"%s__icontains" % key: get_request[key]}
@@ -429,18 +774,40 @@ class SearchView(RESTDispatch):
                     if not request_meta["SERVER_NAME"] == "testserver":
                         print("E: ", e, file=sys.stderr)
 
+        if info:
+            info_index = extended_info_index.current(version())
+            found = _narrow(found, info_index.matching_spots(info))
+        query = predicates.filter(query, version, info=False)
+
+        if hours:
+            matching = hours_index.current(version()).matching(hours)
+            found = _narrow(found, SpotSet.of(matching))
+
+        if or_info and not or_qs:
+            found = _narrow(found, SpotSet.union(or_info))
+        elif or_info:
+            or_qs.append(Q(pk__in=SpotSet.union(or_info).ids()))
         for or_q in or_qs:
             or_q_obj |= or_q
-        # This handles all of the OR queries on extended_info we've collected.
-        query = query.filter(or_q_obj).distinct()
+        # This handles all of the OR queries on extended_info and items
+        # we've collected. Each one is a subquery, so no spot comes back
+        # more than once.
+        query = query.filter(or_q_obj)
         # Always prefetch the related extended info
         query = query.prefetch_related("spotextendedinfo_set")
+        explain.lap("build_query")
 
-        query = chain.filter_query(query)
+        query = chain.filter_query(query, explain)
         if chain.has_valid_search_param:
             has_valid_search_param = True
 
+        if len(query.query.alias_map) > 1:
+            # A search filter, or a search key that follows a relation,
+            # joined another table, which can repeat a spot
+            query = query.distinct()
+
         limit = int(get_request.get("limit", 20))
+        indexed = getattr(settings, "SPOTSEEKER_SPATIAL_INDEX", True)
 
         if (
             "distance" in get_request
@@ -448,7 +815,7 @@ class SearchView(RESTDispatch):
             and "center_latitude" in get_request
         ):
             try:
-                g = Geod(ellps="clrk66")
+                g = geod
                 lon = get_request["center_longitude"]
                 lat = get_request["center_latitude"]
                 dist = get_request["distance"]
@@ -458,25 +825,63 @@ class SearchView(RESTDispatch):
                 bottom = g.fwd(lon, lat, 180, dist)
                 left = g.fwd(lon, lat, 270, dist)
                 # Get relevant lat or long from these points
-                top_limit = "%.8f" % top[1]
-                bottom_limit = "%.8f" % bottom[1]
-                left_limit = "%.8f" % left[0]
-                right_limit = "%.8f" % right[0]
-
-                distance_query = query.filter(
-                    longitude__gte=left_limit,
-                    longitude__lte=right_limit,
-                    latitude__gte=bottom_limit,
-                    latitude__lte=top_limit,
-                )
+                top_limit = float("%.8f" % top[1])
+                bottom_limit = float("%.8f" % bottom[1])
+                left_limit = float("%.8f" % left[0])
+                right_limit = float("%.8f" % right[0])
+
+                if indexed:
+                    # Only the spots in the grid cells around the center
+                    # are candidates, along with the other indexes
+                    within_box = spatial_index.current(version()).within_box(
+                        bottom_limit, top_limit, left_limit, right_limit
+                    )
+                    nearby = _narrow(found, SpotSet.of(within_box))
+                    distance_query = query
+                else:
+                    nearby = found
+                    distance_query = query.filter(
+                        latitude__gte=bottom_limit,
+                        latitude__lte=top_limit,
+                        longitude__gte=left_limit,
+                        longitude__lte=right_limit,
+                    )
                 has_valid_search_param = True
 
-                if distance_query or "expand_radius" not in get_request:
+                if "expand_radius" not in get_request or self.matching_ids(
+                    distance_query, nearby
+                ):
                     query = distance_query
+                    found = nearby
                 else:
-                    # If we're querying everything, let's make sure we only
-                    # return a limited number of spaces...
-                    limit = 10
+                    # Nothing in the box, so look further out for the
+                    # nearest spots that match, 10 unless there's a limit
+                    if "limit" not in get_request or not limit:
+                        limit = 10
+                    max_distance = getattr(
+                        settings, "SPOTSEEKER_SEARCH_MAX_DISTANCE", None
+                    )
+                    if indexed:
+                        index = spatial_index.current(version())
+                        nearest = index.nearest_matching(
+                            lon,
+                            lat,
+                            limit,
+                            lambda ids: self.matching_ids(
+                                query, _narrow(found, SpotSet.of(ids))
+                            ),
+                            max_distance,
+                        )
+                        nearest = [pk for pk, dist in nearest]
+                    else:
+                        nearest = self.nearest_in_database(
+                            _restricted(query, found),
+                            lon,
+                            lat,
+                            limit,
+                            max_distance,
+                        )
+                    found = SpotSet.of(nearest)
             except Exception as e:
                 if not request_meta["SERVER_NAME"] == "testserver":
                     print("E: ", e, file=sys.stderr)
@@ -497,6 +902,8 @@ class SearchView(RESTDispatch):
                     "Must specify latitude, longitude, and distance", 400
                 )
 
+        explain.lap("distance")
+
         # Only do this if spot api because buildings api
         # is able to not pass any valid filters
         if not has_valid_search_param and api == "spot":
@@ -506,23 +913,158 @@ class SearchView(RESTDispatch):
 
         # Do this when spot api because building api is not required
         # to pass these parameters
-        if limit > 0 and limit < len(query) and api == "spot":
-            try:
-                lat = get_request["center_latitude"]
-                lon = get_request["center_longitude"]
-            except KeyError:
-                raise RESTException(
-                    "missing required parameters for this type of search", 400
+        center = self.center(get_request)
+        if limit > 0 and api == "spot" and center is not None and not indexed:
+            # The database puts the spots in order of distance, and only
+            # the nearest are loaded
+            nearest = self.nearest_in_database(
+                _restricted(query, found), *center, count=limit
+            )
+            query = Spot.objects.filter(pk__in=nearest).prefetch_related(
+                "spotextendedinfo_set"
+            )
+            explain.lap("limit")
+        elif limit > 0 and api == "spot":
+            # Only the ids are needed to decide which spots to return;
+            # the spots themselves are loaded once the limit is applied.
+            spot_ids = self.matching_ids(query, found)
+            if limit < len(spot_ids) and ranked is not None and not (
+                "center_latitude" in get_request
+                and "center_longitude" in get_request
+            ):
+                # Without a location, the best text matches are the ones
+                # to return
+                found = set(spot_ids)
+                best = [pk for pk in ranked if pk in found][:limit]
+                query = Spot.objects.filter(pk__in=best).prefetch_related(
+                    "spotextendedinfo_set"
                 )
+            elif limit < len(spot_ids):
+                if center is None:
+                    # Without a valid center, there's no telling which
+                    # spots to return; with one, the spatial index is on,
+                    # or the database would have found the nearest above
+                    raise RESTException(
+                        "missing required parameters for this type of search",
+                        400,
+                    )
 
-            def sortfunc(spot):
-                return self.distance(spot, lon, lat)
-
-            sorted_list = sorted(query, key=sortfunc)
-            query = sorted_list[:limit]
+                nearest = spatial_index.current(version()).nearest(
+                    center[0], center[1], spot_ids, limit
+                )
+                query = Spot.objects.filter(pk__in=nearest).prefetch_related(
+                    "spotextendedinfo_set"
+                )
+            else:
+                query = Spot.objects.filter(pk__in=spot_ids).prefetch_related(
+                    "spotextendedinfo_set"
+                )
+            explain.lap("limit")
+        elif api == "spot" and not chain.filters_results():
+            spot_ids = self.matching_ids(query, found)
+            explain.lap("sql")
+            return self.spots_in_order(
+                spot_ids, get_request, ranked, version(), explain
+            )
+        else:
+            query = _restricted(query, found)
 
         spots = set(query)
-        spots = chain.filter_results(spots)
+        explain.lap("sql")
+        return self.order_results(spots, get_request, chain, ranked, explain)
+
+    def matching_ids(self, query, found):
+        """
+        Returns the ids of the spots in query that are also in found, a
+        SpotSet of what the indexes found, or None if no index narrowed
+        the search, in order. The database isn't asked at all if the
+        query has no conditions of its own, and is only given found's
+        ids if there are no more than IN_LIST_LIMIT of them; otherwise
+        the ids it finds are intersected with found here.
+        """
+        if found is not None and not query.query.where.children:
+            return found.ids()
+        if found is not None and len(found) <= IN_LIST_LIMIT:
+            query = query.filter(pk__in=found.ids())
+            found = None
+        spot_ids = sorted(query.values_list("pk", flat=True))
+        if found is not None:
+            spot_ids = found.filter(spot_ids)
+        return spot_ids
+
+    def spots_in_order(
+        self, spot_ids, get_request, ranked, version, explain=NO_EXPLAIN
+    ):
+        """
+        Returns the spots with the ids an unbounded search found as
+        SpotsInOrder, in the order order_results() would put them in.
+        The spots themselves are loaded a chunk at a time as they're
+        sent.
+        """
+        center = self.center(get_request)
+        if ranked is not None:
+            position = dict((pk, i) for i, pk in enumerate(ranked))
+            spot_ids = sorted(
+                spot_ids, key=lambda pk: position.get(pk, len(ranked))
+            )
+            explain.lap("rank")
+        elif center is not None:
+            dists = self.spot_distances(spot_ids, center, version)
+            spot_ids = sorted(
+                spot_ids, key=lambda pk: (dists.get(pk, float("inf")), pk)
+            )
+            explain.lap("order")
+        return SpotsInOrder(spot_ids)
+
+    def spot_distances(self, spot_ids, center, version):
+        """
+        Returns a dict of spot id to the distance in meters from the
+        center, a (longitude, latitude) pair, for spot_ids; spots without
+        a location may be left out. The database is only asked for their
+        locations if the spatial index is turned off, a chunk at a time.
+        """
+        if getattr(settings, "SPOTSEEKER_SPATIAL_INDEX", True):
+            index = spatial_index.current(version)
+            return index.distances(center[0], center[1], spot_ids)
+
+        dists = {}
+        for chunk in SpotsInOrder(spot_ids).chunks():
+            rows = Spot.objects.filter(pk__in=chunk).values_list(
+                "pk", "latitude", "longitude"
+            )
+            rows = list(rows)
+            found = self.location_distances(
+                [(lat, lon) for pk, lat, lon in rows], *center
+            )
+            dists.update(zip([row[0] for row in rows], found))
+        return dists
+
+    def order_results(
+        self, spots, get_request, chain, ranked, explain=NO_EXPLAIN
+    ):
+        """
+        Runs the search filters' filter_results() over the spots a
+        search found, and returns them best text match first if ranked
+        (the ids a q= search found, in order) isn't None, or else
+        nearest first if the search has a center.
+        """
+        spots = chain.filter_results(spots, explain)
+
+        center = self.center(get_request)
+        if ranked is not None:
+            position = dict((pk, i) for i, pk in enumerate(ranked))
+            spots = sorted(
+                spots, key=lambda spot: position.get(spot.pk, len(ranked))
+            )
+            explain.lap("rank")
+        elif center is not None:
+            spots = list(spots)
+            dists = self.distances(spots, *center)
+            order = sorted(
+                range(len(spots)), key=lambda i: (dists[i], spots[i].pk)
+            )
+            spots = [spots[i] for i in order]
+            explain.lap("order")
 
         return spots
 
@@ -14,6 +14,7 @@ from spotseeker_server.views.rest_dispatch import (
     RESTDispatch,
     RESTException,
     RESTFormInvalidError,
+    HeadResponse,
     JSONResponse,
 )
 from spotseeker_server.forms.spot import SpotForm, SpotExtendedInfoForm
@@ -22,7 +23,9 @@ from spotseeker_server.default_forms.item import (
     DefaultItemExtendedInfoForm as ItemExtendedInfoForm,
 )
 from spotseeker_server.models import *
+from spotseeker_server.models.spot import deferred_refresh
 from django.http import HttpResponse
+from django.utils.http import http_date
 from spotseeker_server.require_auth import *
 from django.db import transaction
 import simplejson as json
@@ -92,8 +95,7 @@ def _save_available_hours(sender, **kwargs):
     if partial_update and available_hours is None:
         return
 
-    SpotAvailableHours.objects.filter(spot=spot).delete()
-
+    windows = []
     if available_hours is not None:
         for day in SpotAvailableHours.DAY_CHOICES:
             if not day[1] in available_hours:
@@ -101,12 +103,25 @@ def _save_available_hours(sender, **kwargs):
 
             day_hours = available_hours[day[1]]
             for window in day_hours:
-                SpotAvailableHours.objects.create(
-                    spot=spot,
-                    day=day[0],
-                    start_time=window[0],
-                    end_time=window[1],
-                )
+                windows.append((day[0], window[0], window[1]))
+
+    old_hours = SpotAvailableHours.objects.filter(spot=spot)
+    old_windows = [
+        (hours.day,) + tuple(hours.json_data_structure())
+        for hours in old_hours
+    ]
+    if sorted(old_windows, key=str) == sorted(windows, key=str):
+        # Rewriting the same hours would only churn the spot's etag
+        return
+
+    old_hours.delete()
+    for day, start_time, end_time in windows:
+        SpotAvailableHours.objects.create(
+            spot=spot,
+            day=day,
+            start_time=start_time,
+            end_time=end_time,
+        )
 
 
 @django.dispatch.receiver(
@@ -161,7 +176,7 @@ def _save_extended_info(sender, **kwargs):
 
 class SpotView(RESTDispatch):
     """Performs actions on a Spot at /api/v1/spot/<spot id>.
-    GET returns 200 with Spot details.
+    GET returns 200 with Spot details, or 304 if the client has them.
     POST to /api/v1/spot with valid JSON returns 200 and creates a new Spot.
     PUT returns 200 and updates the Spot information.
     DELETE returns 200 and deletes the Spot.
@@ -170,8 +185,17 @@ class SpotView(RESTDispatch):
     @app_auth_required
     def GET(self, request, spot_id):
         spot = Spot.get_with_external(spot_id)
-        response = JSONResponse(spot.json_data_structure())
+        last_modified = spot.last_modified.timestamp()
+        response = self.not_modified(request, spot.etag, last_modified)
+        if response is not None:
+            return response
+
+        if request.method == "HEAD":
+            response = HeadResponse(content_type="application/json")
+        else:
+            response = JSONResponse(spot.json_data_structure())
         response["ETag"] = spot.etag
+        response["Last-Modified"] = http_date(last_modified)
         return response
 
     @user_auth_required
@@ -256,24 +280,28 @@ class SpotView(RESTDispatch):
         if not form.is_valid():
             raise RESTFormInvalidError(form)
 
-        spot = form.save()
-
-        spot_post_save.send(
-            sender=SpotForm.implementation(),
-            request=request,
-            spot=spot,
-            partial_update=partial_update,
-            stash=stash,
-        )
+        # The spot is brought up to date once everything's written,
+        # rather than after each of its types, hours and items
+        with deferred_refresh():
+            spot = form.save()
+
+            spot_post_save.send(
+                sender=SpotForm.implementation(),
+                request=request,
+                spot=spot,
+                partial_update=partial_update,
+                stash=stash,
+            )
 
-        # gets the current etag
-        spot = Spot.get_with_external(spot.pk)
+            # gets the current etag
+            spot = Spot.get_with_external(spot.pk)
+            spot_json = spot.save_document()
 
         if is_new:
             response = HttpResponse(status=201)
             response["Location"] = spot.rest_url()
         else:
-            response = JSONResponse(spot.json_data_structure(), status=200)
+            response = JSONResponse(spot_json, status=200)
         response["ETag"] = spot.etag
 
         spot_post_build.send(
@@ -0,0 +1,98 @@
+# Copyright 2026 UW-IT, University of Washington
+# SPDX-License-Identifier: Apache-2.0
+
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from spotseeker_server.models import Spot, SpotTombstone
+from spotseeker_server.require_auth import app_auth_required
+from spotseeker_server.views.rest_dispatch import (
+    HeadResponse,
+    JSONStreamResponse,
+    RESTDispatch,
+    RESTException,
+    collection_etag,
+)
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def sync_token(moment):
+    """Returns the token for a sync made at moment."""
+    if timezone.is_naive(moment):
+        moment = timezone.make_aware(moment)
+    return str((moment - EPOCH) // timedelta(microseconds=1))
+
+
+def token_time(token):
+    """Returns the moment of the sync a token came from."""
+    try:
+        moment = EPOCH + timedelta(microseconds=int(token))
+    except (ValueError, OverflowError):
+        raise RESTException("Invalid since token", 400)
+    if not settings.USE_TZ:
+        moment = timezone.make_naive(moment)
+    return moment
+
+
+class SpotChangesView(RESTDispatch):
+    """The changes to the catalog since a client last synced, at
+    /api/v1/spot/changes?since=<token>.
+    GET returns 200 with the spots modified since the token was given
+    out, the ids of the spots deleted since then, and the token to
+    send next time. Without a token, it returns every spot. Clients
+    should drop the deleted spots before storing the modified ones.
+    A token older than the deleted spots are kept for gets 410, and
+    the client has to sync everything again. The ETag covers the
+    changes but not the token, so a 304 leaves the client with the
+    token it has.
+    """
+
+    @app_auth_required
+    def GET(self, request):
+        token = sync_token(timezone.now())
+        spots = Spot.objects.order_by("pk")
+        deleted = []
+
+        since = request.GET.get("since")
+        if since:
+            # A write that was still in its transaction during the last
+            # sync can have been stamped before it; send it again rather
+            # than miss it
+            overlap = getattr(settings, "SPOTSEEKER_CHANGES_OVERLAP", 60)
+            since = token_time(since) - timedelta(seconds=overlap)
+            kept_since = SpotTombstone.kept_since()
+            if kept_since is not None and since < kept_since:
+                raise RESTException(
+                    "Sync token expired; sync again without one", 410
+                )
+            spots = spots.filter(last_modified__gte=since)
+            deleted = sorted(
+                set(
+                    SpotTombstone.objects.filter(
+                        deleted__gte=since
+                    ).values_list("spot_id", flat=True)
+                )
+            )
+
+        # The changes are the same, but for the token, as long as the
+        # spots' etags and the deleted ids are
+        etag = collection_etag(
+            spots.values_list("etag", flat=True),
+            *["deleted %s" % spot_id for spot_id in deleted]
+        )
+        response = self.not_modified(request, etag)
+        if response is not None:
+            return response
+        if request.method == "HEAD":
+            response = HeadResponse(content_type="application/json")
+        else:
+            # The spots are serialized a chunk at a time as they're sent
+            response = JSONStreamResponse(
+                Spot.stream_json_bytes(spots.iterator()),
+                envelope=({"token": token, "deleted": deleted}, "spots"),
+            )
+        response["ETag"] = etag
+        return response
@@ -13,7 +13,12 @@ try:
 except ModuleNotFoundError:
     from io import BytesIO as IOStream
 
-from spotseeker_server.views.rest_dispatch import RESTDispatch, RESTException
+from spotseeker_server.views.rest_dispatch import (
+    RESTDispatch,
+    RESTException,
+    HeadResponse,
+    collection_etag,
+)
 from spotseeker_server.models import SpotImage, Spot
 from django.http import HttpResponse
 from django.utils.http import http_date
@@ -80,22 +85,40 @@ class ThumbnailView(RESTDispatch):
         if thumb_height <= 0 or thumb_width <= 0:
             raise RESTException("Bad image constraints", 400)
 
-        image = img.image
-        im = Image.open(image.file)
-
-        if constrain:
-            im.thumbnail((thumb_width, thumb_height), resample=Image.LANCZOS)
-            thumb = im
+        # A thumbnail only changes along with its image
+        etag = collection_etag(
+            [img.etag], constrain, thumb_width, thumb_height
+        )
+        last_modified = img.modification_date.timestamp()
+        response = self.not_modified(request, etag, last_modified)
+        if response is not None:
+            return response
+
+        if request.method == "HEAD":
+            response = HeadResponse(content_type=img.content_type)
         else:
-            thumb = im.resize(
-                (thumb_width, thumb_height), resample=Image.LANCZOS
-            )
+            image = img.image
+            im = Image.open(image.file)
+
+            if constrain:
+                im.thumbnail(
+                    (thumb_width, thumb_height), resample=Image.LANCZOS
+                )
+                thumb = im
+            else:
+                thumb = im.resize(
+                    (thumb_width, thumb_height), resample=Image.LANCZOS
+                )
 
-        tmp = IOStream()
-        thumb.save(tmp, im.format, quality=95)
-        tmp.seek(0)
+            tmp = IOStream()
+            thumb.save(tmp, im.format, quality=95)
+            tmp.seek(0)
 
-        response = HttpResponse(tmp.getvalue(), content_type=img.content_type)
+            response = HttpResponse(
+                tmp.getvalue(), content_type=img.content_type
+            )
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
         # 7 day timeout?
         response["Expires"] = http_date(time.time() + 60 * 60 * 24 * 7)
         return response